@@ -76,7 +76,7 @@ async def main() -> None:
     print(f"  Converted: {len(markdown_stats)}/{len(successful_urls)}")
 
     # Build combined output: audit data + markdown stats
-    audit_data = json.loads(report.model_dump_json())
+    audit_data = report.model_dump(mode="json")
     audit_data["markdown_stats"] = markdown_stats
 
     out_path = Path(__file__).parent / "data.json"
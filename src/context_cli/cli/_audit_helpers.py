@@ -3,15 +3,125 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import os
+from collections.abc import Coroutine
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NoReturn, TypeVar
 
+from pydantic import BaseModel
 from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 
+from context_cli.core.batch import parse_url_file, run_batch_audit
+from context_cli.core.ci.baseline import compare_baseline, load_baseline, save_baseline
+from context_cli.core.ci.thresholds import check_thresholds, has_blocked_bots
 from context_cli.core.models import (
     AuditReport,
     OutputFormat,
+    PillarThresholds,
     SiteAuditReport,
+    ThresholdFailure,
 )
+from context_cli.core.page_cache import PageCache
+from context_cli.core.webhook import build_webhook_payload, send_webhook
+from context_cli.formatters.ci_summary import format_ci_summary
+from context_cli.formatters.csv import format_batch_report_csv
+from context_cli.formatters.markdown import format_batch_report_md
+from context_cli.formatters.rich_output import render_batch_rich
+
+_T = TypeVar("_T")
+
+# orjson (the [fast] extra) encodes large site and batch reports somewhat faster
+# than pydantic's indented serializer; the output text is identical.
+try:
+    import orjson
+
+    def _dump_json(model: BaseModel) -> str:
+        return orjson.dumps(model.model_dump(mode="json"), option=orjson.OPT_INDENT_2).decode()
+except ImportError:  # pragma: no cover — exercised only without the [fast] extra
+
+    def _dump_json(model: BaseModel) -> str:
+        return model.model_dump_json(indent=2)
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel the tasks still pending on *loop* and wait for them to finish.
+
+    Mirrors what ``asyncio.run`` does on exit, so nothing a run left behind
+    (e.g. a shielded probe of a timed-out audit) resumes in the next run.
+    """
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            loop.call_exception_handler({
+                "message": "unhandled exception during lint shutdown",
+                "exception": task.exception(),
+                "task": task,
+            })
+
+
+class _SharedLoop:
+    """Event loop reused by every async step of a lint invocation.
+
+    The audit, webhook delivery and batch run would otherwise each pay for a
+    fresh loop (selector, default executor) via ``asyncio.run``. Like
+    ``asyncio.run``, each run cancels whatever tasks it leaves pending.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run *coro* to completion on the shared loop."""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        try:
+            return self._loop.run_until_complete(coro)
+        finally:
+            _cancel_all_tasks(self._loop)
+
+    def close(self) -> None:
+        """Cancel leftover tasks, shut down async generators and executor, then close."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+
+
+_shared_loop = _SharedLoop()
+atexit.register(_shared_loop.close)
+
+
+def _run_async(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run *coro* on the lint command's shared event loop."""
+    return _shared_loop.run(coro)
+
+
+def _print_json(model: BaseModel, console: Console) -> None:
+    """Write *model* as indented JSON straight to the console's output file.
+
+    Rich's markup parsing, highlighting and line wrapping are skipped: they
+    cost time on large reports and could re-wrap long values mid-string.
+    """
+    console.file.write(_dump_json(model) + "\n")
+
+
+@lru_cache(maxsize=32)
+def _parse_bots(spec: str) -> tuple[str, ...]:
+    """Split a comma-separated ``--bots`` value into stripped bot names."""
+    return tuple(b.strip() for b in spec.split(","))
 
 
 def _save_to_history(
@@ -50,11 +160,9 @@ def _send_webhook(
     console: Console,
 ) -> None:
     """Send audit results to a webhook URL (best-effort, never crashes)."""
-    from context_cli.core.webhook import build_webhook_payload, send_webhook
-
     try:
         payload = build_webhook_payload(report)
-        success = asyncio.run(send_webhook(webhook_url, payload))
+        success = _run_async(send_webhook(webhook_url, payload))
         if success:
             console.print("[green]Webhook delivered successfully.[/green]")
         else:
@@ -69,10 +177,6 @@ def _handle_save_baseline(
     report: AuditReport, path_str: str, *, console: Console,
 ) -> None:
     """Save audit scores as a baseline JSON file."""
-    from pathlib import Path
-
-    from context_cli.core.ci.baseline import save_baseline
-
     try:
         save_baseline(report, Path(path_str))
         console.print(f"[green]Baseline saved to:[/green] {path_str}")
@@ -87,10 +191,6 @@ def _handle_baseline_compare(
     con: Console,
 ) -> None:
     """Compare audit against a saved baseline and exit 1 on regression."""
-    from pathlib import Path
-
-    from context_cli.core.ci.baseline import compare_baseline, load_baseline
-
     try:
         baseline = load_baseline(Path(path_str))
     except FileNotFoundError:
@@ -119,50 +219,41 @@ def _handle_baseline_compare(
 
 def _check_pillar_thresholds(
     report: AuditReport | SiteAuditReport,
-    robots_min: float | None,
-    schema_min: float | None,
-    content_min: float | None,
-    llms_min: float | None,
-    overall_min: float | None,
+    thresholds: PillarThresholds,
     *,
     console: Console,
-    max_context_waste: float | None = None,
-    require_llms_txt: bool = False,
-    require_bot_access: bool = False,
 ) -> None:
     """Check per-pillar thresholds and exit 1 if any fail."""
-    has_any = any(
-        v is not None
-        for v in (
-            robots_min, schema_min, content_min, llms_min,
-            overall_min, max_context_waste,
-        )
-    ) or require_llms_txt or require_bot_access
-    if not has_any:
-        return
-
-    from context_cli.core.ci.thresholds import check_thresholds
-    from context_cli.core.models import PillarThresholds
-
-    thresholds = PillarThresholds(
-        robots_min=robots_min,
-        schema_min=schema_min,
-        content_min=content_min,
-        llms_min=llms_min,
-        overall_min=overall_min,
-        max_context_waste=max_context_waste,
-        require_llms_txt=require_llms_txt,
-        require_bot_access=require_bot_access,
-    )
     result = check_thresholds(report, thresholds)
     if not result.passed:
-        console.print("\n[bold red]Pillar threshold failures:[/bold red]")
-        for failure in result.failures:
-            console.print(
-                f"  [red]FAIL[/red] {failure.pillar}: "
-                f"{failure.actual:.1f} < {failure.minimum:.1f} (minimum)"
-            )
-        raise SystemExit(1)
+        _fail_thresholds(result.failures, console)
+
+
+def _check_overall_min(
+    report: AuditReport | SiteAuditReport,
+    overall_min: float,
+    *,
+    console: Console,
+) -> None:
+    """Fast path for ``--overall-min`` alone: one comparison, same failure output."""
+    if report.overall_score < overall_min:
+        _fail_thresholds(
+            [ThresholdFailure(
+                pillar="overall", actual=report.overall_score, minimum=overall_min,
+            )],
+            console,
+        )
+
+
+def _fail_thresholds(failures: list[ThresholdFailure], console: Console) -> NoReturn:
+    """Print threshold failures and exit 1."""
+    console.print("\n[bold red]Pillar threshold failures:[/bold red]")
+    for failure in failures:
+        console.print(
+            f"  [red]FAIL[/red] {failure.pillar}: "
+            f"{failure.actual:.1f} < {failure.minimum:.1f} (minimum)"
+        )
+    raise SystemExit(1)
 
 
 def _check_exit_conditions(
@@ -171,9 +262,8 @@ def _check_exit_conditions(
     fail_on_blocked_bots: bool,
 ) -> None:
     """Check CI exit conditions and raise SystemExit if breached."""
-    if fail_on_blocked_bots and report.robots.found:
-        if any(not b.allowed for b in report.robots.bots):
-            raise SystemExit(2)
+    if fail_on_blocked_bots and has_blocked_bots(report.robots):
+        raise SystemExit(2)
     if fail_under is not None and report.overall_score < fail_under:
         raise SystemExit(1)
 
@@ -182,15 +272,22 @@ def _write_github_step_summary(
     report: AuditReport | SiteAuditReport,
     fail_under: float | None,
 ) -> None:
-    """Write CI summary to $GITHUB_STEP_SUMMARY if in GitHub Actions."""
+    """Write CI summary to $GITHUB_STEP_SUMMARY if in GitHub Actions.
+
+    The summary is appended with one unbuffered ``O_APPEND`` write, so it
+    lands as a single block even if other steps append to the same file.
+    """
     summary_path = os.environ.get("GITHUB_STEP_SUMMARY")
     if not summary_path:
         return
-    from context_cli.formatters.ci_summary import format_ci_summary
-
-    md = format_ci_summary(report, fail_under=fail_under)
-    with open(summary_path, "a") as f:
-        f.write(md)
+    data = format_ci_summary(report, fail_under=fail_under).encode("utf-8")
+    fd = os.open(summary_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def _audit_quiet(
@@ -202,26 +299,28 @@ def _audit_quiet(
     timeout: int = 15,
     *,
     bots: list[str] | None = None,
+    page_cache: PageCache | None = None,
 ) -> None:
     """Run audit silently \u2014 exit based on threshold and bot access."""
     import context_cli.cli.audit as _audit_mod
 
     report: AuditReport | SiteAuditReport
     if single:
-        report = asyncio.run(
-            _audit_mod.audit_url(url, timeout=timeout, bots=bots),
+        report = _run_async(
+            _audit_mod.audit_url(
+                url, timeout=timeout, bots=bots, page_cache=page_cache,
+            ),
         )
     else:
-        report = asyncio.run(
+        report = _run_async(
             _audit_mod.audit_site(
                 url, max_pages=max_pages, timeout=timeout, bots=bots,
+                page_cache=page_cache,
             )
         )
 
-    if fail_on_blocked_bots and report.robots.found:
-        if any(not b.allowed for b in report.robots.bots):
-            raise SystemExit(2)
-    raise SystemExit(0 if report.overall_score >= threshold else 1)
+    _check_exit_conditions(report, threshold, fail_on_blocked_bots)
+    raise SystemExit(0)
 
 
 def _run_batch_mode(
@@ -233,11 +332,10 @@ def _run_batch_mode(
     concurrency: int,
     *,
     bots: list[str] | None = None,
+    page_cache: PageCache | None = None,
     console: Console,
 ) -> None:
     """Execute batch audit from a URL file and render results."""
-    from context_cli.core.batch import parse_url_file, run_batch_audit
-
     try:
         urls = parse_url_file(file)
     except FileNotFoundError:
@@ -248,28 +346,35 @@ def _run_batch_mode(
         console.print("[yellow]Warning:[/yellow] No URLs found in file.")
         return
 
-    with console.status(f"Running batch audit on {len(urls)} URLs..."):
-        batch_report = asyncio.run(
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task_id = progress.add_task("Running batch audit...", total=len(urls))
+
+        def on_complete(url: str) -> None:
+            progress.update(task_id, description=f"Finished {url}", advance=1)
+
+        batch_report = _run_async(
             run_batch_audit(
                 urls, single=single, max_pages=max_pages,
                 timeout=timeout, concurrency=concurrency, bots=bots,
+                page_cache=page_cache, on_complete=on_complete,
             )
         )
 
     if format == OutputFormat.json:
-        console.print(batch_report.model_dump_json(indent=2))
+        _print_json(batch_report, console)
         return
     if format == OutputFormat.csv:
-        from context_cli.formatters.csv import format_batch_report_csv
-
         console.print(format_batch_report_csv(batch_report), end="")
         return
     if format == OutputFormat.markdown:
-        from context_cli.formatters.markdown import format_batch_report_md
-
         console.print(format_batch_report_md(batch_report), end="")
         return
 
-    from context_cli.formatters.rich_output import render_batch_rich
-
     render_batch_rich(batch_report, console)
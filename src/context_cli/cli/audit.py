@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections.abc import Callable
+from operator import attrgetter
 
 import typer
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
-from rich.text import Text
 
 from context_cli.cli._audit_helpers import (
     _audit_quiet,
     _check_exit_conditions,
+    _check_overall_min,
     _check_pillar_thresholds,
     _handle_baseline_compare,
     _handle_save_baseline,
+    _parse_bots,
+    _print_json,
+    _run_async,
     _run_batch_mode,
     _save_to_history,
     _send_webhook,
@@ -27,8 +31,10 @@ from context_cli.core.history import HistoryDB  # noqa: F401 — re-export for t
 from context_cli.core.models import (
     AuditReport,
     OutputFormat,
+    PillarThresholds,
     SiteAuditReport,
 )
+from context_cli.core.page_cache import PageCache
 from context_cli.core.regression import (
     detect_regression,  # noqa: F401 — re-export for test patching
 )
@@ -44,16 +50,11 @@ from context_cli.formatters.verbose import (
     render_verbose_single,
     render_verbose_site,
 )
-from context_cli.formatters.verbose_panels import score_color as _score_color_impl
+from context_cli.formatters.verbose_panels import score_color as _score_color
 
 console = Console()
 
 
-def _score_color(score: float, pillar: str) -> Text:
-    """Return a Rich Text with the score colored by threshold."""
-    return _score_color_impl(score, pillar)
-
-
 def register(app: typer.Typer) -> None:
     """Register the lint command onto the Typer app."""
 
@@ -153,6 +154,11 @@ def register(app: typer.Typer) -> None:
             False, "--require-bot-access",
             help="Fail if any AI bot is blocked",
         ),
+        no_cache: bool = typer.Option(
+            False, "--no-cache",
+            help="Re-analyze every page instead of reusing cached results "
+            "for unchanged content",
+        ),
     ) -> None:
         """Run a Context Lint on a URL and display the results."""
         # Load config file defaults
@@ -180,19 +186,16 @@ def register(app: typer.Typer) -> None:
                 pass
 
         # Parse --bots into a list (CLI overrides config)
-        if bots:
-            bots_list: list[str] | None = [b.strip() for b in bots.split(",")]
-        elif cfg.bots:
-            bots_list = cfg.bots
-        else:
-            bots_list = None
+        bots_list = list(_parse_bots(bots)) if bots else (cfg.bots or None)
+
+        page_cache = None if no_cache else PageCache()
 
         # Batch mode: --file flag
         if file:
             _run_batch_mode(
                 file, format, effective_single, effective_max_pages,
                 effective_timeout, concurrency,
-                bots=bots_list, console=console,
+                bots=bots_list, page_cache=page_cache, console=console,
             )
             return
 
@@ -210,12 +213,15 @@ def register(app: typer.Typer) -> None:
             _audit_quiet(
                 url, effective_single, effective_max_pages, threshold_val,
                 fail_on_blocked_bots, effective_timeout, bots=bots_list,
+                page_cache=page_cache,
             )
             return  # pragma: no cover — _audit_quiet always raises SystemExit
 
         # Normal flow
         report = _run_audit(
-            url, effective_single, effective_max_pages, effective_timeout, bots=bots_list,
+            url, effective_single, effective_max_pages, effective_timeout,
+            bots=bots_list, page_cache=page_cache,
+            show_progress=console.is_terminal and format not in _MACHINE_FORMATS,
         )
         _render_output(report, format, effective_verbose, effective_single)
 
@@ -242,19 +248,32 @@ def register(app: typer.Typer) -> None:
 
         _write_github_step_summary(report, fail_under)
 
-        # Per-pillar threshold checking
-        _check_pillar_thresholds(
-            report, robots_min, schema_min, content_min, llms_min, overall_min,
-            console=console,
-            max_context_waste=max_context_waste,
-            require_llms_txt=require_llms_txt,
-            require_bot_access=require_bot_access,
-        )
+        # Per-pillar threshold checking (skipped entirely when no CI gate is set;
+        # --overall-min on its own is a single comparison)
+        pillar_gates = (robots_min, schema_min, content_min, llms_min, max_context_waste)
+        if require_llms_txt or require_bot_access or any(v is not None for v in pillar_gates):
+            thresholds = PillarThresholds(
+                robots_min=robots_min,
+                schema_min=schema_min,
+                content_min=content_min,
+                llms_min=llms_min,
+                overall_min=overall_min,
+                max_context_waste=max_context_waste,
+                require_llms_txt=require_llms_txt,
+                require_bot_access=require_bot_access,
+            )
+            _check_pillar_thresholds(report, thresholds, console=console)
+        elif overall_min is not None:
+            _check_overall_min(report, overall_min, console=console)
 
         if fail_under is not None or fail_on_blocked_bots:
             _check_exit_conditions(report, fail_under, fail_on_blocked_bots)
 
 
+# Output formats meant for other programs: progress rendering would only add noise
+_MACHINE_FORMATS = frozenset({OutputFormat.json, OutputFormat.csv, OutputFormat.markdown})
+
+
 def _run_audit(
     url: str,
     single: bool,
@@ -262,11 +281,31 @@ def _run_audit(
     timeout: int = 15,
     *,
     bots: list[str] | None = None,
+    page_cache: PageCache | None = None,
+    show_progress: bool = True,
 ) -> AuditReport | SiteAuditReport:
-    """Execute the audit and return the report."""
+    """Execute the audit and return the report.
+
+    With *show_progress* False (piped output or machine-readable formats) no
+    spinner or progress bar is started.
+    """
+    if not show_progress:
+        if single:
+            return _run_async(
+                audit_url(url, timeout=timeout, bots=bots, page_cache=page_cache)
+            )
+        return _run_async(
+            audit_site(
+                url, max_pages=max_pages, timeout=timeout, bots=bots,
+                page_cache=page_cache,
+            )
+        )
+
     if single:
         with console.status(f"Auditing {url}..."):
-            return asyncio.run(audit_url(url, timeout=timeout, bots=bots))
+            return _run_async(
+                audit_url(url, timeout=timeout, bots=bots, page_cache=page_cache)
+            )
 
     with Progress(
         SpinnerColumn(),
@@ -280,16 +319,76 @@ def _run_audit(
         def on_progress(msg: str) -> None:
             progress.update(task_id, description=msg, advance=1)
 
-        report = asyncio.run(
+        report = _run_async(
             audit_site(
                 url, max_pages=max_pages, timeout=timeout,
-                progress_callback=on_progress, bots=bots,
+                progress_callback=on_progress, bots=bots, page_cache=page_cache,
             )
         )
         progress.update(task_id, description="Done", completed=max_pages)
     return report
 
 
+def _render_json(report: AuditReport | SiteAuditReport) -> None:
+    _print_json(report, console)
+
+
+def _render_csv(report: AuditReport | SiteAuditReport) -> None:
+    if isinstance(report, SiteAuditReport):
+        console.print(format_site_report_csv(report), end="")
+    else:
+        console.print(format_single_report_csv(report), end="")
+
+
+def _render_markdown(report: AuditReport | SiteAuditReport) -> None:
+    if isinstance(report, SiteAuditReport):
+        console.print(format_site_report_md(report), end="")
+    else:
+        console.print(format_single_report_md(report), end="")
+
+
+# Characters in a URL that are unsafe or awkward in a report filename
+_SLUG_TABLE = str.maketrans({"/": "_", ":": "_", "?": "_", "&": "_"})
+
+
+def _render_html(report: AuditReport | SiteAuditReport) -> None:
+    from pathlib import Path
+
+    from context_cli.formatters.html import (
+        format_single_report_html,
+        format_site_report_html,
+    )
+
+    if isinstance(report, SiteAuditReport):
+        html_str = format_site_report_html(report)
+    else:
+        html_str = format_single_report_html(report)
+    slug = report.url.removeprefix("https://").removeprefix("http://").translate(_SLUG_TABLE)
+    filename = f"context-report-{slug}.html"
+    Path(filename).write_text(html_str)
+    console.print(f"[green]HTML report saved to:[/green] {filename}")
+
+
+_FORMAT_RENDERERS: dict[OutputFormat, Callable[[AuditReport | SiteAuditReport], None]] = {
+    OutputFormat.json: _render_json,
+    OutputFormat.csv: _render_csv,
+    OutputFormat.markdown: _render_markdown,
+    OutputFormat.html: _render_html,
+}
+
+
+# (label, pillar key, score getter, detail getter) for the fallback score table
+_PILLAR_ROWS = tuple(
+    (label, pillar, attrgetter(f"{pillar}.score"), attrgetter(f"{pillar}.detail"))
+    for label, pillar in (
+        ("Robots.txt AI Access", "robots"),
+        ("llms.txt Presence", "llms_txt"),
+        ("Schema.org JSON-LD", "schema_org"),
+        ("Content Density", "content"),
+    )
+)
+
+
 def _render_output(
     report: AuditReport | SiteAuditReport,
     format: OutputFormat | None,
@@ -297,37 +396,8 @@ def _render_output(
     single: bool,
 ) -> None:
     """Render the audit report in the requested format."""
-    if format == OutputFormat.json:
-        console.print(report.model_dump_json(indent=2))
-        return
-    if format == OutputFormat.csv:
-        if isinstance(report, SiteAuditReport):
-            console.print(format_site_report_csv(report), end="")
-        else:
-            console.print(format_single_report_csv(report), end="")
-        return
-    if format == OutputFormat.markdown:
-        if isinstance(report, SiteAuditReport):
-            console.print(format_site_report_md(report), end="")
-        else:
-            console.print(format_single_report_md(report), end="")
-        return
-    if format == OutputFormat.html:
-        from pathlib import Path
-
-        from context_cli.formatters.html import (
-            format_single_report_html,
-            format_site_report_html,
-        )
-
-        if isinstance(report, SiteAuditReport):
-            html_str = format_site_report_html(report)
-        else:
-            html_str = format_single_report_html(report)
-        slug = report.url.replace("https://", "").replace("http://", "").replace("/", "_")
-        filename = f"context-report-{slug}.html"
-        Path(filename).write_text(html_str)
-        console.print(f"[green]HTML report saved to:[/green] {filename}")
+    if format is not None:
+        _FORMAT_RENDERERS[format](report)
         return
 
     # Rich output
@@ -350,17 +420,8 @@ def _render_output(
         table.add_column("Score", justify="right")
         table.add_column("Detail")
 
-        rows = [
-            ("Robots.txt AI Access", report.robots.score, "robots", report.robots.detail),
-            ("llms.txt Presence", report.llms_txt.score, "llms_txt", report.llms_txt.detail),
-            (
-                "Schema.org JSON-LD",
-                report.schema_org.score, "schema_org", report.schema_org.detail,
-            ),
-            ("Content Density", report.content.score, "content", report.content.detail),
-        ]
-        for label, score, pillar, detail in rows:
-            table.add_row(label, _score_color(score, pillar), detail)
+        for label, pillar, get_score, get_detail in _PILLAR_ROWS:
+            table.add_row(label, _score_color(get_score(report), pillar), get_detail(report))
 
         console.print(table)
         console.print(
@@ -0,0 +1,23 @@
+"""Cache command — manage the on-disk page analysis cache."""
+
+from __future__ import annotations
+
+import typer
+from rich.console import Console
+
+from context_cli.core.page_cache import PageCache
+
+cache_app = typer.Typer(help="Manage the on-disk page analysis cache.")
+
+
+def register(app: typer.Typer) -> None:
+    """Register the cache command group onto the Typer app."""
+    app.add_typer(cache_app, name="cache")
+
+
+@cache_app.command(name="clear")
+def clear_command() -> None:
+    """Delete all cached page analysis results."""
+    cache = PageCache()
+    count = cache.clear()
+    Console().print(f"Removed {count} cached page(s) from {cache.cache_dir}")
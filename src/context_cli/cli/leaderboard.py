@@ -9,7 +9,7 @@ import typer
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
-from context_cli.core.auditor import audit_url
+from context_cli.core.auditor import audit_url, create_audit_client
 from context_cli.core.batch import parse_url_file
 from context_cli.core.models import AuditReport
 
@@ -81,15 +81,17 @@ def register(app: typer.Typer) -> None:
                 async def _one(url: str) -> None:
                     async with sem:
                         try:
-                            r = await audit_url(url, timeout=timeout)
+                            r = await audit_url(url, timeout=timeout, client=client)
                             reports.append(r)
                         except Exception as e:
                             errors[url] = str(e)
                         finally:
                             progress.advance(task_id)
 
-                tasks = [asyncio.create_task(_one(u)) for u in urls]
-                await asyncio.gather(*tasks)
+                # One pooled client for the whole leaderboard run
+                async with create_audit_client(timeout) as client:
+                    tasks = [asyncio.create_task(_one(u)) for u in urls]
+                    await asyncio.gather(*tasks)
 
             asyncio.run(_audit_all_with_progress())
 
@@ -3,11 +3,8 @@
 from __future__ import annotations
 
 import typer
-from aiohttp import web
 from rich.console import Console
 
-from context_cli.core.serve.proxy import create_proxy_app
-
 console = Console()
 
 
@@ -27,10 +24,12 @@ def register(app: typer.Typer) -> None:
         ),
     ) -> None:
         """Start a reverse proxy that serves HTML as markdown for LLM clients."""
+        # aiohttp is only needed here; importing it lazily keeps CLI start-up fast
+        from context_cli.core.serve.proxy import run_proxy
+
         console.print(
             f"[bold green]Proxy[/bold green] {upstream} -> "
             f"[cyan]{host}:{port}[/cyan]  "
             f"(Accept: text/markdown -> auto-convert)"
         )
-        proxy_app = create_proxy_app(upstream)
-        web.run_app(proxy_app, host=host, port=port, print=None)
+        run_proxy(upstream, port=port, host=host, quiet=True)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import time
 from datetime import datetime, timezone
 
@@ -10,6 +9,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from context_cli.cli._audit_helpers import _parse_bots, _run_async
 from context_cli.core.auditor import audit_url
 from context_cli.core.history import HistoryDB
 from context_cli.core.models import AuditReport
@@ -96,7 +96,7 @@ def watch_command(
     if not url.startswith("http"):
         url = f"https://{url}"
 
-    bots_list = [b.strip() for b in bots.split(",")] if bots else None
+    bots_list = list(_parse_bots(bots)) if bots else None
 
     console.print(f"[bold]Watching[/bold] {url} every {interval}s")
     console.print("Press Ctrl+C to stop.\n")
@@ -108,7 +108,8 @@ def watch_command(
             timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
             console.print(f"[bold cyan]Run #{run_count}[/bold cyan] — {timestamp}")
 
-            report = asyncio.run(audit_url(url, timeout=timeout, bots=bots_list))
+            # Every run reuses one event loop instead of building a new one
+            report = _run_async(audit_url(url, timeout=timeout, bots=bots_list))
 
             _render_report(report, json_output)
 
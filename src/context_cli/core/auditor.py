@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import importlib.util
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
 from urllib.parse import urlparse
 
 import httpx
+from bs4 import BeautifulSoup
+from pydantic import BaseModel
 
+from context_cli.core.checks._cache import origin_cache_scope
+from context_cli.core.checks._url import url_depth
 from context_cli.core.checks.agents_md import check_agents_md
 from context_cli.core.checks.content import check_content
 from context_cli.core.checks.content_usage import check_content_usage
@@ -29,6 +36,7 @@ from context_cli.core.models import (
     AuditReport,
     ContentReport,
     DiscoveryResult,
+    EeatReport,
     LlmsTxtReport,
     MarkdownAcceptReport,
     McpEndpointReport,
@@ -37,17 +45,132 @@ from context_cli.core.models import (
     RobotsReport,
     SchemaOrgResult,
     SchemaReport,
+    SemanticHtmlReport,
     SiteAuditReport,
     X402Report,
 )
-from context_cli.core.scoring import compute_lint_results, compute_scores
+from context_cli.core.page_cache import PageCache, page_cache_key
+from context_cli.core.scoring import (
+    compute_lint_results,
+    compute_scores,
+    score_content,
+    score_llms_txt,
+    score_robots,
+    score_schema,
+)
+
+# ── HTTP client ───────────────────────────────────────────────────────────────
+
+AUDIT_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=30, keepalive_expiry=30.0
+)
+"""Connection pool for audit clients.
+
+Site-wide checks, discovery and sitemap fetches all hit the same origin, often
+seconds apart (the browser crawl runs in between), so idle connections are
+kept longer than httpx's 5s default to be reused across phases.
+"""
+
+
+# HTTP/2 needs h2 (the [fast] extra). With it, the site-wide checks an audit
+# fires at one origin concurrently are multiplexed over a single connection
+# instead of each opening its own TCP+TLS session.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_audit_client(timeout: int = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """Create a pooled HTTP client suitable for one or many audits.
+
+    Pass it to :func:`audit_url` / :func:`audit_site` via ``client=`` to share
+    keep-alive connections across audits; the caller owns (and closes) it.
+    HTTP/2 is negotiated when ``h2`` is installed.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        limits=AUDIT_HTTP_LIMITS,
+        http2=_HTTP2_AVAILABLE,
+    )
+
+
+@asynccontextmanager
+async def _client_scope(
+    client: httpx.AsyncClient | None, timeout: int
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Borrow *client* without closing it, or own a fresh one for this audit.
+
+    Origin-scoped check results (robots.txt, llms.txt, ...) are shared only
+    within the audit, or the enclosing batch, so every new audit sees the
+    site as it is now.
+    """
+    with origin_cache_scope():
+        if client is not None:
+            yield client
+        else:
+            async with create_audit_client(timeout) as owned:
+                yield owned
+
 
 # ── Orchestrator ──────────────────────────────────────────────────────────────
 
 
-def audit_page_content(html: str, markdown: str) -> tuple[SchemaReport, ContentReport]:
-    """Run page-specific checks (schema + content) on pre-crawled data."""
-    return check_schema_org(html), check_content(markdown)
+def audit_page_content(
+    html: str, markdown: str, page_cache: PageCache | None = None
+) -> tuple[SchemaReport, ContentReport]:
+    """Run page-specific checks (schema + content) on pre-crawled data.
+
+    With a *page_cache*, results for byte-identical pages are reused.
+    """
+    if page_cache is None or not (html or markdown):
+        return check_schema_org(html), check_content(markdown)
+    key = page_cache_key(html, markdown)
+    cached = page_cache.get(key)
+    if cached is not None:
+        return cached
+    schema_org, content = check_schema_org(html), check_content(markdown)
+    page_cache.set(key, schema_org, content)
+    return schema_org, content
+
+
+def _check_page_dom(
+    html: str, base_domain: str
+) -> tuple[SemanticHtmlReport, EeatReport]:
+    """Run the semantic-HTML and E-E-A-T checks on one shared parse of *html*."""
+    soup = BeautifulSoup(html, "html.parser") if html else None
+    return (
+        check_semantic_html(html, soup=soup),
+        check_eeat(html, base_domain=base_domain, soup=soup),
+    )
+
+
+async def _audit_crawled_page(
+    result: CrawlResult, page_cache: PageCache | None = None
+) -> PageAudit:
+    """Score the page-level pillars of one crawled page (off the event loop)."""
+    if not result.success:
+        return PageAudit(
+            url=result.url,
+            schema_org=SchemaReport(detail="Crawl failed"),
+            content=ContentReport(detail="Crawl failed"),
+            errors=[result.error or "Unknown crawl error"],
+        )
+    schema, content = await asyncio.to_thread(
+        audit_page_content, result.html, result.markdown, page_cache
+    )
+    return PageAudit(
+        url=result.url, schema_org=score_schema(schema), content=score_content(content)
+    )
+
+
+def _cancel_pending(futures: Iterable[asyncio.Future[Any] | None]) -> None:
+    """Cancel the audit's still-running *futures*; finished ones are unaffected.
+
+    Gives the hand-started check tasks the cleanup a ``TaskGroup`` would,
+    without its fail-fast semantics: one failing check must not cancel the rest.
+    """
+    for future in futures:
+        if future is not None:
+            future.cancel()
 
 
 def _page_weight(url: str) -> int:
@@ -61,8 +184,7 @@ def _page_weight(url: str) -> int:
         2 for depth 2
         1 for depth 3+
     """
-    path = urlparse(url).path.strip("/")
-    depth = len(path.split("/")) if path else 0
+    depth = url_depth(url)
     if depth <= 1:
         return 3
     if depth == 2:
@@ -70,6 +192,9 @@ def _page_weight(url: str) -> int:
     return 1
 
 
+_ALL_CONTENT_FLAGS = 0b111
+
+
 def aggregate_page_scores(
     pages: list[PageAudit],
     robots: RobotsReport,
@@ -88,18 +213,34 @@ def aggregate_page_scores(
         agg_content = ContentReport(detail="No pages audited successfully")
         return agg_schema, agg_content, robots.score + llms_txt.score
 
-    weights = [_page_weight(p.url) for p in successful]
-    total_weight = sum(weights)
-
-    # Aggregate schema: collect all blocks, weighted-average the score
+    # One pass over the pages accumulates both pillars
     all_schemas: list[SchemaOrgResult] = []
+    total_weight = 0
     total_blocks = 0
     schema_score_sum = 0.0
-    for p, w in zip(successful, weights):
-        all_schemas.extend(p.schema_org.schemas)
-        total_blocks += p.schema_org.blocks_found
-        schema_score_sum += p.schema_org.score * w
+    content_score_sum = 0.0
+    word_sum = 0
+    char_sum = 0
+    # Bits 0-2: some page has headings / lists / code blocks
+    found = 0
+    for p in successful:
+        w = _page_weight(p.url)
+        schema_org, content = p.schema_org, p.content
+        total_weight += w
+        all_schemas += schema_org.schemas
+        total_blocks += schema_org.blocks_found
+        schema_score_sum += schema_org.score * w
+        content_score_sum += content.score * w
+        word_sum += content.word_count
+        char_sum += content.char_count
+        if found != _ALL_CONTENT_FLAGS:
+            found |= (
+                content.has_headings
+                | content.has_lists << 1
+                | content.has_code_blocks << 2
+            )
 
+    # Schema: all blocks collected, weighted-average score
     avg_schema_score = round(schema_score_sum / total_weight, 1)
     agg_schema = SchemaReport(
         blocks_found=total_blocks,
@@ -111,30 +252,16 @@ def aggregate_page_scores(
         ),
     )
 
-    # Aggregate content: weighted-average scores, simple-average metrics
-    content_score_sum = 0.0
-    word_sum = 0
-    char_sum = 0
-    any_headings = False
-    any_lists = False
-    any_code = False
-    for p, w in zip(successful, weights):
-        content_score_sum += p.content.score * w
-        word_sum += p.content.word_count
-        char_sum += p.content.char_count
-        any_headings = any_headings or p.content.has_headings
-        any_lists = any_lists or p.content.has_lists
-        any_code = any_code or p.content.has_code_blocks
-
+    # Content: weighted-average score, simple-average metrics
     n = len(successful)
     avg_content_score = round(content_score_sum / total_weight, 1)
     avg_words = word_sum // n
     agg_content = ContentReport(
         word_count=avg_words,
         char_count=char_sum // n,
-        has_headings=any_headings,
-        has_lists=any_lists,
-        has_code_blocks=any_code,
+        has_headings=bool(found & 1),
+        has_lists=bool(found & 2),
+        has_code_blocks=bool(found & 4),
         score=avg_content_score,
         detail=(
             f"avg {avg_words} words across {n} pages"
@@ -146,6 +273,35 @@ def aggregate_page_scores(
     return agg_schema, agg_content, overall
 
 
+# Label used in error messages for each agent check whose failure is
+# reported. semantic_html runs synchronously on the crawled page, so a
+# non-report result there silently falls back to the default.
+_AGENT_CHECK_LABELS: dict[str, str] = {
+    "agents_md": "AGENTS.md",
+    "markdown_accept": "Markdown accept",
+    "mcp_endpoint": "MCP endpoint",
+    "x402": "x402",
+    "nlweb": "NLWeb",
+}
+
+_R = TypeVar("_R", bound=BaseModel)
+
+
+def _agent_report(
+    field: str, result: object, report_type: type[_R], errors: list[str]
+) -> _R:
+    """Return *result* if it is a *report_type*, else a default report.
+
+    A failed check is logged to *errors* under its ``_AGENT_CHECK_LABELS`` label.
+    """
+    if isinstance(result, report_type):
+        return result
+    label = _AGENT_CHECK_LABELS.get(field)
+    if label is not None and isinstance(result, BaseException):
+        errors.append(f"{label} check failed: {result}")
+    return report_type()
+
+
 def _build_agent_readiness(
     agents_md_result: AgentsMdReport | BaseException,
     md_accept_result: MarkdownAcceptReport | BaseException,
@@ -156,56 +312,57 @@ def _build_agent_readiness(
     errors: list[str],
 ) -> AgentReadinessReport:
     """Build AgentReadinessReport from individual check results, handling errors."""
-    if isinstance(agents_md_result, BaseException):
-        errors.append(f"AGENTS.md check failed: {agents_md_result}")
-        agents_md_result = AgentsMdReport()
-    if isinstance(md_accept_result, BaseException):
-        errors.append(f"Markdown accept check failed: {md_accept_result}")
-        md_accept_result = MarkdownAcceptReport()
-    if isinstance(mcp_result, BaseException):
-        errors.append(f"MCP endpoint check failed: {mcp_result}")
-        mcp_result = McpEndpointReport()
-    if isinstance(x402_result, BaseException):
-        errors.append(f"x402 check failed: {x402_result}")
-        x402_result = X402Report()
-    if isinstance(nlweb_result, BaseException):
-        errors.append(f"NLWeb check failed: {nlweb_result}")
-        nlweb_result = NlwebReport()
-    # semantic_html is sync, should not be BaseException from gather
-    from context_cli.core.models import SemanticHtmlReport
-    if not isinstance(semantic_html_result, SemanticHtmlReport):
-        semantic_html_result = SemanticHtmlReport()
+    agents_md = _agent_report("agents_md", agents_md_result, AgentsMdReport, errors)
+    md_accept = _agent_report(
+        "markdown_accept", md_accept_result, MarkdownAcceptReport, errors
+    )
+    mcp = _agent_report("mcp_endpoint", mcp_result, McpEndpointReport, errors)
+    semantic_html = _agent_report(
+        "semantic_html", semantic_html_result, SemanticHtmlReport, errors
+    )
+    x402 = _agent_report("x402", x402_result, X402Report, errors)
+    nlweb = _agent_report("nlweb", nlweb_result, NlwebReport, errors)
 
     total_score = (
-        agents_md_result.score
-        + md_accept_result.score
-        + mcp_result.score
-        + semantic_html_result.score
-        + x402_result.score
-        + nlweb_result.score
+        agents_md.score
+        + md_accept.score
+        + mcp.score
+        + semantic_html.score
+        + x402.score
+        + nlweb.score
     )
 
     return AgentReadinessReport(
-        agents_md=agents_md_result,
-        markdown_accept=md_accept_result,
-        mcp_endpoint=mcp_result,
-        semantic_html=semantic_html_result,
-        x402=x402_result,
-        nlweb=nlweb_result,
+        agents_md=agents_md,
+        markdown_accept=md_accept,
+        mcp_endpoint=mcp,
+        semantic_html=semantic_html,
+        x402=x402,
+        nlweb=nlweb,
         score=total_score,
         detail=f"Agent readiness: {total_score}/20",
     )
 
 
 async def audit_url(
-    url: str, *, timeout: int = DEFAULT_TIMEOUT, bots: list[str] | None = None
+    url: str,
+    *,
+    timeout: int = DEFAULT_TIMEOUT,
+    bots: list[str] | None = None,
+    client: httpx.AsyncClient | None = None,
+    page_cache: PageCache | None = None,
 ) -> AuditReport:
-    """Run a full readiness lint on a single URL. Returns AuditReport."""
+    """Run a full readiness lint on a single URL. Returns AuditReport.
+
+    If *client* is given it is used for all HTTP checks and left open;
+    otherwise a client is created and closed for this audit. *page_cache*
+    skips the page-level checks when the crawled content is unchanged.
+    """
     errors: list[str] = []
     raw_robots: str | None = None
     content_usage_result = None
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+    async with _client_scope(client, timeout) as client:
         # Run HTTP checks and browser crawl concurrently
         robots_task = check_robots(url, client, bots=bots)
         llms_task = check_llms_txt(url, client)
@@ -213,63 +370,74 @@ async def audit_url(
         crawl_task = extract_page(url)
 
         # Agent readiness async checks
-        agents_md_task = check_agents_md(url, client)
-        markdown_accept_task = check_markdown_accept(url, client)
-        mcp_endpoint_task = check_mcp_endpoint(url, client)
-        x402_task = check_x402(url, client)
-        nlweb_task = check_nlweb(url, client)
-
-        # Run all checks concurrently — split into two gathers to stay
-        # within mypy's asyncio.gather overload limits (max ~6 args).
-        # Tasks from the second gather are already scheduled by the event
-        # loop while the first gather is running.
-        robots_result, llms_txt, cu_result, crawl_result = await asyncio.gather(
-            robots_task, llms_task, content_usage_task, crawl_task,
-            return_exceptions=True,
-        )
-        (
-            agents_md_result, md_accept_result, mcp_result,
-            x402_result, nlweb_result,
-        ) = await asyncio.gather(
-            agents_md_task, markdown_accept_task, mcp_endpoint_task,
-            x402_task, nlweb_task,
-            return_exceptions=True,
+        agents_md_task = asyncio.ensure_future(check_agents_md(url, client))
+        markdown_accept_task = asyncio.ensure_future(check_markdown_accept(url, client))
+        mcp_endpoint_task = asyncio.ensure_future(check_mcp_endpoint(url, client))
+        x402_task = asyncio.ensure_future(check_x402(url, client))
+        nlweb_task = asyncio.ensure_future(check_nlweb(url, client))
+
+        agent_tasks = (
+            agents_md_task, markdown_accept_task, mcp_endpoint_task, x402_task, nlweb_task,
         )
+        started: list[asyncio.Future[Any]] = [*agent_tasks]
+        try:
+            # Run all checks concurrently — split into two gathers to stay
+            # within mypy's asyncio.gather overload limits (max ~6 args).
+            # The agent checks are wrapped in tasks above so they start now,
+            # alongside the crawl, rather than when the second gather is reached.
+            robots_result, llms_txt, cu_result, crawl_result = await asyncio.gather(
+                robots_task, llms_task, content_usage_task, crawl_task,
+                return_exceptions=True,
+            )
 
-    # Handle exceptions from gather
-    if isinstance(robots_result, BaseException):
-        errors.append(f"Robots check failed: {robots_result}")
-        robots = RobotsReport(found=False, detail="Check failed")
-    else:
-        robots, raw_robots = robots_result  # destructure tuple
-
-    if isinstance(llms_txt, BaseException):
-        errors.append(f"llms.txt check failed: {llms_txt}")
-        llms_txt = LlmsTxtReport(found=False, detail="Check failed")
-
-    if isinstance(cu_result, BaseException):
-        errors.append(f"Content-Usage check failed: {cu_result}")
-    else:
-        content_usage_result = cu_result
-
-    crawl: CrawlResult | None = None
-    if isinstance(crawl_result, BaseException):
-        errors.append(f"Crawl failed: {crawl_result}")
-    else:
-        crawl = crawl_result
-
-    # Run sync checks on crawl results
-    html = crawl.html if crawl and crawl.success else ""
-    markdown = crawl.markdown if crawl and crawl.success else ""
+            # Handle exceptions from gather
+            if isinstance(robots_result, BaseException):
+                errors.append(f"Robots check failed: {robots_result}")
+                robots = RobotsReport(found=False, detail="Check failed")
+            else:
+                robots, raw_robots = robots_result  # destructure tuple
 
-    if crawl and not crawl.success and crawl.error:
-        errors.append(f"Crawl error: {crawl.error}")
+            if isinstance(llms_txt, BaseException):
+                errors.append(f"llms.txt check failed: {llms_txt}")
+                llms_txt = LlmsTxtReport(found=False, detail="Check failed")
 
-    schema_org = check_schema_org(html)
-    content = check_content(markdown)
+            if isinstance(cu_result, BaseException):
+                errors.append(f"Content-Usage check failed: {cu_result}")
+            else:
+                content_usage_result = cu_result
 
-    # Sync agent readiness check (needs HTML)
-    semantic_html_result = check_semantic_html(html)
+            crawl: CrawlResult | None = None
+            if isinstance(crawl_result, BaseException):
+                errors.append(f"Crawl failed: {crawl_result}")
+            else:
+                crawl = crawl_result
+
+            html = markdown = ""
+            if crawl is not None:
+                if crawl.success:
+                    html, markdown = crawl.html, crawl.markdown
+                elif crawl.error:
+                    errors.append(f"Crawl error: {crawl.error}")
+
+            # CPU-bound page checks run in worker threads, starting as soon as the
+            # crawl is in, so they overlap the agent probes still in flight and a
+            # large page does not stall the event loop for other audits sharing it
+            page_checks = asyncio.gather(
+                asyncio.to_thread(audit_page_content, html, markdown, page_cache),
+                asyncio.to_thread(_check_page_dom, html, urlparse(url).netloc),
+            )
+            started.append(page_checks)
+            (
+                agents_md_result, md_accept_result, mcp_result,
+                x402_result, nlweb_result,
+            ) = await asyncio.gather(*agent_tasks, return_exceptions=True)
+        except BaseException:
+            # Cancelled (or failed) mid-audit: stop the probes and page checks
+            # already started rather than leaving them running unowned
+            _cancel_pending(started)
+            raise
+
+    (schema_org, content), (semantic_html_result, eeat_report) = await page_checks
 
     # Build agent readiness report
     agent_readiness = _build_agent_readiness(
@@ -278,8 +446,8 @@ async def audit_url(
     )
 
     # Token waste metrics
-    raw_html_chars = len(html) if html else 0
-    clean_md_chars = len(markdown) if markdown else 0
+    raw_html_chars = len(html)
+    clean_md_chars = len(markdown)
     raw_tokens = raw_html_chars // 4
     clean_tokens = clean_md_chars // 4
     waste_pct = (
@@ -293,8 +461,6 @@ async def audit_url(
 
     # Informational signals (not scored)
     rsl_report = check_rsl(raw_robots)
-    domain = urlparse(url).netloc
-    eeat_report = check_eeat(html, base_domain=domain)
 
     # Compute scores
     robots, llms_txt, schema_org, content, overall = compute_scores(
@@ -322,6 +488,21 @@ async def audit_url(
 
 SITE_AUDIT_TIMEOUT: int = 90
 
+# Seconds of the site-audit timeout kept back to score the pages already
+# crawled when the page crawl has to be cut short
+_SITE_AUDIT_FINISH_RESERVE: float = 5.0
+
+
+def _site_timeout_error() -> str:
+    """Error recorded when a site audit runs out of time."""
+    return f"Audit timed out after {SITE_AUDIT_TIMEOUT}s, returning partial results"
+
+
+def _crawl_stopped_error(pages_kept: int) -> str:
+    """Error recorded when the page crawl is cut short to finish within the timeout."""
+    budget = SITE_AUDIT_TIMEOUT - _SITE_AUDIT_FINISH_RESERVE
+    return f"Page crawl stopped after {budget:g}s; returning {pages_kept} crawled pages"
+
 
 async def audit_site(
     url: str,
@@ -331,8 +512,13 @@ async def audit_site(
     progress_callback: Callable[[str], None] | None = None,
     timeout: int = DEFAULT_TIMEOUT,
     bots: list[str] | None = None,
+    client: httpx.AsyncClient | None = None,
+    page_cache: PageCache | None = None,
 ) -> SiteAuditReport:
-    """Run a multi-page readiness lint."""
+    """Run a multi-page readiness lint.
+
+    *client* and *page_cache* behave as in :func:`audit_url`.
+    """
     errors: list[str] = []
     domain = urlparse(url).netloc
 
@@ -340,19 +526,22 @@ async def audit_site(
         if progress_callback:
             progress_callback(msg)
 
+    # The page crawl stops at crawl_deadline so the pages it has finished can
+    # still be scored; wait_for is the hard limit for the phases before it
+    crawl_deadline = (
+        asyncio.get_running_loop().time() + SITE_AUDIT_TIMEOUT - _SITE_AUDIT_FINISH_RESERVE
+    )
     try:
         return await asyncio.wait_for(
             _audit_site_inner(
                 url, domain, max_pages, delay_seconds, errors, _progress,
-                timeout, bots=bots,
+                timeout, bots=bots, client=client, page_cache=page_cache,
+                crawl_deadline=crawl_deadline,
             ),
             timeout=SITE_AUDIT_TIMEOUT,
         )
     except asyncio.TimeoutError:
-        errors.append(
-            f"Audit timed out after {SITE_AUDIT_TIMEOUT}s,"
-            " returning partial results"
-        )
+        errors.append(_site_timeout_error())
         return SiteAuditReport(
             url=url,
             domain=domain,
@@ -366,6 +555,18 @@ async def audit_site(
         )
 
 
+async def _discovery_inputs(
+    site_checks: asyncio.Future[Any],
+) -> tuple[str | None, list[str] | None]:
+    """Resolve the robots.txt text and seed-page links for page discovery."""
+    robots_result, _, _, seed_crawl = await asyncio.shield(site_checks)
+    raw_robots = None if isinstance(robots_result, BaseException) else robots_result[1]
+    seed_links = None
+    if isinstance(seed_crawl, CrawlResult) and seed_crawl.success:
+        seed_links = seed_crawl.internal_links
+    return raw_robots, seed_links
+
+
 async def _audit_site_inner(
     url: str,
     domain: str,
@@ -376,145 +577,155 @@ async def _audit_site_inner(
     timeout: int = DEFAULT_TIMEOUT,
     *,
     bots: list[str] | None = None,
+    client: httpx.AsyncClient | None = None,
+    page_cache: PageCache | None = None,
+    crawl_deadline: float | None = None,
 ) -> SiteAuditReport:
-    """Inner implementation of audit_site."""
+    """Inner implementation of audit_site.
+
+    If the remaining pages are still crawling at *crawl_deadline* (event loop
+    time), the crawl is cancelled and only the pages already crawled are scored.
+    """
     progress("Running site-wide checks...")
 
     content_usage_result = None
 
-    async with httpx.AsyncClient(
-        timeout=timeout, follow_redirects=True
-    ) as client:
+    async with _client_scope(client, timeout) as client:
         # Phase 1: Site-wide checks + seed crawl in parallel
         robots_task = check_robots(url, client, bots=bots)
         llms_task = check_llms_txt(url, client)
         content_usage_task = check_content_usage(url, client)
         crawl_task = extract_page(url)
 
-        # Agent readiness async checks (site-wide, on seed page)
-        agents_md_task = check_agents_md(url, client)
-        markdown_accept_task = check_markdown_accept(url, client)
-        mcp_endpoint_task = check_mcp_endpoint(url, client)
-        x402_task = check_x402(url, client)
-        nlweb_task = check_nlweb(url, client)
+        # Agent readiness async checks (site-wide, on seed page); wrapped in
+        # tasks so they overlap the seed crawl instead of following it
+        agents_md_task = asyncio.ensure_future(check_agents_md(url, client))
+        markdown_accept_task = asyncio.ensure_future(check_markdown_accept(url, client))
+        mcp_endpoint_task = asyncio.ensure_future(check_mcp_endpoint(url, client))
+        x402_task = asyncio.ensure_future(check_x402(url, client))
+        nlweb_task = asyncio.ensure_future(check_nlweb(url, client))
 
-        robots_result, llms_txt, cu_result, seed_crawl = await asyncio.gather(
+        agent_tasks = (
+            agents_md_task, markdown_accept_task, mcp_endpoint_task, x402_task, nlweb_task,
+        )
+        site_checks = asyncio.gather(
             robots_task, llms_task, content_usage_task, crawl_task,
             return_exceptions=True,
         )
-        (
-            agents_md_result, md_accept_result, mcp_result,
-            x402_result, nlweb_result,
-        ) = await asyncio.gather(
-            agents_md_task, markdown_accept_task, mcp_endpoint_task,
-            x402_task, nlweb_task,
-            return_exceptions=True,
+        # Phase 2 starts now too: discovery fetches the sitemap straight away and
+        # needs robots.txt and the seed page's links only after that, so the seed
+        # crawl is not on its critical path
+        discovery_inputs = asyncio.ensure_future(_discovery_inputs(site_checks))
+        discovery_task = asyncio.ensure_future(
+            discover_pages(url, client, max_pages=max_pages, site_inputs=discovery_inputs)
         )
+        started = (site_checks, *agent_tasks, discovery_inputs, discovery_task)
+        try:
+            robots_result, llms_txt, cu_result, seed_crawl = await site_checks
+            (
+                agents_md_result, md_accept_result, mcp_result,
+                x402_result, nlweb_result,
+            ) = await asyncio.gather(*agent_tasks, return_exceptions=True)
+
+            # Unpack results
+            raw_robots: str | None = None
+            if isinstance(robots_result, BaseException):
+                errors.append(f"Robots check failed: {robots_result}")
+                robots = RobotsReport(found=False, detail="Check failed")
+            else:
+                robots, raw_robots = robots_result
 
-        # Unpack results
-        raw_robots: str | None = None
-        if isinstance(robots_result, BaseException):
-            errors.append(f"Robots check failed: {robots_result}")
-            robots = RobotsReport(found=False, detail="Check failed")
-        else:
-            robots, raw_robots = robots_result
+            if isinstance(llms_txt, BaseException):
+                errors.append(f"llms.txt check failed: {llms_txt}")
+                llms_txt = LlmsTxtReport(found=False, detail="Check failed")
 
-        if isinstance(llms_txt, BaseException):
-            errors.append(f"llms.txt check failed: {llms_txt}")
-            llms_txt = LlmsTxtReport(found=False, detail="Check failed")
+            if isinstance(cu_result, BaseException):
+                errors.append(f"Content-Usage check failed: {cu_result}")
+            else:
+                content_usage_result = cu_result
 
-        if isinstance(cu_result, BaseException):
-            errors.append(f"Content-Usage check failed: {cu_result}")
-        else:
-            content_usage_result = cu_result
+            seed: CrawlResult | None = None
+            if isinstance(seed_crawl, BaseException):
+                errors.append(f"Seed crawl failed: {seed_crawl}")
+            else:
+                seed = seed_crawl
 
-        seed: CrawlResult | None = None
-        if isinstance(seed_crawl, BaseException):
-            errors.append(f"Seed crawl failed: {seed_crawl}")
-        else:
-            seed = seed_crawl
-
-        # Phase 2: Discover pages
-        progress("Discovering pages...")
-        seed_links = None
-        if seed and seed.success:
-            seed_links = seed.internal_links
-
-        discovery = await discover_pages(
-            url,
-            client,
-            max_pages=max_pages,
-            robots_txt=raw_robots,
-            seed_links=seed_links,
-        )
+            # Phase 2: Discover pages
+            progress("Discovering pages...")
+            discovery = await discovery_task
+        finally:
+            _cancel_pending(started)
 
-    # Semantic HTML sync check on seed page HTML
+    # Phase 3: Audit seed page + batch crawl remaining pages. The seed page's
+    # checks run in worker threads while the remaining pages are crawled.
     seed_html = seed.html if seed and seed.success else ""
-    semantic_html_result = check_semantic_html(seed_html)
-
-    # Build agent readiness report
-    agent_readiness = _build_agent_readiness(
-        agents_md_result, md_accept_result, mcp_result,
-        semantic_html_result, x402_result, nlweb_result, errors,
+    seed_signals = asyncio.ensure_future(
+        asyncio.to_thread(_check_page_dom, seed_html, domain)
     )
-
-    # Phase 3: Audit seed page + batch crawl remaining pages
-    pages: list[PageAudit] = []
-
-    # Audit the seed page first
+    analyses: dict[int, asyncio.Future[PageAudit]] = {}
+    seed_page: asyncio.Future[PageAudit] | None = None
     if seed and seed.success:
-        schema, content = audit_page_content(seed.html, seed.markdown)
-        # Score the page-level pillar checks
-        _, _, schema, content, _ = compute_scores(
-            RobotsReport(found=False), LlmsTxtReport(found=False),
-            schema, content,
-        )
-        pages.append(
-            PageAudit(url=url, schema_org=schema, content=content)
-        )
-    elif seed and not seed.success:
-        errors.append(f"Seed crawl error: {seed.error}")
+        seed_page = asyncio.ensure_future(_audit_crawled_page(seed, page_cache))
 
-    # Crawl remaining sampled pages
+    # Crawl remaining sampled pages, analysing each one as soon as it arrives
+    # so parsing overlaps the crawls still in flight
+    remaining_pages: list[PageAudit] = []
     remaining_urls = [u for u in discovery.urls_sampled if u != url]
-    if remaining_urls:
-        progress(f"Crawling {len(remaining_urls)} additional pages...")
-        crawl_results = await extract_pages(
-            remaining_urls, delay_seconds=delay_seconds
-        )
+    crawl: asyncio.Future[list[CrawlResult]] | None = None
+    try:
+        if remaining_urls:
+            progress(f"Crawling {len(remaining_urls)} additional pages...")
 
-        for i, result in enumerate(crawl_results):
-            progress(
-                f"Auditing page {i + 2}/{len(discovery.urls_sampled)}..."
-            )
-            if result.success:
-                schema, content = audit_page_content(
-                    result.html, result.markdown
-                )
-                _, _, schema, content, _ = compute_scores(
-                    RobotsReport(found=False),
-                    LlmsTxtReport(found=False),
-                    schema, content,
+            def _on_crawled(index: int, result: CrawlResult) -> None:
+                analyses[index] = asyncio.ensure_future(
+                    _audit_crawled_page(result, page_cache)
                 )
-                pages.append(
-                    PageAudit(
-                        url=result.url,
-                        schema_org=schema,
-                        content=content,
+
+            crawl = asyncio.ensure_future(extract_pages(
+                remaining_urls, delay_seconds=delay_seconds, on_result=_on_crawled
+            ))
+            time_left = None
+            if crawl_deadline is not None:
+                time_left = max(0.0, crawl_deadline - asyncio.get_running_loop().time())
+            done, _ = await asyncio.wait({crawl}, timeout=time_left)
+            if crawl in done:
+                for i, result in enumerate(crawl.result()):
+                    progress(
+                        f"Auditing page {i + 2}/{len(discovery.urls_sampled)}..."
                     )
-                )
+                    analysis = analyses.get(i)
+                    if analysis is None:
+                        remaining_pages.append(await _audit_crawled_page(result, page_cache))
+                    else:
+                        remaining_pages.append(await analysis)
             else:
-                pages.append(PageAudit(
-                    url=result.url,
-                    schema_org=SchemaReport(detail="Crawl failed"),
-                    content=ContentReport(detail="Crawl failed"),
-                    errors=[result.error or "Unknown crawl error"],
-                ))
+                # Out of time: keep the pages crawled so far, drop the rest
+                crawl.cancel()
+                errors.append(
+                    _crawl_stopped_error(len(analyses) + (seed_page is not None))
+                )
+                for i in sorted(analyses):
+                    remaining_pages.append(await analyses[i])
 
-    # Phase 4: Compute site-wide robot/llms scores
-    robots, llms_txt, _, _, _ = compute_scores(
-        robots, llms_txt, SchemaReport(), ContentReport()
+        semantic_html_result, eeat_report = await seed_signals
+        pages: list[PageAudit] = []
+        if seed_page is not None:
+            pages.append(await seed_page)
+    finally:
+        _cancel_pending([crawl, seed_signals, seed_page, *analyses.values()])
+
+    # Build agent readiness report
+    agent_readiness = _build_agent_readiness(
+        agents_md_result, md_accept_result, mcp_result,
+        semantic_html_result, x402_result, nlweb_result, errors,
     )
+    if seed and not seed.success:
+        errors.append(f"Seed crawl error: {seed.error}")
+    pages += remaining_pages
+
+    # Phase 4: Compute site-wide robot/llms scores
+    score_robots(robots)
+    score_llms_txt(llms_txt)
 
     # Phase 5: Aggregate
     pages_failed = sum(1 for p in pages if p.errors)
@@ -524,7 +735,6 @@ async def _audit_site_inner(
 
     # Informational signals from seed page
     rsl_report = check_rsl(raw_robots)
-    eeat_report = check_eeat(seed_html, base_domain=domain)
 
     return SiteAuditReport(
         url=url,
@@ -7,8 +7,10 @@ import csv
 import io
 from collections.abc import Callable
 
-from context_cli.core.auditor import audit_site, audit_url
+from context_cli.core.auditor import audit_site, audit_url, create_audit_client
+from context_cli.core.checks._cache import origin_cache_scope
 from context_cli.core.models import AuditReport, BatchAuditReport, SiteAuditReport
+from context_cli.core.page_cache import PageCache
 
 
 def parse_url_file(path: str) -> list[str]:
@@ -69,7 +71,9 @@ async def run_batch_audit(
     timeout: int = 15,
     concurrency: int = 3,
     progress_callback: Callable[[str], None] | None = None,
+    on_complete: Callable[[str], None] | None = None,
     bots: list[str] | None = None,
+    page_cache: PageCache | None = None,
 ) -> BatchAuditReport:
     """Run audits for multiple URLs with concurrency limiting.
 
@@ -80,6 +84,13 @@ async def run_batch_audit(
         timeout: HTTP timeout in seconds.
         concurrency: Max concurrent audits.
         progress_callback: Called with status messages for each URL.
+        on_complete: Called with each URL as soon as its audit finishes
+            (successfully or not), in completion order.
+        page_cache: Optional on-disk cache for page-level check results.
+
+    All audits share one pooled HTTP client, so connections (and TLS
+    sessions) are reused across URLs instead of being rebuilt per audit.
+    Origin-scoped check results are likewise shared for the whole batch.
     """
     semaphore = asyncio.Semaphore(concurrency)
     reports: list[AuditReport | SiteAuditReport] = []
@@ -92,16 +103,25 @@ async def run_batch_audit(
             try:
                 report: AuditReport | SiteAuditReport
                 if single:
-                    report = await audit_url(url, timeout=timeout, bots=bots)
+                    report = await audit_url(
+                        url, timeout=timeout, bots=bots, client=client,
+                        page_cache=page_cache,
+                    )
                 else:
                     report = await audit_site(
-                        url, max_pages=max_pages, timeout=timeout, bots=bots
+                        url, max_pages=max_pages, timeout=timeout, bots=bots,
+                        client=client, page_cache=page_cache,
                     )
                 reports.append(report)
             except Exception as e:
                 errors[url] = str(e)
-
-    tasks = [asyncio.create_task(_audit_one(u)) for u in urls]
-    await asyncio.gather(*tasks)
+            finally:
+                if on_complete:
+                    on_complete(url)
+
+    with origin_cache_scope():
+        async with create_audit_client(timeout) as client:
+            tasks = [asyncio.create_task(_audit_one(u)) for u in urls]
+            await asyncio.gather(*tasks)
 
     return BatchAuditReport(urls=urls, reports=reports, errors=errors)
@@ -0,0 +1,101 @@
+"""Per-origin result cache shared by the origin-scoped checks."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+_T = TypeVar("_T")
+
+ORIGIN_CACHE_TTL: float = 600.0
+"""Default seconds an origin-scoped probe result is reused for other URLs on it."""
+
+
+@dataclass
+class _Store(Generic[_T]):
+    """One cache's results and in-flight probes within a scope."""
+
+    results: dict[str, tuple[float, _T]] = field(default_factory=dict)
+    inflight: dict[str, asyncio.Future[_T]] = field(default_factory=dict)
+
+    def done(self, origin: str, task: asyncio.Future[_T]) -> None:
+        """Retire *origin*'s finished probe, keeping its result unless it failed."""
+        if self.inflight.get(origin) is task:
+            del self.inflight[origin]
+        if not task.cancelled() and task.exception() is None:
+            self.results[origin] = (time.monotonic(), task.result())
+
+
+_scope: ContextVar[dict[OriginCache[Any], _Store[Any]] | None] = ContextVar(
+    "origin_cache_scope", default=None
+)
+
+
+@contextmanager
+def origin_cache_scope() -> Iterator[None]:
+    """Share origin-scoped probe results among the checks run inside this block.
+
+    Results live only as long as the outermost scope, so one audit run (or
+    batch of runs) probes each origin once, and the next run probes again and
+    sees any file published in between. Nested scopes reuse the outer one;
+    tasks created inside the block inherit it.
+    """
+    if _scope.get() is not None:
+        yield
+        return
+    token = _scope.set({})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class OriginCache(Generic[_T]):
+    """Results of one kind of origin-scoped probe, keyed by origin.
+
+    Inside an :func:`origin_cache_scope`, a result is reused until it is older
+    than the *ttl* given to :meth:`get`, concurrent callers for the same
+    origin share a single in-flight probe, and failed probes are not cached.
+    Outside any scope every call runs its probe.
+    """
+
+    def clear(self) -> None:
+        """Drop this cache's results and in-flight probes in the current scope."""
+        stores = _scope.get()
+        if stores is not None:
+            stores.pop(self, None)
+
+    async def get(
+        self,
+        origin: str,
+        probe: Callable[[], Awaitable[_T]],
+        ttl: float = ORIGIN_CACHE_TTL,
+    ) -> _T:
+        """Return the cached result for *origin*, running *probe* on a miss."""
+        stores = _scope.get()
+        if stores is None:
+            return await probe()
+        store: _Store[_T] = stores.setdefault(self, _Store())
+
+        cached = store.results.get(origin)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        task = store.inflight.get(origin)
+        if task is None:
+            task = asyncio.ensure_future(probe())
+            store.inflight[origin] = task
+            task.add_done_callback(lambda t: store.done(origin, t))
+        return await asyncio.shield(task)
+
+
+def clear_origin_caches() -> None:
+    """Drop every origin-scoped check's results in the current scope."""
+    stores = _scope.get()
+    if stores is not None:
+        stores.clear()
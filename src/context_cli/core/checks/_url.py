@@ -0,0 +1,43 @@
+"""Lightweight URL helpers for the origin-scoped checks and page weighting."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from urllib.parse import urlparse
+
+
+def url_origin(url: str) -> str:
+    """Return ``scheme://netloc`` for *url*.
+
+    Equivalent to building the origin from ``urlparse(url)``, but only splits
+    the string instead of constructing a full ``ParseResult``. URLs without a
+    ``://`` separator fall back to ``urlparse``.
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+    end = len(rest)
+    for delim in "/?#":
+        i = rest.find(delim, 0, end)
+        if i != -1:
+            end = i
+    return f"{scheme.lower()}://{rest[:end]}"
+
+
+@lru_cache(maxsize=1024)
+def url_depth(url: str) -> int:
+    """Return the number of path segments in *url* (0 for the root).
+
+    Equivalent to counting segments of ``urlparse(url).path.strip("/")``, but
+    with plain string splitting. URLs without ``://`` or with ``;`` params fall
+    back to ``urlparse``.
+    """
+    _, sep, rest = url.partition("://")
+    if not sep or ";" in rest:
+        path = urlparse(url).path
+    else:
+        rest = rest.partition("#")[0].partition("?")[0]
+        path = rest.partition("/")[2]
+    path = path.strip("/")
+    return path.count("/") + 1 if path else 0
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
-
 import httpx
 
+from context_cli.core.checks._cache import OriginCache
+from context_cli.core.checks._url import url_origin
 from context_cli.core.models import AgentsMdReport
 
 PROBE_PATHS: list[str] = [
@@ -16,12 +16,20 @@ PROBE_PATHS: list[str] = [
 
 DEFAULT_TIMEOUT: int = 15
 
+_agents_md_cache: OriginCache[AgentsMdReport] = OriginCache()
+
 
 async def check_agents_md(url: str, client: httpx.AsyncClient) -> AgentsMdReport:
-    """Probe for AGENTS.md at standard paths, return on first hit."""
-    parsed = urlparse(url)
-    base = f"{parsed.scheme}://{parsed.netloc}"
+    """Probe for AGENTS.md at standard paths, return on first hit.
+
+    The result depends only on the origin and is cached per origin.
+    """
+    base = url_origin(url)
+    report = await _agents_md_cache.get(base, lambda: _probe_agents_md(base, client))
+    return report.model_copy()
+
 
+async def _probe_agents_md(base: str, client: httpx.AsyncClient) -> AgentsMdReport:
     for path in PROBE_PATHS:
         probe_url = f"{base}{path}"
         try:
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
 
 from context_cli.core.models import ContentReport
 
 _VOWELS = re.compile(r"[aeiou]+", re.IGNORECASE)
+_SENTENCE_END_RE = re.compile(r"[.!?]+")
+_FIRST_SENTENCE_RE = re.compile(r"(?<=[.!?])\s")
+_HEADING_RE = re.compile(r"^(#{1,6})\s", re.MULTILINE)
+_HEADING_SPLIT_RE = re.compile(r"^#{1,6}\s.*$", re.MULTILINE)
 
 
 def _count_syllables(word: str) -> int:
@@ -15,15 +20,23 @@ def _count_syllables(word: str) -> int:
     return max(1, len(groups))
 
 
-def _readability_grade(text: str) -> float | None:
-    """Compute Flesch-Kincaid Grade Level. Returns None if <30 words."""
+def _readability_grade(text: str, word_count: int | None = None) -> float | None:
+    """Compute Flesch-Kincaid Grade Level. Returns None if <30 words.
+
+    Callers that already know *word_count* can pass it so short texts are
+    rejected without tokenizing them again.
+    """
+    if word_count is not None and word_count < 30:
+        return None
     words = text.split()
     if len(words) < 30:
         return None
-    sentences = [s for s in re.split(r"[.!?]+", text) if s.strip()]
+    sentences = [s for s in _SENTENCE_END_RE.split(text) if s.strip()]
     if not sentences:
         sentences = [text]  # treat entire text as one sentence
-    total_syllables = sum(_count_syllables(w) for w in words)
+    # Natural text repeats words heavily, so syllables are counted once per
+    # distinct word and weighted by frequency (Counter tallies in C).
+    total_syllables = sum(n * _count_syllables(w) for w, n in Counter(words).items())
     grade = 0.39 * (len(words) / len(sentences)) + 11.8 * (total_syllables / len(words)) - 15.59
     return round(grade, 1)
 
@@ -35,8 +48,7 @@ def _analyze_headings(markdown: str) -> tuple[int, bool]:
     Hierarchy rule: each heading can go at most one level deeper than the previous.
     Going back up (e.g., H3 → H2) is always valid.
     """
-    heading_pattern = re.compile(r"^(#{1,6})\s", re.MULTILINE)
-    levels = [len(m.group(1)) for m in heading_pattern.finditer(markdown)]
+    levels = [len(m.group(1)) for m in _HEADING_RE.finditer(markdown)]
     if not levels:
         return 0, True
     valid = True
@@ -57,34 +69,68 @@ def _answer_first_ratio(markdown: str) -> float:
     """
     if not markdown.strip():
         return 0.0
-    sections = re.split(r"^#{1,6}\s.*$", markdown, flags=re.MULTILINE)
+    sections = _HEADING_SPLIT_RE.split(markdown)
     non_empty = [s.strip() for s in sections if s.strip()]
     if not non_empty:
         return 0.0
     answer_first = 0
     for section in non_empty:
         # Extract first sentence: split on sentence-ending punctuation
-        sentences = re.split(r"(?<=[.!?])\s", section, maxsplit=1)
+        sentences = _FIRST_SENTENCE_RE.split(section, maxsplit=1)
         first = sentences[0].strip()
         if first and not first.rstrip().endswith("?"):
             answer_first += 1
     return round(answer_first / len(non_empty), 2)
 
 
-def _analyze_chunks(markdown: str) -> tuple[int, int, int]:
-    """Split markdown by headings and analyze chunk sizes.
+def _scan_lines(markdown: str) -> tuple[int, bool, bool, bool, list[int]]:
+    """Walk the markdown once, collecting word counts and structure flags.
 
-    Returns (chunk_count, avg_chunk_words, chunks_in_sweet_spot).
+    Returns (word_count, has_headings, has_lists, has_code_blocks, chunk_words),
+    where chunk_words holds the word count of each non-empty section between
+    headings.
     """
-    chunks = re.split(r"^#{1,6}\s.*$", markdown, flags=re.MULTILINE)
-    # Filter out empty/whitespace-only chunks
-    chunk_words = [len(c.split()) for c in chunks if c.strip()]
-    chunk_count = len(chunk_words)
-    if chunk_count == 0:
-        return 0, 0, 0
-    avg = sum(chunk_words) // chunk_count
-    sweet = sum(1 for w in chunk_words if 50 <= w <= 150)
-    return chunk_count, avg, sweet
+    lines = markdown.split("\n")
+    last = len(lines) - 1
+    word_count = 0
+    has_headings = has_lists = False
+    # Cheap C-level substring scans first: fences never span lines, and the
+    # per-line list test is skipped entirely when no marker character exists.
+    has_code_blocks = "```" in markdown
+    scan_lists = "-" in markdown or "*" in markdown or "+" in markdown
+    chunk_words: list[int] = []
+    current = 0
+    absorbed = False
+    for i, line in enumerate(lines):
+        words = len(line.split())
+        word_count += words
+
+        # Heading: 1-6 '#' followed by whitespace. A bare '#' run counts when
+        # a newline follows; as with ``^#{1,6}\s.*$``, whose ``\s`` consumes
+        # that newline, the next line then belongs to the heading rather than
+        # to the following chunk.
+        if absorbed:
+            absorbed = False
+        elif line[:1] == "#" and len(line) - len(rest := line.lstrip("#")) <= 6 and (
+            rest[:1].isspace() or (not rest and i < last)
+        ):
+            has_headings = True
+            absorbed = not rest
+            if current:
+                chunk_words.append(current)
+            current = 0
+        else:
+            current += words
+        if scan_lists and not has_lists:
+            stripped = line.lstrip()
+            if stripped[:1] in ("-", "*", "+") and (
+                stripped[1:2].isspace() or (len(stripped) == 1 and i < last)
+            ):
+                has_lists = True
+
+    if current:
+        chunk_words.append(current)
+    return word_count, has_headings, has_lists, has_code_blocks, chunk_words
 
 
 def check_content(markdown: str) -> ContentReport:
@@ -92,15 +138,15 @@ def check_content(markdown: str) -> ContentReport:
     if not markdown:
         return ContentReport(detail="No content extracted")
 
-    words = markdown.split()
-    word_count = len(words)
+    word_count, has_headings, has_lists, has_code_blocks, chunk_words = _scan_lines(markdown)
     char_count = len(markdown)
-    has_headings = bool(re.search(r"^#{1,6}\s", markdown, re.MULTILINE))
-    has_lists = bool(re.search(r"^[\s]*[-*+]\s", markdown, re.MULTILINE))
-    has_code_blocks = "```" in markdown
-    chunk_count, avg_chunk_words, chunks_in_sweet_spot = _analyze_chunks(markdown)
-    readability_grade = _readability_grade(markdown)
-    heading_count, heading_hierarchy_valid = _analyze_headings(markdown)
+    chunk_count = len(chunk_words)
+    avg_chunk_words = sum(chunk_words) // chunk_count if chunk_count else 0
+    chunks_in_sweet_spot = sum(1 for w in chunk_words if 50 <= w <= 150)
+    readability_grade = _readability_grade(markdown, word_count)
+    heading_count, heading_hierarchy_valid = (
+        _analyze_headings(markdown) if has_headings else (0, True)
+    )
     answer_first = _answer_first_ratio(markdown)
 
     detail = f"{word_count} words"
@@ -28,17 +28,25 @@ _DATE_META_PROPERTIES = {
 _DATE_META_NAMES = {"date", "dcterms.date", "dc.date"}
 
 
-def check_eeat(html: str, *, base_domain: str | None = None) -> EeatReport:
+def check_eeat(
+    html: str,
+    *,
+    base_domain: str | None = None,
+    soup: BeautifulSoup | None = None,
+) -> EeatReport:
     """Detect E-E-A-T signals in HTML content.
 
     Args:
         html: Raw HTML string to analyse.
         base_domain: Domain of the page (for distinguishing external citations).
+        soup: Optional parse of *html* shared with other checks; parsed here
+            when omitted.
     """
     if not html.strip():
         return EeatReport(detail="No HTML content for E-E-A-T analysis")
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(html, "html.parser")
 
     has_author, author_name = _detect_author(soup)
     has_date = _detect_date(soup)
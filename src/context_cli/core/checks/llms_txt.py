@@ -2,36 +2,63 @@
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
+import asyncio
 
 import httpx
 
+from context_cli.core.checks._cache import OriginCache
+from context_cli.core.checks._url import url_origin
 from context_cli.core.models import LlmsTxtReport
 
+_llms_cache: OriginCache[LlmsTxtReport] = OriginCache()
+
+
+async def _has_content(url: str, client: httpx.AsyncClient) -> bool:
+    """Return True if *url* responds 200 with a non-blank body."""
+    try:
+        resp = await client.get(url, follow_redirects=True)
+    except httpx.HTTPError:
+        return False
+    return resp.status_code == 200 and len(resp.text.strip()) > 0
+
 
 async def _probe_file(
     base: str, paths: list[str], client: httpx.AsyncClient
 ) -> str | None:
-    """Probe a list of URL paths, returning the first that has non-empty content."""
-    for path in paths:
-        probe_url = base + path
-        try:
-            resp = await client.get(probe_url, follow_redirects=True)
-            if resp.status_code == 200 and len(resp.text.strip()) > 0:
+    """Probe a list of URL paths, returning the first that has non-empty content.
+
+    All probes are sent at once so a miss on the preferred path costs one
+    round-trip rather than one per path. Results are still taken in *paths*
+    order, and outstanding probes are cancelled as soon as the answer is known.
+    """
+    urls = [base + path for path in paths]
+    tasks = [asyncio.ensure_future(_has_content(u, client)) for u in urls]
+    try:
+        for probe_url, task in zip(urls, tasks):
+            if await task:
                 return probe_url
-        except httpx.HTTPError:
-            continue
-    return None
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
 
 
 async def check_llms_txt(url: str, client: httpx.AsyncClient) -> LlmsTxtReport:
-    """Probe /llms.txt, /.well-known/llms.txt, /llms-full.txt, /.well-known/llms-full.txt."""
-    parsed = urlparse(url)
-    base = f"{parsed.scheme}://{parsed.netloc}"
+    """Probe /llms.txt, /.well-known/llms.txt, /llms-full.txt, /.well-known/llms-full.txt.
+
+    The probes depend only on the origin, so within one audit run results are
+    cached per origin (see ``OriginCache``) and concurrent callers
+    share one probe run. Each caller gets its own copy of the report.
+    """
+    base = url_origin(url)
+    report = await _llms_cache.get(base, lambda: _probe_origin(base, client))
+    return report.model_copy()
+
 
-    llms_url = await _probe_file(base, ["/llms.txt", "/.well-known/llms.txt"], client)
-    full_url = await _probe_file(
-        base, ["/llms-full.txt", "/.well-known/llms-full.txt"], client
+async def _probe_origin(base: str, client: httpx.AsyncClient) -> LlmsTxtReport:
+    llms_url, full_url = await asyncio.gather(
+        _probe_file(base, ["/llms.txt", "/.well-known/llms.txt"], client),
+        _probe_file(base, ["/llms-full.txt", "/.well-known/llms-full.txt"], client),
     )
 
     found = llms_url is not None
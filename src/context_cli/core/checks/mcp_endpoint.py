@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
-
 import httpx
 
+from context_cli.core.checks._cache import OriginCache
+from context_cli.core.checks._url import url_origin
 from context_cli.core.models import McpEndpointReport
 
+_mcp_cache: OriginCache[McpEndpointReport] = OriginCache()
+
 
 async def check_mcp_endpoint(url: str, client: httpx.AsyncClient) -> McpEndpointReport:
-    """Probe /.well-known/mcp.json and report MCP endpoint availability."""
-    parsed = urlparse(url)
-    mcp_url = f"{parsed.scheme}://{parsed.netloc}/.well-known/mcp.json"
+    """Probe /.well-known/mcp.json and report MCP endpoint availability.
+
+    The result depends only on the origin and is cached per origin.
+    """
+    base = url_origin(url)
+    report = await _mcp_cache.get(base, lambda: _probe_mcp(base, client))
+    return report.model_copy()
+
 
+async def _probe_mcp(base: str, client: httpx.AsyncClient) -> McpEndpointReport:
+    mcp_url = f"{base}/.well-known/mcp.json"
     try:
         resp = await client.get(mcp_url, follow_redirects=True)
         if resp.status_code != 200:
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import json
 import re
-from urllib.parse import urlparse
 
 import httpx
 
+from context_cli.core.checks._cache import OriginCache
+from context_cli.core.checks._url import url_origin
 from context_cli.core.models import NlwebReport
 
 NLWEB_TYPES: set[str] = {"NLWebEndpoint", "NLWebService"}
@@ -15,6 +16,8 @@ NLWEB_ACTIONS: set[str] = {"NLSearchAction", "NLQueryAction"}
 
 DEFAULT_TIMEOUT: int = 15
 
+_well_known_cache: OriginCache[bool] = OriginCache()
+
 
 def _check_schema_extensions(html: str) -> bool:
     """Check HTML for NLWeb Schema.org extensions in JSON-LD blocks."""
@@ -53,24 +56,29 @@ def _check_schema_extensions(html: str) -> bool:
     return False
 
 
+async def _probe_well_known(base: str, client: httpx.AsyncClient) -> bool:
+    """Return True if the origin serves /.well-known/nlweb."""
+    try:
+        resp = await client.get(f"{base}/.well-known/nlweb", follow_redirects=True)
+    except httpx.HTTPError:
+        return False
+    return resp.status_code == 200
+
+
 async def check_nlweb(
     url: str, client: httpx.AsyncClient, html: str = ""
 ) -> NlwebReport:
     """Check if a site supports NLWeb protocol.
 
-    Probes /.well-known/nlweb and checks HTML for NLWeb Schema.org extensions.
+    Probes /.well-known/nlweb (cached per origin) and checks HTML for NLWeb
+    Schema.org extensions.
     """
-    well_known_found = False
+    base = url_origin(url)
+    well_known_found = await _well_known_cache.get(
+        base, lambda: _probe_well_known(base, client)
+    )
     schema_found = False
 
-    try:
-        parsed = urlparse(url)
-        well_known_url = f"{parsed.scheme}://{parsed.netloc}/.well-known/nlweb"
-        resp = await client.get(well_known_url, follow_redirects=True)
-        well_known_found = resp.status_code == 200
-    except httpx.HTTPError:
-        pass
-
     if html:
         schema_found = _check_schema_extensions(html)
 
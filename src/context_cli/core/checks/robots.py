@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
-from urllib.robotparser import RobotFileParser
+from dataclasses import dataclass, field
 
 import httpx
+from protego import Protego
 
+from context_cli.core.checks._cache import OriginCache
+from context_cli.core.checks._url import url_origin
 from context_cli.core.models import BotAccessResult, RobotsReport
 
 AI_BOTS: list[str] = [
@@ -28,6 +30,42 @@ AI_BOTS: list[str] = [
 DEFAULT_TIMEOUT: int = 15
 
 
+@dataclass
+class _RobotsEntry:
+    """A fetched robots.txt for one origin, with a lazily built parser."""
+
+    status_code: int
+    raw_text: str | None
+    _parser: Protego | None = None
+    _allowed: dict[str, bool] = field(default_factory=dict)
+
+    def can_fetch(self, bot: str) -> bool:
+        """Return whether *bot* may fetch "/", memoized per bot name."""
+        if bot not in self._allowed:
+            if self._parser is None:
+                self._parser = Protego.parse(self.raw_text or "")
+            self._allowed[bot] = self._parser.can_fetch("/", bot)
+        return self._allowed[bot]
+
+
+_robots_cache: OriginCache[_RobotsEntry] = OriginCache()
+
+
+async def _fetch_robots(origin: str, client: httpx.AsyncClient) -> _RobotsEntry:
+    resp = await client.get(f"{origin}/robots.txt", follow_redirects=True)
+    raw_text = resp.text if resp.status_code == 200 else None
+    return _RobotsEntry(resp.status_code, raw_text)
+
+
+async def _get_robots(origin: str, client: httpx.AsyncClient) -> _RobotsEntry:
+    """Return the robots.txt entry for *origin*, fetching at most once per TTL and run.
+
+    Concurrent callers for the same origin share a single in-flight request.
+    Failed fetches are not cached.
+    """
+    return await _robots_cache.get(origin, lambda: _fetch_robots(origin, client))
+
+
 async def check_robots(
     url: str, client: httpx.AsyncClient, *, bots: list[str] | None = None
 ) -> tuple[RobotsReport, str | None]:
@@ -36,27 +74,23 @@ async def check_robots(
     Returns:
         (report, raw_robots_text) — raw text is provided so discovery can filter URLs.
     """
-    parsed = urlparse(url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+    origin = url_origin(url)
 
     try:
-        resp = await client.get(robots_url, follow_redirects=True)
-        if resp.status_code != 200:
+        entry = await _get_robots(origin, client)
+        if entry.status_code != 200:
             return (
                 RobotsReport(
-                    found=False, detail=f"robots.txt returned HTTP {resp.status_code}"
+                    found=False, detail=f"robots.txt returned HTTP {entry.status_code}"
                 ),
                 None,
             )
 
-        raw_text = resp.text
-        rp = RobotFileParser()
-        rp.parse(raw_text.splitlines())
-
+        raw_text = entry.raw_text
         bots_to_check = bots or AI_BOTS
         bot_results = []
         for bot_name in bots_to_check:
-            allowed = rp.can_fetch(bot_name, "/")
+            allowed = entry.can_fetch(bot_name)
             bot_results.append(BotAccessResult(
                 bot=bot_name,
                 allowed=allowed,
@@ -3,40 +3,108 @@
 from __future__ import annotations
 
 import json
+import re
+from collections.abc import Callable
+from typing import Any
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from context_cli.core.models import SchemaOrgResult, SchemaReport
 
+# orjson is an optional C accelerator; JSON-LD blobs on product pages are often
+# tens of KB, so parsing dominates the pillar when it is available.
+try:
+    import orjson
+
+    def _orjson_loads(raw: str) -> Any:
+        """Parse *raw* with orjson, retrying with json for NaN/Infinity, which orjson rejects."""
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw)
+
+    _json_loads: Callable[[str], Any] = _orjson_loads
+except ImportError:  # pragma: no cover — exercised only without the [fast] extra
+    _json_loads = json.loads
+
+# Tag and attribute names are case-insensitive, but the type value is matched
+# exactly, as in the parser fallback below.
+_LD_SCRIPT_RE = re.compile(
+    r"""<script\b[^>]*?\stype\s*=\s*["'](?-i:application/ld\+json)["'][^>]*>(.*?)</script\s*>""",
+    re.DOTALL | re.IGNORECASE,
+)
+# An unterminated comment runs to the end of the document
+_COMMENT_RE = re.compile(r"<!--.*?(?:-->|\Z)", re.DOTALL)
+
+
+def _extract_ld_json(html: str) -> list[str]:
+    """Return the raw bodies of all ``application/ld+json`` script tags.
+
+    A single regex pass handles well-formed markup without building a DOM.
+    HTML comments are removed first, since the parser never sees scripts
+    inside them. The lexbor parser is only consulted when the MIME type appears
+    in the remaining markup more often than the regex matched (e.g. an unquoted
+    attribute value on one of the tags), so no block the parser would find is
+    dropped.
+    """
+    markup = _COMMENT_RE.sub("", html) if "<!--" in html else html
+    bodies = [m.group(1) for m in _LD_SCRIPT_RE.finditer(markup)]
+    if len(bodies) >= markup.count("application/ld+json"):
+        return bodies
+    tree = LexborHTMLParser(html)
+    # Compared here rather than in the selector, which may fold the case of
+    # ``type`` values; the regex above matches the value exactly
+    return [
+        node.text()
+        for node in tree.css("script[type]")
+        if node.attributes.get("type") == "application/ld+json"
+    ]
+
 
 def check_schema_org(html: str) -> SchemaReport:  # noqa: C901
     """Extract and analyze JSON-LD structured data from HTML."""
     if not html:
         return SchemaReport(detail="No HTML to analyze")
 
-    soup = BeautifulSoup(html, "html.parser")
-    ld_scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
-
-    schemas: list[SchemaOrgResult] = []
-    for script in ld_scripts:
+    # Rows are collected as plain tuples and turned into models once at the end
+    # with model_construct; the values are already str / list[str], so pydantic
+    # validation would only add per-item overhead on large @graph pages.
+    rows: list[tuple[str, list[str]]] = []
+    for raw in _extract_ld_json(html):
+        raw = raw.strip()
+        # CMS templates often emit empty blocks; skip anything that can't be JSON
+        if raw[:1] not in ("{", "["):
+            continue
         try:
-            data = json.loads(script.string or "")
+            data = _json_loads(raw)
             # Handle both single objects and arrays
             items = data if isinstance(data, list) else [data]
             for item in items:
                 if isinstance(item, dict):
+                    # JSON object keys are always str; slicing avoids a method
+                    # call per key, which adds up on large item arrays
+                    props = [k for k in item if k[:1] != "@"]
+                    # Bare {} / {"@context": ...} stubs carry no schema at all
+                    if not props and "@type" not in item and "@graph" not in item:
+                        continue
                     schema_type = item.get("@type", "Unknown")
                     if isinstance(schema_type, list):
                         schema_type = ", ".join(schema_type)
-                    props = [k for k in item.keys() if not k.startswith("@")]
-                    schemas.append(SchemaOrgResult(
-                        schema_type=schema_type,
-                        properties=props,
-                    ))
-        except (json.JSONDecodeError, TypeError):
+                    if not isinstance(schema_type, str):
+                        continue
+                    rows.append((schema_type, props))
+        except (ValueError, TypeError):
             continue
 
-    blocks_found = len(schemas)
+    blocks_found = len(rows)
     detail = f"{blocks_found} JSON-LD block(s) found" if blocks_found else "No JSON-LD found"
 
-    return SchemaReport(blocks_found=blocks_found, schemas=schemas, detail=detail)
+    return SchemaReport.model_construct(
+        blocks_found=blocks_found,
+        schemas=[
+            SchemaOrgResult.model_construct(schema_type=st, properties=props)
+            for st, props in rows
+        ],
+        score=0,
+        detail=detail,
+    )
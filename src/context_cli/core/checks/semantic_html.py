@@ -18,12 +18,18 @@ ARIA_LANDMARK_ROLES = frozenset({
 })
 
 
-def check_semantic_html(html: str) -> SemanticHtmlReport:
-    """Evaluate semantic HTML quality from pre-fetched HTML content."""
+def check_semantic_html(
+    html: str, *, soup: BeautifulSoup | None = None
+) -> SemanticHtmlReport:
+    """Evaluate semantic HTML quality from pre-fetched HTML content.
+
+    Pass *soup* (a parse of *html*) to reuse a tree shared with other checks.
+    """
     if not html:
         return SemanticHtmlReport(detail="No HTML to analyze")
 
-    soup = BeautifulSoup(html, "html.parser")
+    if soup is None:
+        soup = BeautifulSoup(html, "html.parser")
 
     has_main = soup.find("main") is not None
     has_article = soup.find("article") is not None
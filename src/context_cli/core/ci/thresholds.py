@@ -5,12 +5,18 @@ from __future__ import annotations
 from context_cli.core.models import (
     AuditReport,
     PillarThresholds,
+    RobotsReport,
     SiteAuditReport,
     ThresholdFailure,
     ThresholdResult,
 )
 
 
+def has_blocked_bots(robots: RobotsReport) -> bool:
+    """Return True if robots.txt was found and blocks at least one checked bot."""
+    return robots.found and any(not b.allowed for b in robots.bots)
+
+
 def check_thresholds(
     report: AuditReport | SiteAuditReport,
     thresholds: PillarThresholds,
@@ -64,10 +70,9 @@ def check_thresholds(
         )
 
     # Require bot access: fail if any AI bot is blocked
-    if thresholds.require_bot_access and report.robots.found:
-        if any(not b.allowed for b in report.robots.bots):
-            failures.append(
-                ThresholdFailure(pillar="bot_access_required", actual=0, minimum=1)
-            )
+    if thresholds.require_bot_access and has_blocked_bots(report.robots):
+        failures.append(
+            ThresholdFailure(pillar="bot_access_required", actual=0, minimum=1)
+        )
 
     return ThresholdResult(passed=len(failures) == 0, failures=failures)
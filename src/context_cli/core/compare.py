@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 
-from context_cli.core.auditor import audit_url
+from context_cli.core.auditor import audit_url, create_audit_client
 from context_cli.core.models import AuditReport, CompareReport, PillarDelta
 from context_cli.core.scoring import CONTENT_MAX, LLMS_TXT_MAX, ROBOTS_MAX, SCHEMA_MAX
 
@@ -65,9 +65,13 @@ async def compare_urls(
     timeout: int = 15,
     bots: list[str] | None = None,
 ) -> CompareReport:
-    """Run audits on two URLs concurrently and return a comparison report."""
-    report_a, report_b = await asyncio.gather(
-        audit_url(url_a, timeout=timeout, bots=bots),
-        audit_url(url_b, timeout=timeout, bots=bots),
-    )
+    """Run audits on two URLs concurrently and return a comparison report.
+
+    Both audits share one pooled HTTP client.
+    """
+    async with create_audit_client(timeout) as client:
+        report_a, report_b = await asyncio.gather(
+            audit_url(url_a, timeout=timeout, bots=bots, client=client),
+            audit_url(url_b, timeout=timeout, bots=bots, client=client),
+        )
     return build_compare_report(url_a, url_b, report_a, report_b)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import stat
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -46,13 +48,24 @@ def load_config(
 
     for directory in search_dirs:
         config_path = directory / _CONFIG_FILENAME
-        if config_path.is_file():
-            try:
-                raw = yaml.safe_load(config_path.read_text())
-            except Exception:
-                return ContextConfig()
-            if not isinstance(raw, dict):
-                return ContextConfig()
-            return ContextConfig(**raw)
+        try:
+            st = config_path.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            cfg = _parse_config_file(str(config_path), st.st_mtime_ns, st.st_size)
+            return cfg.model_copy(deep=True)
 
     return ContextConfig()
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> ContextConfig:
+    """Parse a config file; memoized on its mtime/size so edits invalidate it."""
+    try:
+        raw = yaml.safe_load(Path(path).read_text())
+    except Exception:
+        return ContextConfig()
+    if not isinstance(raw, dict):
+        return ContextConfig()
+    return ContextConfig(**raw)
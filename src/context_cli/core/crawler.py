@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urldefrag, urljoin, urlparse
@@ -130,6 +131,7 @@ async def extract_pages(
     max_concurrent: int = 3,
     delay_seconds: float = 1.0,
     per_page_timeout: float = 15.0,
+    on_result: Callable[[int, CrawlResult], None] | None = None,
 ) -> list[CrawlResult]:
     """Crawl multiple URLs concurrently with rate limiting.
 
@@ -138,6 +140,8 @@ async def extract_pages(
         max_concurrent: Maximum number of simultaneous crawls.
         delay_seconds: Staggered delay between task launches.
         per_page_timeout: Timeout in seconds for each individual page crawl.
+        on_result: Called with ``(index, result)`` as each crawl finishes, so
+            callers can start processing a page while the others are in flight.
 
     Returns:
         List of CrawlResult in the same order as input urls.
@@ -153,29 +157,25 @@ async def extract_pages(
                 result = await asyncio.wait_for(
                     extract_page(url), timeout=per_page_timeout
                 )
-                return (index, result)
             except asyncio.TimeoutError:
-                return (
-                    index,
-                    CrawlResult(
-                        url=url,
-                        html="",
-                        markdown="",
-                        success=False,
-                        error=f"Timed out after {per_page_timeout}s",
-                    ),
+                result = CrawlResult(
+                    url=url,
+                    html="",
+                    markdown="",
+                    success=False,
+                    error=f"Timed out after {per_page_timeout}s",
                 )
             except Exception as e:
-                return (
-                    index,
-                    CrawlResult(
-                        url=url,
-                        html="",
-                        markdown="",
-                        success=False,
-                        error=str(e),
-                    ),
+                result = CrawlResult(
+                    url=url,
+                    html="",
+                    markdown="",
+                    success=False,
+                    error=str(e),
                 )
+        if on_result is not None:
+            on_result(index, result)
+        return (index, result)
 
     tasks = [_crawl_one(i, url) for i, url in enumerate(urls)]
     completed = await asyncio.gather(*tasks)
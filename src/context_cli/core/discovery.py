@@ -5,10 +5,11 @@ from __future__ import annotations
 import random
 import xml.etree.ElementTree as ET
 from collections import defaultdict
+from collections.abc import Awaitable
 from urllib.parse import urlparse
-from urllib.robotparser import RobotFileParser
 
 import httpx
+from protego import Protego
 
 from context_cli.core.models import DiscoveryResult
 
@@ -176,10 +177,9 @@ def select_diverse_pages(
 
 def _filter_by_robots(urls: list[str], robots_txt: str, base_url: str) -> list[str]:
     """Remove URLs that are blocked for GPTBot in robots.txt."""
-    rp = RobotFileParser()
-    rp.parse(robots_txt.splitlines())
+    rp = Protego.parse(robots_txt)
 
-    return [url for url in urls if rp.can_fetch("GPTBot", url)]
+    return [url for url in urls if rp.can_fetch(url, "GPTBot")]
 
 
 # ── Main discovery entrypoint ────────────────────────────────────────────────
@@ -192,9 +192,15 @@ async def discover_pages(
     max_pages: int = 10,
     robots_txt: str | None = None,
     seed_links: list[str] | None = None,
+    site_inputs: Awaitable[tuple[str | None, list[str] | None]] | None = None,
 ) -> DiscoveryResult:
     """Discover pages to audit starting from *seed_url*.
 
+    *site_inputs*, if given, resolves to ``(robots_txt, seed_links)`` in place
+    of those arguments. It is awaited only once the sitemap has been fetched,
+    so callers can start discovery before the robots.txt check and the seed
+    crawl have finished.
+
     Strategy:
         1. Try sitemap discovery via :func:`fetch_sitemap_urls`.
         2. If no sitemap URLs found, fall back to *seed_links* (internal links
@@ -214,6 +220,9 @@ async def discover_pages(
         errors.append(f"Sitemap fetch error: {exc}")
         sitemap_urls = []
 
+    if site_inputs is not None:
+        robots_txt, seed_links = await site_inputs
+
     # Step 2: Fallback to spider links
     if not sitemap_urls:
         method = "spider"
@@ -105,10 +105,14 @@ class HistoryDB:
 
     def get_latest_report(self, url: str) -> AuditReport | None:
         """Get the most recent full report for a URL."""
-        latest = self.get_latest(url)
-        if latest is None:
+        row = self._conn.execute(
+            """SELECT report_json FROM audits
+               WHERE url = ? ORDER BY timestamp DESC LIMIT 1""",
+            (url,),
+        ).fetchone()
+        if row is None:
             return None
-        return self.get_report(latest.id)
+        return AuditReport.model_validate_json(row["report_json"])
 
     def delete_url(self, url: str) -> int:
         """Delete all entries for a URL. Returns the number of rows deleted."""
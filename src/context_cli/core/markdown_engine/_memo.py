@@ -0,0 +1,60 @@
+"""Small content-addressed LRU caches for the pure markdown pipeline stages."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+CONTENT_CACHE_SIZE: int = 64
+"""Default number of results kept per pipeline stage."""
+
+_caches: list[ContentCache] = []
+
+
+def content_key(html: str) -> bytes:
+    """Return a 128-bit BLAKE2b digest of *html*, used in place of the text itself."""
+    return hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class ContentCache:
+    """Bounded LRU of string results keyed by a digest of the input HTML.
+
+    Keying on the digest rather than the HTML keeps large documents from
+    being pinned in memory by the cache. *extra* distinguishes calls on the
+    same HTML whose output also depends on configuration.
+    """
+
+    def __init__(self, maxsize: int = CONTENT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._results: OrderedDict[tuple[bytes, Hashable], str] = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.append(self)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._results.clear()
+
+    def get(self, html: str, compute: Callable[[], str], extra: Hashable = None) -> str:
+        """Return the cached result for *html*, running *compute* on a miss."""
+        key = (content_key(html), extra)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+
+        result = compute()
+        with self._lock:
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+
+def clear_content_caches() -> None:
+    """Drop the cached results of every markdown pipeline stage."""
+    for cache in _caches:
+        cache.clear()
@@ -1,6 +1,6 @@
 """Configuration model for the markdown conversion pipeline."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class MarkdownEngineConfig(BaseModel):
@@ -38,6 +38,7 @@ class MarkdownEngineConfig(BaseModel):
             "cookieConsent",
         ],
         description="CSS class/id patterns for cookie banners",
+        validate_default=True,
     )
     ad_patterns: list[str] = Field(
         default_factory=lambda: [
@@ -51,4 +52,11 @@ class MarkdownEngineConfig(BaseModel):
             "gpt-ad",
         ],
         description="CSS class/id patterns for ad containers",
+        validate_default=True,
     )
+
+    @field_validator("cookie_banner_patterns", "ad_patterns")
+    @classmethod
+    def _normalize_patterns(cls, patterns: list[str]) -> list[str]:
+        """Lower-case and de-duplicate patterns; they match case-insensitively."""
+        return list(dict.fromkeys(p.lower() for p in patterns))
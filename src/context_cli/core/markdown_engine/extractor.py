@@ -8,6 +8,10 @@ from __future__ import annotations
 from bs4 import BeautifulSoup
 from readabilipy import simple_json_from_html_string
 
+from context_cli.core.markdown_engine._memo import ContentCache
+
+_extracted = ContentCache()
+
 
 def extract_content(html: str) -> str:
     """Extract main content from HTML using readability algorithm.
@@ -20,6 +24,8 @@ def extract_content(html: str) -> str:
     5. Fallback to <body> element
     6. Return original HTML if all fallbacks fail
 
+    Results are memoized by a digest of *html*.
+
     Args:
         html: Raw HTML string to extract content from.
 
@@ -28,7 +34,11 @@ def extract_content(html: str) -> str:
     """
     if not html or not html.strip():
         return ""
+    return _extracted.get(html, lambda: _extract(html))
+
 
+def _extract(html: str) -> str:
+    """Run the extraction strategies of :func:`extract_content` on *html*."""
     # Try readabilipy first (pure Python mode, no Node.js needed)
     try:
         result = simple_json_from_html_string(html, use_readability=False)
@@ -1,87 +1,133 @@
 """HTML sanitizer that strips boilerplate elements before markdown conversion."""
 
-from bs4 import BeautifulSoup, Tag
+from __future__ import annotations
 
+import re
+from functools import lru_cache
+
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from context_cli.core.markdown_engine._memo import ContentCache
 from context_cli.core.markdown_engine.config import MarkdownEngineConfig
 
+# Always removed, regardless of configuration
+_ALWAYS_DROP_TAGS = frozenset({"noscript", "iframe"})
+
+_sanitized = ContentCache()
+
 
 def _is_display_none(v: str | None) -> bool:
     """Check if a style attribute contains display:none."""
     return bool(v and "display:none" in str(v).replace(" ", "").lower())
 
 
+def _drop_tags(cfg: MarkdownEngineConfig) -> frozenset[str]:
+    """Return the tag names removed under *cfg*."""
+    flags = {
+        "script": cfg.strip_scripts,
+        "style": cfg.strip_styles,
+        "nav": cfg.strip_nav,
+        "footer": cfg.strip_footer,
+        "header": cfg.strip_header,
+    }
+    return _ALWAYS_DROP_TAGS.union(tag for tag, enabled in flags.items() if enabled)
+
+
 def sanitize_html(
     html: str, config: MarkdownEngineConfig | None = None
 ) -> str:
     """Strip boilerplate elements from HTML, leaving main content.
 
     Removes scripts, styles, nav, footer, cookie banners, and ads
-    based on configuration patterns.
+    based on configuration patterns. The document is parsed once with lexbor;
+    one CSS query (matched in C) collects the candidate elements, and only
+    those are checked in Python. Results are memoized by a digest of *html*
+    and the effective configuration, so re-sanitizing a page is a lookup.
     """
     if not html:
         return ""
 
     cfg = config or MarkdownEngineConfig()
-    soup = BeautifulSoup(html, "html.parser")
-
-    # 1. Remove script and style elements
-    if cfg.strip_scripts:
-        for tag in soup.find_all("script"):
-            tag.decompose()
-    if cfg.strip_styles:
-        for tag in soup.find_all("style"):
-            tag.decompose()
-
-    # 2. Remove structural boilerplate
-    if cfg.strip_nav:
-        for tag in soup.find_all("nav"):
-            tag.decompose()
-    if cfg.strip_footer:
-        for tag in soup.find_all("footer"):
-            tag.decompose()
-    if cfg.strip_header:
-        for tag in soup.find_all("header"):
-            tag.decompose()
-
-    # 3. Remove cookie banners (match on id/class containing patterns)
+    drop_tags = _drop_tags(cfg)
+    patterns: tuple[str, ...] = ()
     if cfg.strip_cookie_banners:
-        _remove_by_patterns(soup, cfg.cookie_banner_patterns)
-
-    # 4. Remove ad containers
+        patterns += tuple(cfg.cookie_banner_patterns)
     if cfg.strip_ads:
-        _remove_by_patterns(soup, cfg.ad_patterns)
-
-    # 5. Remove hidden elements
-    for tag in soup.find_all(attrs={"aria-hidden": "true"}):
-        if isinstance(tag, Tag):
-            tag.decompose()
-    for tag in soup.find_all(
-        attrs={"style": _is_display_none}
-    ):
-        if isinstance(tag, Tag):
-            tag.decompose()
-
-    # 6. Remove common boilerplate elements (noscript, iframe)
-    for tag_name in ["noscript", "iframe"]:
-        for tag in soup.find_all(tag_name):
-            tag.decompose()
-
-    return str(soup)
-
-
-def _remove_by_patterns(
-    soup: BeautifulSoup, patterns: list[str]
-) -> None:
-    """Remove elements whose id or class matches any of the given patterns."""
-    for tag in soup.find_all(True):
-        # Skip already-decomposed tags (parent was removed earlier in this loop)
-        if not isinstance(tag, Tag) or tag.attrs is None:
-            continue
-        tag_id = str(tag.get("id") or "")
-        cls = tag.get("class")
-        tag_classes = " ".join(cls) if isinstance(cls, list) else ""
-        combined = f"{tag_id} {tag_classes}".lower()
+        patterns += tuple(cfg.ad_patterns)
+    return _sanitized.get(
+        html, lambda: _sanitize(html, drop_tags, patterns), extra=(drop_tags, patterns)
+    )
+
+
+def _sanitize(html: str, drop_tags: frozenset[str], patterns: tuple[str, ...]) -> str:
+    """Remove *drop_tags* and elements whose id or class contains a pattern."""
+    matcher = _compile_patterns(patterns) if patterns else None
+    tree = LexborHTMLParser(html)
+    seen: set[int] = set()
+    doomed: list[LexborNode] = []
+    for node in tree.css(_candidate_selector(drop_tags, patterns)):
+        # A node matching several selectors is listed once per match
+        if node.mem_id not in seen:
+            seen.add(node.mem_id)
+            if _should_drop(node, drop_tags, matcher):
+                doomed.append(node)
+
+    # Matches come in document order, so removing in reverse frees every
+    # nested match before the ancestor that contains it
+    for node in reversed(doomed):
+        node.decompose()
+    return tree.html or ""
+
+
+@lru_cache(maxsize=16)
+def _candidate_selector(drop_tags: frozenset[str], patterns: tuple[str, ...]) -> str:
+    """Build a CSS selector matching every element _should_drop could remove.
+
+    Substring patterns become case-insensitive ``*=`` attribute selectors.
+    Patterns with whitespace or non-ASCII characters cannot be expressed that
+    way (class whitespace is normalized, ``i`` only folds ASCII), so they
+    widen the query to every element with an id or class.
+    """
+    parts = [*sorted(drop_tags), '[aria-hidden="true"]', "[style]"]
+    if any(not p.isascii() or any(c.isspace() for c in p) for p in patterns):
+        parts += ["[id]", "[class]"]
+    else:
         for pattern in patterns:
-            if pattern.lower() in combined:
-                tag.decompose()
-                break
+            quoted = pattern.replace("\\", "\\\\").replace('"', '\\"')
+            parts += [f'[id*="{quoted}" i]', f'[class*="{quoted}" i]']
+    return ", ".join(parts)
+
+
+def _should_drop(
+    node: LexborNode, drop_tags: frozenset[str], matcher: re.Pattern[str] | None
+) -> bool:
+    """Decide whether *node* (and its subtree) is boilerplate."""
+    if node.tag in drop_tags:
+        return True
+    attrs = node.attributes
+    if attrs.get("aria-hidden") == "true" or _is_display_none(attrs.get("style")):
+        return True
+    return _matches_patterns(attrs, matcher)
+
+
+@lru_cache(maxsize=16)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile substring *patterns* into one alternation, scanned once per string.
+
+    Patterns are lower-cased here, once per distinct pattern set, to match the
+    lower-cased id/class text. The config normalizes them already, but lists
+    mutated after construction bypass its validator.
+    """
+    return re.compile("|".join(re.escape(p.lower()) for p in patterns))
+
+
+def _matches_patterns(attrs: dict[str, str | None], matcher: re.Pattern[str] | None) -> bool:
+    """Return True if the element's lower-cased id or class contains a pattern."""
+    if matcher is None:
+        return False
+    tag_id = attrs.get("id") or ""
+    tag_classes = " ".join((attrs.get("class") or "").split())
+    if not (tag_id or tag_classes):
+        return False
+    combined = f"{tag_id} {tag_classes}".lower()
+    return matcher.search(combined) is not None
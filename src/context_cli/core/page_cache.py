@@ -0,0 +1,161 @@
+"""On-disk cache of per-page analysis, keyed by a hash of the page content."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from contextlib import suppress
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from context_cli import __version__
+from context_cli.core.models import ContentReport, SchemaReport
+
+# Default cache location (alongside history.db)
+DEFAULT_CACHE_DIR = Path.home() / ".context-cli" / "cache" / "pages"
+
+PAGE_CACHE_MAX_ENTRIES: int = 2000
+"""Default number of pages kept; the least recently used are pruned on write."""
+
+# Temp files older than this were left by an interrupted write, not one in progress
+_STALE_TMP_SECONDS = 3600.0
+
+
+class _CachedPage(BaseModel):
+    """Serialized page-level check results."""
+
+    schema_org: SchemaReport = Field(description="Unscored Schema.org report")
+    content: ContentReport = Field(description="Unscored content report")
+
+
+def page_cache_key(html: str, markdown: str) -> str:
+    """Return the cache key for a crawled page.
+
+    The package version is part of the key so results computed by an older
+    version of the checks are never reused.
+    """
+    h = hashlib.sha256()
+    for part in (__version__, html, markdown):
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class PageCache:
+    """Cache of schema/content check results for byte-identical pages.
+
+    Re-auditing an unchanged page skips JSON-LD parsing and markdown analysis.
+    Site-wide checks (robots.txt, llms.txt, ...) are never cached here. Read
+    and write failures degrade to cache misses. Roughly *max_entries* pages
+    are kept; hits refresh an entry's mtime, and writes prune the entries
+    used longest ago, including any left behind by older versions. The
+    directory is only scanned on the first write and once the entries
+    written since exceed the cap by a tenth, so pruning is amortized.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        max_entries: int = PAGE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        self.max_entries = max_entries
+        self._count: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> tuple[SchemaReport, ContentReport] | None:
+        """Return cached (schema, content) reports for *key*, or None on a miss."""
+        path = self._path(key)
+        try:
+            page = _CachedPage.model_validate_json(path.read_bytes())
+        except (OSError, ValidationError):
+            return None
+        with suppress(OSError):
+            os.utime(path)
+        return page.schema_org, page.content
+
+    def set(self, key: str, schema_org: SchemaReport, content: ContentReport) -> None:
+        """Store reports for *key*, writing atomically so readers never see partial files."""
+        data = _CachedPage(schema_org=schema_org, content=content).model_dump_json()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per write: pages with identical content share
+            # a key and may be stored from several worker threads at once
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            with suppress(OSError):
+                os.unlink(tmp)
+            return
+        self._note_write()
+
+    def _entries(self) -> list[Path]:
+        try:
+            return list(self.cache_dir.glob("*.json"))
+        except OSError:
+            return []
+
+    def _remove_temp_files(self, older_than: float | None = None) -> None:
+        """Delete leftover temp files, or only those last modified before *older_than*."""
+        try:
+            temps = list(self.cache_dir.glob("*.tmp"))
+        except OSError:
+            return
+        for tmp in temps:
+            with suppress(OSError):
+                if older_than is None or tmp.stat().st_mtime < older_than:
+                    tmp.unlink()
+
+    def _note_write(self) -> None:
+        """Count a stored entry, pruning once the count passes the cap plus slack.
+
+        The first write of this instance scans the directory for the real
+        count and sweeps stale temp files; later writes only increment it
+        (overwrites are over-counted, which merely prunes a little early).
+        """
+        if self._count is None:
+            self._remove_temp_files(older_than=time.time() - _STALE_TMP_SECONDS)
+            self._count = len(self._entries())
+        else:
+            self._count += 1
+        if self._count > self.max_entries + self.max_entries // 10:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Delete the least recently used entries beyond *max_entries*."""
+        entries = self._entries()
+        self._count = min(len(entries), self.max_entries)
+        if len(entries) <= self.max_entries:
+            return
+        dated: list[tuple[float, Path]] = []
+        for entry in entries:
+            with suppress(OSError):
+                dated.append((entry.stat().st_mtime, entry))
+        dated.sort()
+        for _, entry in dated[: len(dated) - self.max_entries]:
+            with suppress(OSError):
+                entry.unlink()
+
+    def clear(self) -> int:
+        """Delete every cached page and return how many were removed.
+
+        Leftover temp files are deleted too but not counted.
+        """
+        self._remove_temp_files()
+        self._count = None
+        removed = 0
+        for entry in self._entries():
+            with suppress(OSError):
+                entry.unlink()
+                removed += 1
+        return removed
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Callable
+
 from context_cli.core.models import (
     AgentReadinessReport,
     ContentReport,
@@ -24,13 +27,20 @@ CONTENT_WORD_TIERS: list[tuple[int, int]] = [
 ]
 """(min_words, base_score) — evaluated top-down, first match wins."""
 
+# Ascending tier minimums and the base score for each bisect_right position,
+# so a word count maps to its tier in one lookup (0 below the lowest tier).
+_TIER_MINS: list[int] = sorted(min_words for min_words, _ in CONTENT_WORD_TIERS)
+_TIER_SCORES: list[int] = [0] + [score for _, score in sorted(CONTENT_WORD_TIERS)]
+
 CONTENT_HEADING_BONUS: int = 7
 CONTENT_LIST_BONUS: int = 5
 CONTENT_CODE_BONUS: int = 3
 CONTENT_MAX: int = 40
 
 SCHEMA_BASE_SCORE: int = 8
-HIGH_VALUE_TYPES: set[str] = {"FAQPage", "HowTo", "Article", "Product", "Recipe"}
+HIGH_VALUE_TYPES: frozenset[str] = frozenset(
+    {"FAQPage", "HowTo", "Article", "Product", "Recipe"}
+)
 SCHEMA_HIGH_VALUE_BONUS: int = 5
 SCHEMA_STANDARD_BONUS: int = 3
 SCHEMA_MAX: int = 25
@@ -75,46 +85,32 @@ def compute_agent_readiness(report: AgentReadinessReport) -> AgentReadinessRepor
     return report
 
 
-def compute_scores(
-    robots: RobotsReport,
-    llms_txt: LlmsTxtReport,
-    schema_org: SchemaReport,
-    content: ContentReport,
-    *,
-    scoring_version: str = "v2",
-    agent_readiness: AgentReadinessReport | None = None,
-) -> tuple[RobotsReport, LlmsTxtReport, SchemaReport, ContentReport, float]:
-    """Compute scores for each pillar and overall Readiness Score.
-
-    Scoring weights (V2, default):
-        Content (max 40): most impactful — what LLMs actually extract and cite
-        Schema  (max 25): structured signals help LLMs understand page entities
-        Robots  (max 25): gatekeeper — blocked bots can't crawl at all
-        llms.txt (max 10): forward-looking signal, minimal real impact today
-
-    V3 scoring (opt-in via scoring_version="v3"):
-        Content (max 35): rescaled from V2
-        Robots  (max 20): rescaled from V2
-        Schema  (max 20): rescaled from V2
-        Agent Readiness (max 20): new pillar for agent-era signals
-        llms.txt (max 5): rescaled from V2
-    """
-    # Robots: max ROBOTS_MAX — proportional to bots allowed
+def score_robots(robots: RobotsReport) -> RobotsReport:
+    """Score the robots pillar (max ROBOTS_MAX) in place: proportional to bots allowed."""
     if robots.found and robots.bots:
         allowed = sum(1 for b in robots.bots if b.allowed)
         robots.score = round(ROBOTS_MAX * allowed / len(robots.bots), 1)
     else:
         robots.score = 0
+    return robots
 
-    # llms.txt: max LLMS_TXT_MAX — either llms.txt or llms-full.txt qualifies
+
+def score_llms_txt(llms_txt: LlmsTxtReport) -> LlmsTxtReport:
+    """Score the llms.txt pillar (max LLMS_TXT_MAX) in place.
+
+    Either llms.txt or llms-full.txt qualifies.
+    """
     llms_txt.score = (
         LLMS_TXT_MAX if (llms_txt.found or llms_txt.llms_full_found) else 0
     )
+    return llms_txt
 
-    # Schema: max SCHEMA_MAX — reward high-value types more
+
+def score_schema(schema_org: SchemaReport) -> SchemaReport:
+    """Score the schema pillar (max SCHEMA_MAX) in place, rewarding high-value types."""
     if schema_org.blocks_found > 0:
         unique_types = {s.schema_type for s in schema_org.schemas}
-        high = sum(1 for t in unique_types if t in HIGH_VALUE_TYPES)
+        high = len(unique_types & HIGH_VALUE_TYPES)
         std = len(unique_types) - high
         schema_org.score = min(
             SCHEMA_MAX,
@@ -122,13 +118,15 @@ def compute_scores(
         )
     else:
         schema_org.score = 0
+    return schema_org
+
+
+def score_content(content: ContentReport) -> ContentReport:
+    """Score the content pillar (max CONTENT_MAX) in place.
 
-    # Content: max CONTENT_MAX — word count tiers + structure bonuses
-    score = 0
-    for min_words, tier_score in CONTENT_WORD_TIERS:
-        if content.word_count >= min_words:
-            score = tier_score
-            break
+    Word count tiers plus structure bonuses.
+    """
+    score = _TIER_SCORES[bisect_right(_TIER_MINS, content.word_count)]
     if content.has_headings:
         score += CONTENT_HEADING_BONUS
     if content.has_lists:
@@ -136,6 +134,37 @@ def compute_scores(
     if content.has_code_blocks:
         score += CONTENT_CODE_BONUS
     content.score = min(CONTENT_MAX, score)
+    return content
+
+
+def compute_scores(
+    robots: RobotsReport,
+    llms_txt: LlmsTxtReport,
+    schema_org: SchemaReport,
+    content: ContentReport,
+    *,
+    scoring_version: str = "v2",
+    agent_readiness: AgentReadinessReport | None = None,
+) -> tuple[RobotsReport, LlmsTxtReport, SchemaReport, ContentReport, float]:
+    """Compute scores for each pillar and overall Readiness Score.
+
+    Scoring weights (V2, default):
+        Content (max 40): most impactful — what LLMs actually extract and cite
+        Schema  (max 25): structured signals help LLMs understand page entities
+        Robots  (max 25): gatekeeper — blocked bots can't crawl at all
+        llms.txt (max 10): forward-looking signal, minimal real impact today
+
+    V3 scoring (opt-in via scoring_version="v3"):
+        Content (max 35): rescaled from V2
+        Robots  (max 20): rescaled from V2
+        Schema  (max 20): rescaled from V2
+        Agent Readiness (max 20): new pillar for agent-era signals
+        llms.txt (max 5): rescaled from V2
+    """
+    score_robots(robots)
+    score_llms_txt(llms_txt)
+    score_schema(schema_org)
+    score_content(content)
 
     if scoring_version == "v3":
         # Scale V2 raw scores to V3 maximums proportionally
@@ -225,21 +254,13 @@ def _generate_diagnostics(
     return diagnostics
 
 
-def compute_lint_results(
-    robots: RobotsReport,
-    llms_txt: LlmsTxtReport,
-    schema_org: SchemaReport,
+def _ai_primitives_check(
+    robots: RobotsReport, llms_txt: LlmsTxtReport, schema_org: SchemaReport,
     content: ContentReport,
-    *,
-    scoring_version: str = "v2",
-    agent_readiness: AgentReadinessReport | None = None,
-) -> LintResult:
-    """Compute pass/fail checks, token waste metrics, and diagnostics."""
-    checks: list[LintCheck] = []
-
-    # AI Primitives check
+) -> LintCheck:
+    """Pass when llms.txt or llms-full.txt is published."""
     ai_prim_pass = llms_txt.found or llms_txt.llms_full_found
-    checks.append(LintCheck(
+    return LintCheck(
         name="AI Primitives",
         passed=ai_prim_pass,
         severity="pass" if ai_prim_pass else "fail",
@@ -247,9 +268,14 @@ def compute_lint_results(
             f"llms.txt found at {llms_txt.url}" if ai_prim_pass and llms_txt.url
             else ("llms.txt found" if ai_prim_pass else "No llms.txt found")
         ),
-    ))
+    )
+
 
-    # Bot Access check
+def _bot_access_check(
+    robots: RobotsReport, llms_txt: LlmsTxtReport, schema_org: SchemaReport,
+    content: ContentReport,
+) -> LintCheck:
+    """Fail when robots.txt blocks any AI bot; pass without a robots.txt."""
     bot_pass = True
     bot_detail = "No robots.txt found"
     bot_severity = "pass"
@@ -262,24 +288,34 @@ def compute_lint_results(
         if blocked:
             bot_detail += f" ({', '.join(blocked[:3])} blocked)"
             bot_severity = "fail"
-    checks.append(LintCheck(
+    return LintCheck(
         name="Bot Access", passed=bot_pass, severity=bot_severity, detail=bot_detail,
-    ))
+    )
+
 
-    # Data Structuring check
+def _data_structuring_check(
+    robots: RobotsReport, llms_txt: LlmsTxtReport, schema_org: SchemaReport,
+    content: ContentReport,
+) -> LintCheck:
+    """Pass when the page carries at least one JSON-LD block."""
     schema_pass = schema_org.blocks_found > 0
     schema_detail = f"{schema_org.blocks_found} JSON-LD blocks"
     if schema_org.schemas:
         types_found = [s.schema_type for s in schema_org.schemas]
         schema_detail += f" ({', '.join(types_found[:3])})"
-    checks.append(LintCheck(
+    return LintCheck(
         name="Data Structuring",
         passed=schema_pass,
         severity="pass" if schema_pass else "fail",
         detail=schema_detail,
-    ))
+    )
+
 
-    # Token Efficiency check — uses warn for 30-70%, fail for >70%
+def _token_efficiency_check(
+    robots: RobotsReport, llms_txt: LlmsTxtReport, schema_org: SchemaReport,
+    content: ContentReport,
+) -> LintCheck:
+    """Grade context waste: warn for 30-70%, fail for >70%."""
     waste = content.context_waste_pct
     eff_pass = waste < 70
     if waste < 30:
@@ -294,9 +330,33 @@ def compute_lint_results(
             f" ({content.estimated_raw_tokens:,} raw"
             f" \u2192 {content.estimated_clean_tokens:,} clean tokens)"
         )
-    checks.append(LintCheck(
+    return LintCheck(
         name="Token Efficiency", passed=eff_pass, severity=eff_severity, detail=eff_detail,
-    ))
+    )
+
+
+# Builders for the checks every lint result carries, in display order
+_LINT_CHECKS: tuple[
+    Callable[[RobotsReport, LlmsTxtReport, SchemaReport, ContentReport], LintCheck], ...
+] = (
+    _ai_primitives_check,
+    _bot_access_check,
+    _data_structuring_check,
+    _token_efficiency_check,
+)
+
+
+def compute_lint_results(
+    robots: RobotsReport,
+    llms_txt: LlmsTxtReport,
+    schema_org: SchemaReport,
+    content: ContentReport,
+    *,
+    scoring_version: str = "v2",
+    agent_readiness: AgentReadinessReport | None = None,
+) -> LintResult:
+    """Compute pass/fail checks, token waste metrics, and diagnostics."""
+    checks = [build(robots, llms_txt, schema_org, content) for build in _LINT_CHECKS]
 
     # V3: Agent Readiness check
     if scoring_version == "v3" and agent_readiness is not None:
@@ -312,7 +372,7 @@ def compute_lint_results(
 
     return LintResult(
         checks=checks,
-        context_waste_pct=waste,
+        context_waste_pct=content.context_waste_pct,
         raw_tokens=content.estimated_raw_tokens,
         clean_tokens=content.estimated_clean_tokens,
         passed=all(c.passed for c in checks),
@@ -8,14 +8,39 @@ are passed through unchanged.
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, replace
+
 import httpx
 from aiohttp import web
 
 from context_cli.core.markdown_engine import convert_html_to_markdown
 
+# uvloop (the [fast] extra; not available on Windows) runs the proxy's event
+# loop on libuv, which handles many concurrent connections with less overhead.
+try:
+    from uvloop import new_event_loop as _new_event_loop
+except ImportError:  # pragma: no cover — exercised only without the [fast] extra
+    from asyncio import new_event_loop as _new_event_loop
+
 _MARKDOWN_CONTENT_TYPE = "text/markdown; charset=utf-8"
 _SOURCE_HEADER = "X-Content-Source"
 _SOURCE_VALUE = "markdown-proxy"
+_UPSTREAM_TIMEOUT = 30
+_UPSTREAM_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+# HTTP/2 needs h2 (the [fast] extra). With it, concurrent proxied requests to
+# an HTTPS upstream are multiplexed over one connection instead of each
+# holding its own.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_MD_CACHE_SIZE = 1024
+_MD_CACHE_TTL = 300.0
+
+# (status, encoded markdown body, response headers) of a converted page
+_Converted = tuple[int, bytes, dict[str, str]]
 _HOP_BY_HOP = frozenset({
     "connection",
     "keep-alive",
@@ -30,6 +55,97 @@ _HOP_BY_HOP = frozenset({
 })
 
 
+@dataclass(frozen=True)
+class _CachedMarkdown:
+    """An encoded markdown conversion and the upstream validators it was made from."""
+
+    body: bytes
+    headers: dict[str, str]
+    validators: dict[str, str]
+    stored_at: float
+
+
+class _MarkdownCache:
+    """Bounded LRU of markdown conversions keyed by upstream URL.
+
+    Entries are only kept for responses carrying an ``ETag`` or
+    ``Last-Modified`` validator, and expire after *ttl* seconds. Responses
+    marked ``Cache-Control: no-store`` or ``private`` are never kept, and
+    ``Set-Cookie`` is dropped from stored headers so one client's cookies are
+    not replayed to another. A hit is not served blindly: its validators turn
+    the next upstream fetch into a conditional request, and the cached
+    markdown is used (and its TTL restarted) on ``304``.
+    """
+
+    def __init__(self, maxsize: int = _MD_CACHE_SIZE, ttl: float = _MD_CACHE_TTL) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, _CachedMarkdown] = OrderedDict()
+
+    def get(self, url: str) -> _CachedMarkdown | None:
+        """Return the live entry for *url*, or None."""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at >= self.ttl:
+            del self._entries[url]
+            return None
+        self._entries.move_to_end(url)
+        return entry
+
+    def set(self, url: str, body: bytes, headers: dict[str, str], upstream: httpx.Headers) -> None:
+        """Store *body* for *url* if the *upstream* headers allow shared revalidation."""
+        validators = _validators(upstream)
+        if not validators or not _is_shareable(upstream):
+            self._entries.pop(url, None)
+            return
+        self._store(url, _CachedMarkdown(
+            body, _shared_headers(headers), validators, time.monotonic()
+        ))
+
+    def refresh(self, url: str, entry: _CachedMarkdown, upstream: httpx.Headers) -> None:
+        """Restart *entry*'s TTL after the upstream answered ``304`` for *url*.
+
+        Validators sent with the ``304`` replace the stored ones.
+        """
+        self._store(url, replace(
+            entry,
+            validators={**entry.validators, **_validators(upstream)},
+            stored_at=time.monotonic(),
+        ))
+
+    def _store(self, url: str, entry: _CachedMarkdown) -> None:
+        """Insert *entry* as the most recently used, evicting past ``maxsize``."""
+        self._entries[url] = entry
+        self._entries.move_to_end(url)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _validators(headers: httpx.Headers) -> dict[str, str]:
+    """Map upstream ``ETag``/``Last-Modified`` to conditional request headers."""
+    conditional: dict[str, str] = {}
+    if etag := headers.get("etag"):
+        conditional["If-None-Match"] = etag
+    if last_modified := headers.get("last-modified"):
+        conditional["If-Modified-Since"] = last_modified
+    return conditional
+
+
+def _is_shareable(headers: httpx.Headers) -> bool:
+    """Return False if upstream ``Cache-Control`` forbids serving the response to others."""
+    directives = {
+        d.split("=", 1)[0].strip().lower()
+        for d in headers.get("cache-control", "").split(",")
+    }
+    return directives.isdisjoint({"no-store", "private"})
+
+
+def _shared_headers(headers: dict[str, str]) -> dict[str, str]:
+    """Return *headers* without ``Set-Cookie``, for serving to other clients."""
+    return {k: v for k, v in headers.items() if k != "set-cookie"}
+
+
 def _wants_markdown(request: web.Request) -> bool:
     """Return True if the client indicated it accepts text/markdown."""
     accept = request.headers.get("Accept", "")
@@ -52,66 +168,184 @@ def _build_upstream_url(upstream: str, path: str, query_string: str) -> str:
 def _filter_headers(
     headers: httpx.Headers,
 ) -> dict[str, str]:
-    """Filter hop-by-hop headers from the upstream response."""
+    """Filter hop-by-hop headers from the upstream response.
+
+    ``httpx.Headers.items()`` already yields lower-cased names (joining
+    repeated headers), so they are checked against ``_HOP_BY_HOP`` as-is.
+    """
     return {
         k: v
         for k, v in headers.items()
-        if k.lower() not in _HOP_BY_HOP
+        if k not in _HOP_BY_HOP
     }
 
 
-async def _proxy_handler(request: web.Request) -> web.Response:
-    """Handle a single proxied request."""
+def _bad_gateway() -> web.Response:
+    """Return the response sent when the upstream cannot be reached."""
+    return web.Response(status=502, text="Bad Gateway: upstream unavailable")
+
+
+async def _stream_body(
+    request: web.Request, upstream_resp: httpx.Response, headers: dict[str, str],
+) -> web.StreamResponse:
+    """Forward the upstream body chunk by chunk as it arrives.
+
+    Decoded bytes are forwarded, not raw ones, because ``Content-Encoding``
+    is dropped from the forwarded headers.
+    """
+    response = web.StreamResponse(status=upstream_resp.status_code, headers=headers)
+    await response.prepare(request)
+    async for chunk in upstream_resp.aiter_bytes():
+        await response.write(chunk)
+    await response.write_eof()
+    return response
+
+
+def _markdown_response(status: int, body: bytes, headers: dict[str, str]) -> web.Response:
+    """Build a converted-markdown response from its UTF-8 encoded *body*."""
+    return web.Response(status=status, body=body, headers=headers)
+
+
+async def _forward(
+    request: web.Request,
+    url: str,
+    wants_markdown: bool,
+    publish: Callable[[_Converted], None] | None = None,
+) -> web.StreamResponse:
+    """Fetch *url* from the upstream and answer *request* with it.
+
+    Only HTML converted to markdown is read in full; every other body is
+    streamed through without being buffered. Conversions are cached per URL
+    and revalidated with a conditional request, so an unchanged page is
+    neither re-downloaded nor re-converted. A markdown result the upstream
+    allows to be shared is also handed to *publish*, without ``Set-Cookie``,
+    for requests waiting on the same URL.
+    """
+    client: httpx.AsyncClient = request.app["client"]
+    md_cache: _MarkdownCache = request.app["md_cache"]
+
+    request_headers = {"User-Agent": "ContextCLI-Proxy/1.0"}
+    cached = md_cache.get(url) if wants_markdown else None
+    if cached is not None:
+        request_headers.update(cached.validators)
+
+    try:
+        upstream_resp = await client.send(
+            client.build_request("GET", url, headers=request_headers),
+            stream=True,
+        )
+    except (httpx.TimeoutException, httpx.ConnectError):
+        return _bad_gateway()
+
+    try:
+        if cached is not None and upstream_resp.status_code == 304:
+            md_cache.refresh(url, cached, upstream_resp.headers)
+            converted = (200, cached.body, cached.headers)
+            shareable = True
+        else:
+            content_type = upstream_resp.headers.get("content-type", "")
+            headers = _filter_headers(upstream_resp.headers)
+
+            if not (wants_markdown and _is_html(content_type)):
+                return await _stream_body(request, upstream_resp, headers)
+
+            try:
+                # Decoded as it is read, so the raw bytes are never held
+                # alongside the text for the duration of the conversion
+                html = "".join([chunk async for chunk in upstream_resp.aiter_text()])
+            except (httpx.TimeoutException, httpx.ConnectError):
+                return _bad_gateway()
+            # Conversion is CPU-bound; run it off the loop so other requests proceed
+            md_text = await asyncio.to_thread(convert_html_to_markdown, html)
+            # Encoded once here, so cache hits are served without re-encoding
+            body = md_text.encode("utf-8")
+            # _filter_headers lower-cases names, so this replaces the upstream type
+            headers["content-type"] = _MARKDOWN_CONTENT_TYPE
+            headers[_SOURCE_HEADER] = _SOURCE_VALUE
+            if upstream_resp.status_code == 200:
+                md_cache.set(url, body, headers, upstream_resp.headers)
+            converted = (upstream_resp.status_code, body, headers)
+            shareable = _is_shareable(upstream_resp.headers)
+    finally:
+        await upstream_resp.aclose()
+
+    if publish is not None and shareable:
+        status, body, headers = converted
+        publish((status, body, _shared_headers(headers)))
+    return _markdown_response(*converted)
+
+
+async def _proxy_handler(request: web.Request) -> web.StreamResponse:
+    """Handle a single proxied request.
+
+    Concurrent markdown requests for the same URL share one upstream fetch
+    and conversion. If the shared fetch yields no markdown (not HTML, the
+    upstream failed, or the response is ``no-store``/``private``), each
+    waiting request fetches the URL itself.
+    """
     upstream: str = request.app["upstream"]
     url = _build_upstream_url(upstream, request.path, request.query_string)
+    if not _wants_markdown(request):
+        return await _forward(request, url, wants_markdown=False)
 
+    inflight: dict[str, asyncio.Future[_Converted | None]] = request.app["inflight"]
+    pending = inflight.get(url)
+    if pending is not None:
+        # Shielded so a waiter's disconnect does not cancel the shared result
+        converted = await asyncio.shield(pending)
+        if converted is not None:
+            return _markdown_response(*converted)
+        return await _forward(request, url, wants_markdown=True)
+
+    pending = asyncio.get_running_loop().create_future()
+    inflight[url] = pending
     try:
-        async with httpx.AsyncClient(
-            timeout=30, follow_redirects=True,
-        ) as client:
-            upstream_resp = await client.get(
-                url,
-                headers={"User-Agent": "ContextCLI-Proxy/1.0"},
-            )
-    except (httpx.TimeoutException, httpx.ConnectError):
-        return web.Response(status=502, text="Bad Gateway: upstream unavailable")
-
-    content_type = upstream_resp.headers.get("content-type", "")
-    body = upstream_resp.content
-    headers = _filter_headers(upstream_resp.headers)
-
-    if _wants_markdown(request) and _is_html(content_type):
-        md_text = convert_html_to_markdown(upstream_resp.text)
-        # Remove upstream content-type; we set our own via content_type=
-        headers.pop("Content-Type", None)
-        headers.pop("content-type", None)
-        headers[_SOURCE_HEADER] = _SOURCE_VALUE
-        return web.Response(
-            status=upstream_resp.status_code,
-            text=md_text,
-            content_type="text/markdown",
-            charset="utf-8",
-            headers=headers,
-        )
+        return await _forward(request, url, wants_markdown=True, publish=pending.set_result)
+    finally:
+        del inflight[url]
+        if not pending.done():
+            pending.set_result(None)
 
-    return web.Response(
-        status=upstream_resp.status_code,
-        body=body,
-        headers=headers,
-    )
+
+async def _upstream_client(app: web.Application) -> AsyncIterator[None]:
+    """Open one pooled upstream client for the app's lifetime, closing it on cleanup.
+
+    HTTP/2 is negotiated when ``h2`` is installed.
+    """
+    async with httpx.AsyncClient(
+        timeout=_UPSTREAM_TIMEOUT,
+        follow_redirects=True,
+        limits=_UPSTREAM_LIMITS,
+        http2=_HTTP2_AVAILABLE,
+    ) as client:
+        app["client"] = client
+        yield
 
 
-def create_proxy_app(upstream: str) -> web.Application:
+def create_proxy_app(
+    upstream: str, *, client: httpx.AsyncClient | None = None,
+) -> web.Application:
     """Create an aiohttp application that proxies to *upstream*.
 
+    All requests share one upstream client, so connections to the upstream
+    are kept alive and reused instead of being set up for every request.
+
     Args:
         upstream: The base URL of the upstream server (e.g. ``http://localhost:3000``).
+        client: Upstream client to use. The caller owns it and must close it;
+            by default the app opens its own on startup and closes it on cleanup.
 
     Returns:
         A configured :class:`aiohttp.web.Application`.
     """
     app = web.Application()
     app["upstream"] = upstream
+    app["md_cache"] = _MarkdownCache()
+    app["inflight"] = {}
+    if client is not None:
+        app["client"] = client
+    else:
+        app.cleanup_ctx.append(_upstream_client)
     app.router.add_route("*", "/{path_info:.*}", _proxy_handler)
     return app
 
@@ -120,13 +354,20 @@ def run_proxy(
     upstream: str,
     port: int = 8080,
     host: str = "0.0.0.0",
+    *,
+    quiet: bool = False,
 ) -> None:
     """Start the markdown reverse-proxy server.
 
+    The server runs on a uvloop event loop when ``uvloop`` is installed.
+
     Args:
         upstream: The base URL of the upstream server.
         port: Port to listen on (default 8080).
         host: Host/interface to bind (default ``0.0.0.0``).
+        quiet: Suppress aiohttp's startup banner.
     """
     app = create_proxy_app(upstream)
-    web.run_app(app, host=host, port=port)
+    web.run_app(
+        app, host=host, port=port, loop=_new_event_loop(), print=None if quiet else print,
+    )
@@ -6,11 +6,10 @@ explanations into the full --verbose CLI output.
 
 from __future__ import annotations
 
-from urllib.parse import urlparse
-
 from rich.console import Console
 from rich.panel import Panel
 
+from context_cli.core.checks._url import url_depth
 from context_cli.core.models import (
     AuditReport,
     SiteAuditReport,
@@ -202,8 +201,7 @@ def _render_aggregation_explanation(
     # Show the actual weights used
     weight_lines: list[str] = []
     for page in report.pages:
-        path = urlparse(page.url).path.strip("/")
-        depth = len(path.split("/")) if path else 0
+        depth = url_depth(page.url)
         if depth <= 1:
             w = 3
         elif depth == 2:
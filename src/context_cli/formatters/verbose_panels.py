@@ -153,7 +153,7 @@ def render_schema_verbose(report: AuditReport | SiteAuditReport) -> Panel:
 
     if schema.blocks_found > 0:
         unique_types = {s.schema_type for s in schema.schemas}
-        n_high = sum(1 for t in unique_types if t in HIGH_VALUE_TYPES)
+        n_high = len(unique_types & HIGH_VALUE_TYPES)
         n_std = len(unique_types) - n_high
         raw = (
             SCHEMA_BASE_SCORE
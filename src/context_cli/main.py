@@ -11,6 +11,7 @@ app = typer.Typer(
 # Register commands from cli/ subpackage
 from context_cli.cli import audit as _audit_mod  # noqa: E402
 from context_cli.cli import benchmark as _bench_mod  # noqa: E402
+from context_cli.cli import cache as _cache_mod  # noqa: E402
 from context_cli.cli import compare as _compare_mod  # noqa: E402
 from context_cli.cli import generate as _generate_mod  # noqa: E402
 from context_cli.cli import history as _history_mod  # noqa: E402
@@ -23,6 +24,7 @@ from context_cli.cli import watch as _watch_mod  # noqa: E402
 
 _audit_mod.register(app)
 _bench_mod.register(app)
+_cache_mod.register(app)
 _compare_mod.register(app)
 _generate_mod.register(app)
 _history_mod.register(app)
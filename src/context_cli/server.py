@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import httpx
 from fastmcp import FastMCP
 
-from context_cli.core.auditor import audit_site, audit_url
+from context_cli.core.auditor import audit_site, audit_url, create_audit_client
 from context_cli.core.compare import compare_urls
 from context_cli.core.history import HistoryDB
 from context_cli.core.models import (
@@ -17,8 +22,36 @@ from context_cli.core.models import (
 )
 from context_cli.core.recommend import generate_recommendations
 
+# The server is long-lived, so audits share one pooled client per event loop
+# and keep their connections warm between tool calls.
+_audit_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _audit_client() -> httpx.AsyncClient:
+    """Return the running loop's shared audit client, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _audit_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _audit_clients[loop] = create_audit_client()
+    return client
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Close the shared audit client when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        client = _audit_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
 mcp = FastMCP(
     name="context-cli",
+    lifespan=_lifespan,
     instructions=(
         "Context CLI lints URLs for LLM readiness, checking robots.txt, "
         "llms.txt, Schema.org structured data, and content density. "
@@ -37,9 +70,9 @@ async def audit(url: str, single_page: bool = False, max_pages: int = 10) -> dic
     """
     report: AuditReport | SiteAuditReport
     if single_page:
-        report = await audit_url(url)
+        report = await audit_url(url, client=_audit_client())
     else:
-        report = await audit_site(url, max_pages=max_pages)
+        report = await audit_site(url, max_pages=max_pages, client=_audit_client())
     return report.model_dump()
 
 
@@ -134,7 +167,7 @@ async def recommend(url: str) -> list[dict[str, Any]]:
     Runs a single-page audit, then analyzes the results to suggest specific
     improvements sorted by estimated impact.
     """
-    report = await audit_url(url)
+    report = await audit_url(url, client=_audit_client())
     recs = generate_recommendations(report)
     return [rec.model_dump() for rec in recs]
 
@@ -230,7 +263,7 @@ async def agent_readiness_audit(url: str) -> dict[str, Any]:
     Args:
         url: URL to audit for agent readiness.
     """
-    report = await audit_url(url)
+    report = await audit_url(url, client=_audit_client())
     if report.agent_readiness is not None:
         return report.agent_readiness.model_dump()
     return {"error": "Agent readiness data not available"}
@@ -0,0 +1,15 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import pytest
+
+from context_cli.core.markdown_engine._memo import clear_content_caches
+
+
+@pytest.fixture(autouse=True)
+def _reset_content_caches():
+    """Keep process-wide markdown pipeline caches from leaking between tests."""
+    clear_content_caches()
+    yield
+    clear_content_caches()
@@ -18,7 +18,13 @@ from context_cli.core.models import (
     SchemaOrgResult,
     SchemaReport,
 )
-from context_cli.core.scoring import compute_scores
+from context_cli.core.scoring import (
+    compute_scores,
+    score_content,
+    score_llms_txt,
+    score_robots,
+    score_schema,
+)
 
 # -- check_schema_org ----------------------------------------------------------
 
@@ -164,6 +170,34 @@ def test_compute_scores_nothing_found():
     assert overall == 0
 
 
+def test_pillar_scorers_match_compute_scores():
+    """Each per-pillar scorer updates its report in place like compute_scores."""
+    robots = RobotsReport(
+        found=True,
+        bots=[
+            BotAccessResult(bot="GPTBot", allowed=True, detail="Allowed"),
+            BotAccessResult(bot="ClaudeBot", allowed=False, detail="Blocked"),
+        ],
+    )
+    llms_txt = LlmsTxtReport(found=False, llms_full_found=True)
+    schema_org = SchemaReport(
+        blocks_found=1,
+        schemas=[SchemaOrgResult(schema_type="FAQPage", properties=["name"])],
+    )
+    content = ContentReport(word_count=900, has_code_blocks=True)
+
+    assert score_robots(robots) is robots and robots.score == 12.5
+    assert score_llms_txt(llms_txt) is llms_txt and llms_txt.score == 10
+    assert score_schema(schema_org) is schema_org and schema_org.score == 13
+    assert score_content(content) is content and content.score == 23
+
+    _, _, _, _, overall = compute_scores(
+        robots.model_copy(), llms_txt.model_copy(),
+        schema_org.model_copy(), content.model_copy(),
+    )
+    assert overall == 12.5 + 10 + 13 + 23
+
+
 def test_compute_scores_partial():
     """Partial results should yield proportional scores."""
     # 3 of 7 bots allowed
@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+from bs4 import BeautifulSoup
 
+from context_cli.core import auditor
 from context_cli.core.auditor import _audit_site_inner, audit_site, audit_url
 from context_cli.core.crawler import CrawlResult
 from context_cli.core.models import (
+    AgentsMdReport,
     BotAccessResult,
     ContentReport,
     DiscoveryResult,
+    EeatReport,
     LlmsTxtReport,
     RobotsReport,
     SchemaReport,
@@ -156,6 +162,191 @@ async def test_audit_url_happy_path(mock_robots, mock_llms, mock_crawl):
     assert report.content.score > 0
 
 
+@pytest.mark.parametrize("available", [True, False])
+def test_create_audit_client_negotiates_http2_when_h2_installed(available):
+    """HTTP/2 is enabled only when the optional h2 package is importable."""
+    with (
+        patch("context_cli.core.auditor._HTTP2_AVAILABLE", available),
+        patch("context_cli.core.auditor.httpx.AsyncClient") as client_cls,
+    ):
+        auditor.create_audit_client(5)
+
+    assert client_cls.call_args.kwargs["http2"] is available
+    assert client_cls.call_args.kwargs["limits"] is auditor.AUDIT_HTTP_LIMITS
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_url_uses_provided_client(mock_robots, mock_llms, mock_crawl):
+    """A caller-supplied client is used for the checks and left open."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    mock_crawl.return_value = _make_crawl()
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await audit_url(_SEED, client=client)
+
+        assert mock_robots.call_args.args[1] is client
+        assert mock_llms.call_args.args[1] is client
+        assert not client.is_closed
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_url_page_checks_run_off_loop(mock_robots, mock_llms, mock_crawl):
+    """Schema/content analysis runs in a worker thread, not on the event loop."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    mock_crawl.return_value = _make_crawl()
+    loop_thread = threading.get_ident()
+    seen: list[int] = []
+
+    def _schema(html):
+        seen.append(threading.get_ident())
+        return SchemaReport()
+
+    with patch("context_cli.core.auditor.check_schema_org", side_effect=_schema):
+        await audit_url(_SEED)
+
+    assert seen and seen[0] != loop_thread
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_url_page_checks_overlap_agent_probes(
+    mock_robots, mock_llms, mock_crawl, mock_agents_md,
+):
+    """E-E-A-T analysis runs off the loop and starts before agent probes finish."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    mock_crawl.return_value = _make_crawl()
+    loop_thread = threading.get_ident()
+    analysed = threading.Event()
+    seen: list[int] = []
+
+    def _eeat(html, *, base_domain=None, soup=None):
+        seen.append(threading.get_ident())
+        analysed.set()
+        return EeatReport()
+
+    async def _agents_md(url, client):
+        # Would time out if page analysis waited for the agent probes
+        assert await asyncio.to_thread(analysed.wait, 1)
+        return AgentsMdReport()
+
+    mock_agents_md.side_effect = _agents_md
+    with patch("context_cli.core.auditor.check_eeat", side_effect=_eeat):
+        report = await audit_url(_SEED)
+
+    assert seen and seen[0] != loop_thread
+    assert report.eeat == EeatReport()
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_url_agent_checks_overlap_crawl(
+    mock_robots, mock_llms, mock_crawl, mock_agents_md,
+):
+    """Agent readiness probes start while the crawl is still running."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    started = asyncio.Event()
+
+    async def _agents_md(url, client):
+        started.set()
+        return AgentsMdReport()
+
+    async def _crawl(url):
+        # Would time out if the agent checks only started after the crawl
+        await asyncio.wait_for(started.wait(), timeout=1)
+        return _make_crawl()
+
+    mock_agents_md.side_effect = _agents_md
+    mock_crawl.side_effect = _crawl
+
+    report = await audit_url(_SEED)
+
+    assert not any("Crawl failed" in e for e in report.errors)
+
+
+async def _cancel_during_crawl(audit, mock_crawl, mock_agents_md) -> bool:
+    """Cancel *audit* while its crawl runs; return whether the agent probe was cancelled."""
+    probing = asyncio.Event()
+    probe_cancelled = False
+
+    async def _agents_md(url, client):
+        nonlocal probe_cancelled
+        probing.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            probe_cancelled = True
+            raise
+
+    async def _crawl(url):
+        await asyncio.Event().wait()
+
+    mock_agents_md.side_effect = _agents_md
+    mock_crawl.side_effect = _crawl
+    task = asyncio.ensure_future(audit())
+    await probing.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    return probe_cancelled
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_url_cancellation_stops_agent_probes(
+    mock_robots, mock_llms, mock_crawl, mock_agents_md,
+):
+    """Cancelling an audit mid-crawl cancels the agent probes it started."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+
+    assert await _cancel_during_crawl(lambda: audit_url(_SEED), mock_crawl, mock_agents_md)
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_url_parses_dom_once(mock_robots, mock_llms, mock_crawl):
+    """Semantic-HTML and E-E-A-T checks share one BeautifulSoup parse."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    mock_crawl.return_value = _make_crawl()
+
+    with (
+        patch("context_cli.core.auditor.BeautifulSoup", wraps=BeautifulSoup) as mock_bs,
+        patch("context_cli.core.checks.eeat.BeautifulSoup") as eeat_bs,
+        patch("context_cli.core.checks.semantic_html.BeautifulSoup") as semantic_bs,
+    ):
+        report = await audit_url(_SEED)
+
+    mock_bs.assert_called_once()
+    eeat_bs.assert_not_called()
+    semantic_bs.assert_not_called()
+    assert report.eeat is not None
+    assert report.agent_readiness is not None
+
+
 # ── Token metrics in audit_url() ────────────────────────────────────────────
 
 
@@ -332,6 +523,218 @@ async def test_audit_site_inner_happy_path(
     assert report.errors == []
 
 
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_site_inner_cancellation_stops_agent_probes(
+    mock_robots, mock_llms, mock_crawl, mock_agents_md,
+):
+    """Cancelling a site audit during the seed crawl cancels the agent probes."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+
+    def _audit():
+        return _audit_site_inner(_SEED, "example.com", 10, 0.0, [], lambda _: None)
+
+    assert await _cancel_during_crawl(_audit, mock_crawl, mock_agents_md)
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.extract_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.discover_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_site_inner_crawl_deadline_keeps_crawled_pages(
+    mock_robots, mock_llms, mock_crawl, mock_discover, mock_batch
+):
+    """At the crawl deadline the crawl is cancelled and finished pages are kept."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    mock_crawl.return_value = _make_crawl()
+    mock_discover.return_value = DiscoveryResult(
+        method="sitemap", urls_sampled=[_SEED, f"{_SEED}/a", f"{_SEED}/b"]
+    )
+    first = CrawlResult(url=f"{_SEED}/a", html="", markdown="A " * 50, success=True)
+    crawl_cancelled = False
+
+    async def _extract_pages(urls, *, delay_seconds, on_result):
+        nonlocal crawl_cancelled
+        on_result(0, first)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            crawl_cancelled = True
+            raise
+
+    mock_batch.side_effect = _extract_pages
+    deadline = asyncio.get_running_loop().time() + 0.05
+    report = await _audit_site_inner(
+        _SEED, "example.com", 10, 0.0, [], lambda _: None, crawl_deadline=deadline,
+    )
+
+    assert [p.url for p in report.pages] == [_SEED, f"{_SEED}/a"]
+    assert "Page crawl stopped after 85s; returning 2 crawled pages" in report.errors
+    await asyncio.sleep(0)
+    assert crawl_cancelled
+
+
+@pytest.mark.asyncio
+async def test_audit_site_passes_crawl_deadline_within_timeout():
+    """audit_site stops the page crawl before its own hard timeout."""
+    inner = AsyncMock(return_value=None)
+    loop = asyncio.get_running_loop()
+
+    with patch("context_cli.core.auditor._audit_site_inner", inner):
+        await audit_site(_SEED)
+
+    deadline = inner.await_args.kwargs["crawl_deadline"]
+    assert loop.time() < deadline < loop.time() + auditor.SITE_AUDIT_TIMEOUT
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.extract_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.discover_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_site_inner_discovery_overlaps_seed_crawl(
+    mock_robots, mock_llms, mock_crawl, mock_discover, mock_batch
+):
+    """Discovery starts during the seed crawl and later gets robots.txt and seed links."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    mock_batch.return_value = []
+    discovering = asyncio.Event()
+    inputs = []
+
+    async def _crawl(url):
+        # Would time out if discovery only started after the seed crawl
+        await asyncio.wait_for(discovering.wait(), timeout=1)
+        return _make_crawl()
+
+    async def _discover(url, client, *, max_pages, site_inputs):
+        discovering.set()
+        inputs.append(await site_inputs)
+        return DiscoveryResult(method="spider", urls_sampled=[_SEED])
+
+    mock_crawl.side_effect = _crawl
+    mock_discover.side_effect = _discover
+
+    report = await _audit_site_inner(_SEED, "example.com", 10, 0.0, [], lambda _: None)
+
+    assert inputs == [("User-agent: *\nAllow: /", [f"{_SEED}/about"])]
+    assert report.errors == []
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.extract_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.discover_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_site_inner_discovery_inputs_when_checks_fail(
+    mock_robots, mock_llms, mock_crawl, mock_discover, mock_batch
+):
+    """A failed robots check or seed crawl gives discovery no robots.txt or links."""
+    mock_robots.side_effect = RuntimeError("robots down")
+    mock_llms.return_value = _make_llms()
+    mock_crawl.return_value = _make_crawl(success=False, error="seed down")
+    inputs = []
+
+    async def _discover(url, client, *, max_pages, site_inputs):
+        inputs.append(await site_inputs)
+        return DiscoveryResult(method="spider", urls_sampled=[_SEED])
+
+    mock_discover.side_effect = _discover
+
+    await _audit_site_inner(_SEED, "example.com", 10, 0.0, [], lambda _: None)
+
+    assert inputs == [(None, None)]
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.extract_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.discover_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_site_inner_analyses_pages_while_crawling(
+    mock_robots, mock_llms, mock_crawl, mock_discover, mock_batch
+):
+    """A finished page is analysed while the remaining crawls are still running."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    mock_crawl.return_value = _make_crawl(success=False, error="seed down")
+    mock_discover.return_value = DiscoveryResult(
+        method="sitemap", urls_sampled=[_SEED, f"{_SEED}/a", f"{_SEED}/b"]
+    )
+    first = CrawlResult(url=f"{_SEED}/a", html="", markdown="A " * 50, success=True)
+    second = CrawlResult(url=f"{_SEED}/b", html="", markdown="", success=False, error="404")
+    analysed = threading.Event()
+
+    async def _extract_pages(urls, *, delay_seconds, on_result):
+        on_result(0, first)
+        # Would time out if analysis only started after every crawl finished
+        assert await asyncio.to_thread(analysed.wait, 1)
+        on_result(1, second)
+        return [first, second]
+
+    def _audit_page_content(html, markdown, page_cache=None):
+        analysed.set()
+        return SchemaReport(), ContentReport(word_count=50)
+
+    mock_batch.side_effect = _extract_pages
+    with patch("context_cli.core.auditor.audit_page_content", _audit_page_content):
+        report = await _audit_site_inner(
+            _SEED, "example.com", 10, 0.0, [], lambda _: None
+        )
+
+    assert [p.url for p in report.pages] == [f"{_SEED}/a", f"{_SEED}/b"]
+    assert report.pages[0].content.word_count == 50
+    assert report.pages[1].errors == ["404"]
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.auditor.extract_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.discover_pages", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
+@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
+async def test_audit_site_inner_seed_checks_overlap_crawl(
+    mock_robots, mock_llms, mock_crawl, mock_discover, mock_batch
+):
+    """Seed-page E-E-A-T runs in a thread while the remaining pages crawl."""
+    mock_robots.return_value = _make_robots()
+    mock_llms.return_value = _make_llms()
+    mock_crawl.return_value = _make_crawl()
+    mock_discover.return_value = DiscoveryResult(
+        method="sitemap", urls_sampled=[_SEED, f"{_SEED}/about"]
+    )
+    about = CrawlResult(url=f"{_SEED}/about", html="", markdown="About", success=True)
+    analysed = threading.Event()
+
+    def _eeat(html, *, base_domain=None, soup=None):
+        analysed.set()
+        return EeatReport(has_author=True)
+
+    async def _extract_pages(urls, *, delay_seconds, on_result):
+        # Would time out if seed checks only started after the crawl
+        assert await asyncio.to_thread(analysed.wait, 1)
+        return [about]
+
+    mock_batch.side_effect = _extract_pages
+    with patch("context_cli.core.auditor.check_eeat", side_effect=_eeat):
+        report = await _audit_site_inner(
+            _SEED, "example.com", 10, 0.0, [], lambda _: None
+        )
+
+    assert [p.url for p in report.pages] == [_SEED, f"{_SEED}/about"]
+    assert report.eeat is not None and report.eeat.has_author is True
+
+
 @pytest.mark.asyncio
 @patch("context_cli.core.auditor.extract_pages", new_callable=AsyncMock)
 @patch("context_cli.core.auditor.discover_pages", new_callable=AsyncMock)
@@ -9,7 +9,9 @@ import pytest
 from typer.testing import CliRunner
 
 from context_cli.core.batch import parse_url_file, run_batch_audit
+from context_cli.core.checks.agents_md import check_agents_md
 from context_cli.core.models import (
+    AgentsMdReport,
     AuditReport,
     BatchAuditReport,
     ContentReport,
@@ -174,6 +176,27 @@ async def test_run_batch_audit_site_mode():
     assert result.errors == {}
 
 
+@pytest.mark.asyncio
+async def test_run_batch_audit_shares_origin_checks_across_urls():
+    """Origin-scoped probes run once for the whole batch, not once per URL."""
+    async def _fake(url, *, client, **kwargs):
+        await check_agents_md(url, client)
+        return _report(url)
+
+    with (
+        patch("context_cli.core.batch.audit_url", side_effect=_fake),
+        patch(
+            "context_cli.core.checks.agents_md._probe_agents_md",
+            return_value=AgentsMdReport(found=False),
+        ) as probe,
+    ):
+        await run_batch_audit(
+            ["https://a.com/x", "https://a.com/y"], single=True
+        )
+
+    assert probe.await_count == 1
+
+
 @pytest.mark.asyncio
 async def test_run_batch_audit_error_handling():
     """URLs that fail should be captured in errors, not crash the batch."""
@@ -236,6 +259,23 @@ async def test_run_batch_audit_passes_timeout():
     assert captured_kwargs[0]["timeout"] == 45
 
 
+@pytest.mark.asyncio
+async def test_run_batch_audit_shares_one_client():
+    """Every audit in a batch receives the same HTTP client, closed afterwards."""
+    clients: list = []
+
+    async def _fake(url, **kwargs):
+        clients.append(kwargs["client"])
+        return _report(url)
+
+    with patch("context_cli.core.batch.audit_url", side_effect=_fake):
+        await run_batch_audit(["https://a.com", "https://b.com"], single=True)
+
+    assert len(clients) == 2
+    assert clients[0] is clients[1]
+    assert clients[0].is_closed
+
+
 @pytest.mark.asyncio
 async def test_run_batch_audit_passes_max_pages():
     """Batch audit in site mode should pass max_pages through."""
@@ -269,6 +309,47 @@ async def test_run_batch_audit_progress_callback():
     assert len(msgs) >= 2
 
 
+@pytest.mark.asyncio
+async def test_run_batch_audit_on_complete_in_completion_order():
+    """on_complete fires per URL as each audit finishes, including failures."""
+    import asyncio
+
+    done: list[str] = []
+
+    async def _fake(url, **kwargs):
+        if "slow" in url:
+            await asyncio.sleep(0.05)
+        if "bad" in url:
+            raise RuntimeError("boom")
+        return _report(url)
+
+    with patch("context_cli.core.batch.audit_url", side_effect=_fake):
+        await run_batch_audit(
+            ["https://slow.com", "https://fast.com", "https://bad.com"],
+            single=True,
+            on_complete=done.append,
+        )
+
+    assert done == ["https://fast.com", "https://bad.com", "https://slow.com"]
+
+
+def test_cli_file_flag_advances_progress_per_url(tmp_path):
+    """The batch CLI advances its progress bar through on_complete."""
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("https://a.com\nhttps://b.com\n")
+
+    async def _fake(urls, *, on_complete, **kwargs):
+        for u in urls:
+            on_complete(u)
+        return BatchAuditReport(urls=urls, reports=[_report(u) for u in urls])
+
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
+        result = runner.invoke(app, ["lint", "--file", str(url_file), "--json"])
+
+    assert result.exit_code == 0
+    assert len(json.loads(result.output)["reports"]) == 2
+
+
 # ── CLI --file flag integration ──────────────────────────────────────────────
 
 
@@ -283,7 +364,7 @@ def test_cli_file_flag_json(tmp_path):
             reports=[_report("https://a.com"), _report("https://b.com")],
         )
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
         result = runner.invoke(
             app, ["lint", "--file", str(url_file), "--json"]
         )
@@ -305,7 +386,7 @@ def test_cli_file_flag_rich(tmp_path):
             reports=[_report("https://a.com", score=55.0)],
         )
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
         result = runner.invoke(app, ["lint", "--file", str(url_file)])
 
     assert result.exit_code == 0
@@ -325,7 +406,7 @@ def test_cli_file_flag_with_errors(tmp_path):
             errors={"https://bad.com": "Connection refused"},
         )
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
         result = runner.invoke(app, ["lint", "--file", str(url_file)])
 
     assert result.exit_code == 0
@@ -343,7 +424,7 @@ def test_cli_concurrency_flag(tmp_path):
         captured.append(kwargs)
         return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
         result = runner.invoke(
             app, ["lint", "--file", str(url_file), "--concurrency", "5", "--json"]
         )
@@ -374,7 +455,7 @@ def test_cli_file_flag_csv_format(tmp_path):
     async def _fake(urls, **kwargs):
         return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
         result = runner.invoke(
             app, ["lint", "--file", str(url_file), "--format", "csv"]
         )
@@ -392,7 +473,7 @@ def test_cli_file_flag_markdown_format(tmp_path):
     async def _fake(urls, **kwargs):
         return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
         result = runner.invoke(
             app, ["lint", "--file", str(url_file), "--format", "markdown"]
         )
@@ -411,7 +492,7 @@ def test_cli_file_flag_passes_single(tmp_path):
         captured.append(kwargs)
         return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
         result = runner.invoke(
             app, ["lint", "--file", str(url_file), "--single", "--json"]
         )
@@ -430,7 +511,7 @@ def test_cli_file_flag_passes_timeout(tmp_path):
         captured.append(kwargs)
         return BatchAuditReport(urls=urls, reports=[_report("https://a.com")])
 
-    with patch("context_cli.core.batch.run_batch_audit", side_effect=_fake):
+    with patch("context_cli.cli._audit_helpers.run_batch_audit", side_effect=_fake):
         result = runner.invoke(
             app, ["lint", "--file", str(url_file), "--timeout", "30", "--json"]
         )
@@ -588,7 +588,7 @@ def test_cli_save_baseline_error_handling(tmp_path: Path):
     with (
         patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit_url),
         patch(
-            "context_cli.core.ci.baseline.save_baseline",
+            "context_cli.cli._audit_helpers.save_baseline",
             side_effect=PermissionError("Access denied"),
         ),
     ):
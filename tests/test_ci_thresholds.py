@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 from typer.testing import CliRunner
 
-from context_cli.core.ci.thresholds import check_thresholds
+from context_cli.core.ci.thresholds import check_thresholds, has_blocked_bots
 from context_cli.core.models import (
     AuditReport,
     ContentReport,
@@ -123,6 +123,18 @@ def test_threshold_failure_fields():
     assert tf.minimum == 20.0
 
 
+# -- has_blocked_bots ----------------------------------------------------------
+
+
+def test_has_blocked_bots():
+    from context_cli.core.models import BotAccessResult
+
+    blocked = [BotAccessResult(bot="A", allowed=True), BotAccessResult(bot="B", allowed=False)]
+    assert has_blocked_bots(RobotsReport(found=True, bots=blocked))
+    assert not has_blocked_bots(RobotsReport(found=True, bots=blocked[:1]))
+    assert not has_blocked_bots(RobotsReport(found=False, bots=blocked))
+
+
 # -- check_thresholds core logic tests ----------------------------------------
 
 
@@ -410,6 +422,47 @@ def test_cli_no_thresholds_no_exit():
     assert result.exit_code == 0
 
 
+def test_cli_no_thresholds_skips_threshold_check():
+    """Without any threshold flags, the pillar threshold check is not run."""
+    with (
+        patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit_url_passing),
+        patch("context_cli.cli._audit_helpers.check_thresholds") as mock_check,
+    ):
+        result = runner.invoke(app, ["lint", "https://example.com", "--single"])
+    assert result.exit_code == 0
+    mock_check.assert_not_called()
+
+
+def test_cli_zero_minimum_still_checked():
+    """A minimum of 0 counts as a threshold flag and runs the check."""
+    with (
+        patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit_url_passing),
+        patch(
+            "context_cli.cli._audit_helpers.check_thresholds",
+            wraps=check_thresholds,
+        ) as mock_check,
+    ):
+        result = runner.invoke(
+            app, ["lint", "https://example.com", "--single", "--robots-min", "0"],
+        )
+    assert result.exit_code == 0
+    assert mock_check.call_args.args[1].robots_min == 0
+
+
+def test_cli_overall_min_alone_uses_fast_path():
+    """--overall-min by itself fails with the usual message, without check_thresholds."""
+    with (
+        patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit_url),
+        patch("context_cli.cli._audit_helpers.check_thresholds") as mock_check,
+    ):
+        result = runner.invoke(
+            app, ["lint", "https://example.com", "--single", "--overall-min", "99"],
+        )
+    assert result.exit_code == 1
+    assert "FAIL" in result.output and "overall" in result.output
+    mock_check.assert_not_called()
+
+
 def test_cli_thresholds_with_json_output():
     """Threshold failures still print after JSON output."""
     with patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit_url):
@@ -15,6 +15,7 @@ from context_cli.core.models import (
     GenerateResult,
     LlmsTxtContent,
     LlmsTxtReport,
+    OutputFormat,
     PageAudit,
     ProfileType,
     RobotsReport,
@@ -432,19 +433,55 @@ def test_mcp_command():
 # ── Progress callback — line 204 ────────────────────────────────────────────
 
 
+def _force_terminal():
+    import context_cli.cli.audit as audit_mod
+
+    return patch.object(audit_mod.console, "_force_terminal", True)
+
+
 def test_site_audit_progress_callback():
-    """Site audit in Rich mode invokes progress_callback (line 204)."""
+    """Site audit in Rich mode on a terminal invokes progress_callback."""
     report = _site_report()
+    calls: list[str] = []
 
     async def _fake(url, *, max_pages=10, progress_callback=None, **kw):
         if progress_callback:
+            calls.append("progress")
             progress_callback("Discovering pages...")
             progress_callback("Crawling page 2/3...")
         return report
 
-    with patch("context_cli.cli.audit.audit_site", side_effect=_fake):
+    with patch("context_cli.cli.audit.audit_site", side_effect=_fake), _force_terminal():
         result = runner.invoke(app, ["lint", "https://example.com"])
     assert result.exit_code == 0
+    assert calls == ["progress"]
+
+
+def test_single_audit_on_terminal_shows_status():
+    """Single-page audit on a terminal runs under a status spinner."""
+
+    async def _fake(url, **kw):
+        return _report()
+
+    with patch("context_cli.cli.audit.audit_url", side_effect=_fake), _force_terminal():
+        result = runner.invoke(app, ["lint", "https://example.com", "--single"])
+    assert result.exit_code == 0
+
+
+def test_progress_skipped_for_piped_or_machine_output():
+    """No progress callback is wired up off-terminal or for JSON output."""
+    seen: list[object] = []
+
+    async def _fake(url, *, progress_callback=None, **kw):
+        seen.append(progress_callback)
+        return _site_report()
+
+    with patch("context_cli.cli.audit.audit_site", side_effect=_fake):
+        runner.invoke(app, ["lint", "https://example.com"])
+        with _force_terminal():
+            result = runner.invoke(app, ["lint", "https://example.com", "--json"])
+    assert result.exit_code == 0
+    assert seen == [None, None]
 
 
 # ── pages_failed — line 67 ──────────────────────────────────────────────────
@@ -863,3 +900,109 @@ def test_diagnostics_summary_multiple_warnings():
     render_single_report(report, con)
     output = buf.getvalue()
     assert "2 warnings," in output
+
+
+# ── Shared event loop for lint steps ─────────────────────────────────────────
+
+
+def test_shared_loop_reused_across_runs_and_recreated_after_close():
+    import asyncio
+
+    from context_cli.cli._audit_helpers import _SharedLoop
+
+    async def _current_loop():
+        return asyncio.get_running_loop()
+
+    shared = _SharedLoop()
+    shared.close()  # closing before first use is a no-op
+
+    first = shared.run(_current_loop())
+    assert shared.run(_current_loop()) is first
+
+    shared.close()
+    assert first.is_closed()
+    shared.close()  # idempotent
+
+    assert shared.run(_current_loop()) is not first
+    shared.close()
+
+
+def test_shared_loop_cancels_tasks_left_pending_by_a_run():
+    import asyncio
+
+    from context_cli.cli._audit_helpers import _SharedLoop
+
+    leftovers: list[asyncio.Task] = []
+
+    async def _abandon_task():
+        leftovers.append(asyncio.ensure_future(asyncio.sleep(3600)))
+
+    shared = _SharedLoop()
+    shared.run(_abandon_task())
+
+    assert leftovers[0].cancelled()
+    shared.close()
+
+
+def test_shared_loop_close_cancels_pending_tasks_and_reports_failures():
+    import asyncio
+
+    from context_cli.cli._audit_helpers import _cancel_all_tasks
+
+    loop = asyncio.new_event_loop()
+    errors: list[dict] = []
+    loop.set_exception_handler(lambda _, ctx: errors.append(ctx))
+
+    async def _fails_on_cancel():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            raise RuntimeError("cleanup failed") from None
+
+    async def _start():
+        return loop.create_task(asyncio.sleep(3600)), loop.create_task(_fails_on_cancel())
+
+    sleeper, failing = loop.run_until_complete(_start())
+    loop.run_until_complete(asyncio.sleep(0))
+    _cancel_all_tasks(loop)
+    loop.close()
+
+    assert sleeper.cancelled()
+    assert [ctx["task"] for ctx in errors] == [failing]
+    assert str(errors[0]["exception"]) == "cleanup failed"
+
+
+# ── _render_output dispatch table ───────────────────────────────────────────
+
+
+def test_every_output_format_has_a_renderer():
+    """Each OutputFormat member must map to a renderer in the dispatch table."""
+    from context_cli.cli.audit import _FORMAT_RENDERERS
+
+    assert set(_FORMAT_RENDERERS) == set(OutputFormat)
+
+
+def test_print_json_is_not_wrapped_or_marked_up():
+    """JSON output bypasses Rich wrapping and markup, even on narrow consoles."""
+    import io
+    import json
+
+    from rich.console import Console
+
+    from context_cli.cli._audit_helpers import _print_json
+
+    buf = io.StringIO()
+    detail = "[bold]not markup[/bold] " + "x" * 200
+    report = _report().model_copy(update={"errors": [detail]})
+
+    _print_json(report, Console(file=buf, width=20))
+
+    assert json.loads(buf.getvalue())["errors"] == [detail]
+
+
+def test_dump_json_matches_pydantic_output():
+    """The JSON encoder used for lint output matches pydantic's indented JSON."""
+    from context_cli.cli._audit_helpers import _dump_json
+
+    report = _report().model_copy(update={"errors": ["café \"quoted\" <x>"]})
+    assert _dump_json(report) == report.model_dump_json(indent=2)
@@ -157,6 +157,18 @@ async def test_compare_urls_passes_bots(mock_audit):
         assert call.kwargs["bots"] == ["TestBot"]
 
 
+@pytest.mark.asyncio
+@patch("context_cli.core.compare.audit_url", new_callable=AsyncMock)
+async def test_compare_urls_shares_one_client(mock_audit):
+    """Both audits should reuse one HTTP client, closed afterwards."""
+    mock_audit.return_value = _high_report()
+    await compare_urls(_URL_A, _URL_B)
+
+    client_a, client_b = (c.kwargs["client"] for c in mock_audit.call_args_list)
+    assert client_a is client_b
+    assert client_a.is_closed
+
+
 # ── render_compare ──────────────────────────────────────────────────────────
 
 
@@ -117,6 +117,30 @@ def test_load_config_unknown_keys_ignored(tmp_path: Path):
     assert cfg.timeout == 20
 
 
+def test_load_config_reuses_parse_until_file_changes(tmp_path: Path):
+    """Repeat loads skip the YAML parse; editing the file invalidates it."""
+    import os
+
+    config_path = tmp_path / ".contextrc.yml"
+    config_path.write_text("timeout: 20\n")
+    with patch("context_cli.core.config.yaml.safe_load", return_value={"timeout": 20}) as m:
+        first = load_config(search_dirs=[tmp_path])
+        second = load_config(search_dirs=[tmp_path])
+    assert m.call_count == 1
+    assert first == second and first is not second
+
+    config_path.write_text("timeout: 45\n")
+    st = config_path.stat()
+    os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config(search_dirs=[tmp_path]).timeout == 45
+
+
+def test_load_config_skips_directory_named_like_config(tmp_path: Path):
+    """A directory called .contextrc.yml is not treated as a config file."""
+    (tmp_path / ".contextrc.yml").mkdir()
+    assert load_config(search_dirs=[tmp_path]) == ContextConfig()
+
+
 def test_load_config_default_search_dirs():
     """Default search dirs include CWD and home."""
     with patch("context_cli.core.config.Path.cwd", return_value=Path("/mock/cwd")):
@@ -0,0 +1,60 @@
+"""Tests for the content-addressed caches of the markdown pipeline."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from context_cli.core.markdown_engine._memo import (
+    ContentCache,
+    clear_content_caches,
+    content_key,
+)
+
+
+def test_content_key_is_a_short_digest():
+    key = content_key("<p>" + "x" * 10_000 + "</p>")
+    assert isinstance(key, bytes) and len(key) == 16
+    assert key == content_key("<p>" + "x" * 10_000 + "</p>")
+    assert key != content_key("<p>y</p>")
+
+
+def test_content_key_accepts_lone_surrogates():
+    assert len(content_key("\ud800")) == 16
+
+
+def test_cache_reuses_result_for_same_html():
+    cache = ContentCache()
+    compute = MagicMock(return_value="out")
+
+    assert cache.get("<p>a</p>", compute) == "out"
+    assert cache.get("<p>a</p>", compute) == "out"
+
+    compute.assert_called_once()
+
+
+def test_extra_key_separates_results():
+    cache = ContentCache()
+
+    assert cache.get("<p>a</p>", lambda: "one", extra=1) == "one"
+    assert cache.get("<p>a</p>", lambda: "two", extra=2) == "two"
+    assert cache.get("<p>a</p>", lambda: "new", extra=1) == "one"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ContentCache(maxsize=2)
+    cache.get("a", lambda: "A")
+    cache.get("b", lambda: "B")
+    cache.get("a", lambda: "stale")  # refreshes "a"
+    cache.get("c", lambda: "C")  # evicts "b"
+
+    assert cache.get("a", lambda: "stale") == "A"
+    assert cache.get("b", lambda: "B2") == "B2"
+
+
+def test_clear_content_caches_forces_recompute():
+    cache = ContentCache()
+    cache.get("a", lambda: "A")
+
+    clear_content_caches()
+
+    assert cache.get("a", lambda: "A2") == "A2"
@@ -100,3 +100,30 @@ def test_large_document_many_chunks():
     assert report.chunk_count == 10
     assert report.chunks_in_sweet_spot == 10  # all 75 words = in sweet spot
     assert report.avg_chunk_words == 75
+
+
+def test_bare_hash_line_absorbs_following_line():
+    """A bare '#' line swallows the next line into the heading, as the regex split did."""
+    md = "#\n" + " ".join(["title"] * 5) + "\n" + " ".join(["body"] * 60)
+    report = check_content(md)
+    assert report.has_headings is True
+    assert report.chunk_count == 1
+    assert report.avg_chunk_words == 60
+    assert report.chunks_in_sweet_spot == 1
+
+
+def test_bare_hash_line_absorbs_following_heading():
+    """The absorbed line does not start a second split, even when it is a heading."""
+    md = "intro words\n##\n## Next\n" + " ".join(["w"] * 10)
+    report = check_content(md)
+    assert report.chunk_count == 2
+    assert report.avg_chunk_words == 6  # (2 + 10) // 2
+
+
+def test_bare_hash_on_last_line_is_text():
+    """A trailing '#' with no newline after it is not a heading."""
+    md = "some words here\n#"
+    report = check_content(md)
+    assert report.has_headings is False
+    assert report.chunk_count == 1
+    assert report.avg_chunk_words == 4
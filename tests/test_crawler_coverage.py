@@ -219,3 +219,21 @@ async def test_extract_pages_preserves_order(mock_ep):
     urls = ["https://1.com", "https://2.com", "https://3.com"]
     results = await extract_pages(urls, delay_seconds=0)
     assert [r.url for r in results] == urls
+
+
+@pytest.mark.asyncio
+@patch("context_cli.core.crawler.extract_page", new_callable=AsyncMock)
+async def test_extract_pages_on_result_reports_each_page(mock_ep):
+    """on_result fires once per URL with its input index, including failures."""
+    ok = CrawlResult(url="https://ok.com", html="", markdown="", success=True)
+    mock_ep.side_effect = [ok, RuntimeError("kaboom")]
+    seen: list[tuple[int, CrawlResult]] = []
+
+    results = await extract_pages(
+        ["https://ok.com", "https://bad.com"],
+        delay_seconds=0,
+        on_result=lambda i, r: seen.append((i, r)),
+    )
+
+    assert sorted(seen, key=lambda item: item[0]) == list(enumerate(results))
+    assert results[1].success is False
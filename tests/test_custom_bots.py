@@ -234,3 +234,12 @@ def test_cli_no_bots_flag_passes_none(mock_run_audit):
 
     _, kwargs = mock_run_audit.call_args
     assert kwargs.get("bots") is None
+
+
+def test_parse_bots_strips_and_memoizes():
+    """_parse_bots should strip names and reuse the parsed tuple per spec."""
+    from context_cli.cli._audit_helpers import _parse_bots
+
+    parsed = _parse_bots(" BotA , BotB")
+    assert parsed == ("BotA", "BotB")
+    assert _parse_bots(" BotA , BotB") is parsed
@@ -313,3 +313,25 @@ async def test_discover_pages_full_pipeline():
     assert result.urls_found == 2
     # seed URL always included
     assert "https://example.com" in result.urls_sampled
+
+
+@pytest.mark.asyncio
+async def test_discover_pages_awaits_site_inputs_after_sitemap_fetch():
+    """site_inputs supplies robots_txt/seed_links and is awaited only after the fetch."""
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.get = AsyncMock(return_value=_mock_response(404))
+    fetched_first = False
+
+    async def _site_inputs():
+        nonlocal fetched_first
+        fetched_first = client.get.await_count > 0
+        return "User-agent: GPTBot\nDisallow: /private\n", [
+            "https://example.com/about",
+            "https://example.com/private",
+        ]
+
+    result = await discover_pages("https://example.com", client, site_inputs=_site_inputs())
+
+    assert fetched_first
+    assert result.method == "spider"
+    assert result.urls_sampled == ["https://example.com", "https://example.com/about"]
@@ -1,5 +1,9 @@
 """Tests for E-E-A-T (Experience, Expertise, Authority, Trust) signal detection."""
 
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
 from context_cli.core.checks.eeat import check_eeat
 from context_cli.core.models import EeatReport
 
@@ -19,6 +23,14 @@ class TestCheckEeat:
         assert report.citation_count == 0
         assert report.trust_signals == []
 
+    def test_shared_soup_skips_parse(self) -> None:
+        html = '<html><head><meta name="author" content="Jane Doe"></head></html>'
+        soup = BeautifulSoup(html, "html.parser")
+        with patch("context_cli.core.checks.eeat.BeautifulSoup") as mock_bs:
+            report = check_eeat(html, soup=soup)
+        mock_bs.assert_not_called()
+        assert report == check_eeat(html)
+
     def test_author_meta_tag(self) -> None:
         html = '<html><head><meta name="author" content="Jane Doe"></head></html>'
         report = check_eeat(html)
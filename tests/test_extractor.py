@@ -440,3 +440,17 @@ class TestMinimalHTMLBelowThresholds:
         html = "<html><body><p>test</p></body></html>"
         result = extract_content(html)
         assert result == "x" * 101
+
+
+class TestExtractMemoization:
+    """Repeated inputs are served from the content cache."""
+
+    @patch(
+        "context_cli.core.markdown_engine.extractor.simple_json_from_html_string",
+        return_value={"plain_content": "y" * 101, "content": ""},
+    )
+    def test_same_html_extracted_once(self, mock_readabilipy):
+        html = "<html><body><p>cached</p></body></html>"
+        assert extract_content(html) == extract_content(html) == "y" * 101
+        extract_content(html + " ")
+        assert mock_readabilipy.call_count == 2
@@ -88,3 +88,22 @@ def test_appends_not_overwrites(tmp_path):
     # Both the existing content and the new summary should be present
     assert "# Existing content" in content
     assert "Context Lint" in content
+
+
+def test_short_writes_are_completed(tmp_path):
+    """A partial os.write should be followed by writes of the remainder."""
+    from context_cli.cli._audit_helpers import _write_github_step_summary
+
+    summary_file = tmp_path / "summary.md"
+    real_write = os.write
+
+    def _short_write(fd, data):
+        return real_write(fd, bytes(data[:7]))
+
+    with (
+        patch.dict(os.environ, {"GITHUB_STEP_SUMMARY": str(summary_file)}),
+        patch("context_cli.cli._audit_helpers.os.write", side_effect=_short_write),
+    ):
+        _write_github_step_summary(_mock_report(), None)
+
+    assert "Context Lint" in summary_file.read_text(encoding="utf-8")
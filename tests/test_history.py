@@ -170,6 +170,14 @@ def test_get_latest_report_returns_full(db: HistoryDB) -> None:
     assert report.overall_score == 75.0
 
 
+def test_get_latest_report_returns_newest(db: HistoryDB) -> None:
+    db.save(_make_report(score=40.0))
+    db.save(_make_report(score=90.0))
+    report = db.get_latest_report(_URL)
+    assert report is not None
+    assert report.overall_score == 90.0
+
+
 def test_get_latest_report_returns_none_when_empty(db: HistoryDB) -> None:
     result = db.get_latest_report(_URL)
     assert result is None
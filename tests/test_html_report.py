@@ -325,6 +325,23 @@ def test_cli_format_html_site(tmp_path, monkeypatch):
     assert "HTML report saved" in result.output or ".html" in result.output
 
 
+def test_cli_format_html_filename_slug(tmp_path, monkeypatch):
+    """The report filename drops the scheme and replaces path/query separators."""
+    monkeypatch.chdir(tmp_path)
+
+    async def _fake_audit(url, **kwargs):
+        return _single_report().model_copy(update={"url": url})
+
+    with patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit):
+        result = runner.invoke(
+            app,
+            ["lint", "https://example.com:8080/a/b?x=1&y=2", "--single", "--format", "html"],
+        )
+
+    assert result.exit_code == 0
+    assert (tmp_path / "context-report-example.com_8080_a_b_x=1_y=2.html").exists()
+
+
 # -- Token Waste in HTML tests ------------------------------------------------
 
 
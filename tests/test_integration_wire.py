@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from io import StringIO
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 from rich.console import Console
 
+from context_cli.core import auditor
 from context_cli.core.auditor import _build_agent_readiness, audit_url
 from context_cli.core.crawler import CrawlResult
 from context_cli.core.models import (
@@ -57,17 +59,23 @@ def _make_llms() -> LlmsTxtReport:
     return LlmsTxtReport(found=True, url=f"{_SEED}/llms.txt", detail="Found")
 
 
+# Page bodies are immutable, so they are built once; the reports and crawl
+# results wrapping them are mutable and still created fresh per test.
+_CRAWL_HTML = (
+    '<html><head><script type="application/ld+json">'
+    '{"@type":"Organization","name":"X"}'
+    "</script></head><body>" + " word" * 200 + "</body></html>"
+)
+_CRAWL_MARKDOWN = "# Hello\n" + "word " * 200
+
+
 def _make_crawl(
     success: bool = True, error: str | None = None
 ) -> CrawlResult:
     return CrawlResult(
         url=_SEED,
-        html=(
-            '<html><head><script type="application/ld+json">'
-            '{"@type":"Organization","name":"X"}'
-            "</script></head><body>" + " word" * 200 + "</body></html>"
-        ),
-        markdown="# Hello\n" + "word " * 200,
+        html=_CRAWL_HTML,
+        markdown=_CRAWL_MARKDOWN,
         success=success,
         error=error,
         internal_links=[f"{_SEED}/about"],
@@ -205,33 +213,39 @@ def _capture_console(fn, *args) -> str:
 
 # ── audit_url() agent readiness wiring tests ────────────────────────────────
 
+_PATCHED = (
+    "check_robots", "check_llms_txt", "extract_page", "discover_pages", "extract_pages",
+    "check_agents_md", "check_markdown_accept", "check_mcp_endpoint", "check_x402",
+    "check_nlweb",
+)
+
+
+@pytest.fixture
+def agent_mocks(monkeypatch):
+    """Patch the auditor's checks and crawler with happy-path AsyncMocks.
+
+    Tests override individual ``return_value`` / ``side_effect`` as needed.
+    """
+    mocks = SimpleNamespace(**{name: AsyncMock() for name in _PATCHED})
+    for name in _PATCHED:
+        monkeypatch.setattr(auditor, name, getattr(mocks, name))
+    mocks.check_robots.return_value = _make_robots()
+    mocks.check_llms_txt.return_value = _make_llms()
+    mocks.extract_page.return_value = _make_crawl()
+    mocks.discover_pages.return_value = DiscoveryResult(
+        method="sitemap", urls_sampled=[_SEED],
+    )
+    mocks.check_agents_md.return_value = _make_agents_md()  # score=5
+    mocks.check_markdown_accept.return_value = _make_md_accept()  # score=5
+    mocks.check_mcp_endpoint.return_value = _make_mcp()  # score=4
+    mocks.check_x402.return_value = _make_x402()  # score=2
+    mocks.check_nlweb.return_value = _make_nlweb()  # score=1
+    return mocks
+
 
 @pytest.mark.asyncio
-@patch("context_cli.core.auditor.check_nlweb", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_x402", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_mcp_endpoint", new_callable=AsyncMock)
-@patch(
-    "context_cli.core.auditor.check_markdown_accept",
-    new_callable=AsyncMock,
-)
-@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
-async def test_audit_url_returns_agent_readiness(
-    mock_robots, mock_llms, mock_crawl,
-    mock_agents_md, mock_md_accept, mock_mcp, mock_x402, mock_nlweb,
-):
+async def test_audit_url_returns_agent_readiness(agent_mocks):
     """audit_url() should return AuditReport with agent_readiness."""
-    mock_robots.return_value = _make_robots()
-    mock_llms.return_value = _make_llms()
-    mock_crawl.return_value = _make_crawl()
-    mock_agents_md.return_value = _make_agents_md()
-    mock_md_accept.return_value = _make_md_accept()
-    mock_mcp.return_value = _make_mcp()
-    mock_x402.return_value = _make_x402()
-    mock_nlweb.return_value = _make_nlweb()
-
     report = await audit_url(_SEED)
 
     assert report.agent_readiness is not None
@@ -245,30 +259,9 @@ async def test_audit_url_returns_agent_readiness(
 
 
 @pytest.mark.asyncio
-@patch("context_cli.core.auditor.check_nlweb", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_x402", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_mcp_endpoint", new_callable=AsyncMock)
-@patch(
-    "context_cli.core.auditor.check_markdown_accept",
-    new_callable=AsyncMock,
-)
-@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
-async def test_audit_url_agent_check_error_handling(
-    mock_robots, mock_llms, mock_crawl,
-    mock_agents_md, mock_md_accept, mock_mcp, mock_x402, mock_nlweb,
-):
+async def test_audit_url_agent_check_error_handling(agent_mocks):
     """One agent check fails, others succeed."""
-    mock_robots.return_value = _make_robots()
-    mock_llms.return_value = _make_llms()
-    mock_crawl.return_value = _make_crawl()
-    mock_agents_md.side_effect = RuntimeError("boom")
-    mock_md_accept.return_value = _make_md_accept()
-    mock_mcp.return_value = _make_mcp()
-    mock_x402.return_value = _make_x402()
-    mock_nlweb.return_value = _make_nlweb()
+    agent_mocks.check_agents_md.side_effect = RuntimeError("boom")
 
     report = await audit_url(_SEED)
 
@@ -282,30 +275,13 @@ async def test_audit_url_agent_check_error_handling(
 
 
 @pytest.mark.asyncio
-@patch("context_cli.core.auditor.check_nlweb", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_x402", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_mcp_endpoint", new_callable=AsyncMock)
-@patch(
-    "context_cli.core.auditor.check_markdown_accept",
-    new_callable=AsyncMock,
-)
-@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
-async def test_audit_url_all_agent_checks_fail(
-    mock_robots, mock_llms, mock_crawl,
-    mock_agents_md, mock_md_accept, mock_mcp, mock_x402, mock_nlweb,
-):
+async def test_audit_url_all_agent_checks_fail(agent_mocks):
     """All agent checks fail -- should produce default empty reports."""
-    mock_robots.return_value = _make_robots()
-    mock_llms.return_value = _make_llms()
-    mock_crawl.return_value = _make_crawl()
-    mock_agents_md.side_effect = RuntimeError("boom")
-    mock_md_accept.side_effect = RuntimeError("boom")
-    mock_mcp.side_effect = RuntimeError("boom")
-    mock_x402.side_effect = RuntimeError("boom")
-    mock_nlweb.side_effect = RuntimeError("boom")
+    for mock in (
+        agent_mocks.check_agents_md, agent_mocks.check_markdown_accept,
+        agent_mocks.check_mcp_endpoint, agent_mocks.check_x402, agent_mocks.check_nlweb,
+    ):
+        mock.side_effect = RuntimeError("boom")
 
     report = await audit_url(_SEED)
 
@@ -318,31 +294,8 @@ async def test_audit_url_all_agent_checks_fail(
 
 
 @pytest.mark.asyncio
-@patch("context_cli.core.auditor.check_nlweb", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_x402", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_mcp_endpoint", new_callable=AsyncMock)
-@patch(
-    "context_cli.core.auditor.check_markdown_accept",
-    new_callable=AsyncMock,
-)
-@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
-async def test_audit_url_agent_readiness_score_sum(
-    mock_robots, mock_llms, mock_crawl,
-    mock_agents_md, mock_md_accept, mock_mcp, mock_x402, mock_nlweb,
-):
+async def test_audit_url_agent_readiness_score_sum(agent_mocks):
     """Agent readiness total score is sum of sub-check scores."""
-    mock_robots.return_value = _make_robots()
-    mock_llms.return_value = _make_llms()
-    mock_crawl.return_value = _make_crawl()
-    mock_agents_md.return_value = _make_agents_md()  # score=5
-    mock_md_accept.return_value = _make_md_accept()  # score=5
-    mock_mcp.return_value = _make_mcp()  # score=4
-    mock_x402.return_value = _make_x402()  # score=2
-    mock_nlweb.return_value = _make_nlweb()  # score=1
-
     report = await audit_url(_SEED)
 
     ar = report.agent_readiness
@@ -358,82 +311,70 @@ async def test_audit_url_agent_readiness_score_sum(
 # ── _build_agent_readiness tests ────────────────────────────────────────────
 
 
-def test_build_agent_readiness_happy_path():
-    """All results valid -> correct total score."""
-    errors: list[str] = []
-    ar = _build_agent_readiness(
-        _make_agents_md(), _make_md_accept(), _make_mcp(),
-        _make_semantic_html(), _make_x402(), _make_nlweb(), errors,
-    )
-    assert ar.score == 20.0
-    assert errors == []
+_FAILED_CHECK_ERRORS = [
+    "AGENTS.md check failed: a",
+    "Markdown accept check failed: b",
+    "MCP endpoint check failed: c",
+    "x402 check failed: d",
+    "NLWeb check failed: e",
+]
 
 
-def test_build_agent_readiness_with_exceptions():
-    """Exception results -> default reports, errors logged."""
+@pytest.mark.parametrize(
+    ("inputs", "expected_score", "expected_errors"),
+    [
+        pytest.param(
+            (_make_agents_md(), _make_md_accept(), _make_mcp(),
+             _make_semantic_html(), _make_x402(), _make_nlweb()),
+            20.0, [], id="happy-path",
+        ),
+        pytest.param(
+            (RuntimeError("a"), RuntimeError("b"), RuntimeError("c"),
+             _make_semantic_html(), RuntimeError("d"), RuntimeError("e")),
+            _make_semantic_html().score, _FAILED_CHECK_ERRORS, id="exceptions",
+        ),
+        pytest.param(
+            (_make_agents_md(), _make_md_accept(), _make_mcp(),
+             "not a report", _make_x402(), _make_nlweb()),
+            5 + 5 + 4 + 0 + 2 + 1, [], id="bad-semantic-html",
+        ),
+        pytest.param(
+            (_make_agents_md(), _make_md_accept(), _make_mcp(),
+             RuntimeError("boom"), _make_x402(), _make_nlweb()),
+            5 + 5 + 4 + 0 + 2 + 1, [], id="semantic-html-exception-not-logged",
+        ),
+    ],
+)
+def test_build_agent_readiness(inputs, expected_score, expected_errors):
+    """Total score sums the sub-checks; each failed check is logged by label, in order."""
     errors: list[str] = []
+    ar = _build_agent_readiness(*inputs, errors)
+    assert ar.score == expected_score
+    assert errors == expected_errors
+
+
+def test_build_agent_readiness_defaults_failed_checks():
+    """Exception results and non-report values are replaced by default reports."""
     ar = _build_agent_readiness(
-        RuntimeError("boom"), RuntimeError("boom"),
-        RuntimeError("boom"), _make_semantic_html(),
-        RuntimeError("boom"), RuntimeError("boom"), errors,
+        RuntimeError("boom"), RuntimeError("boom"), RuntimeError("boom"),
+        "not a report", RuntimeError("boom"), RuntimeError("boom"), [],
     )
     assert ar.agents_md.found is False
     assert ar.markdown_accept.supported is False
     assert ar.mcp_endpoint.found is False
+    assert ar.semantic_html.score == 0
     assert ar.x402.found is False
     assert ar.nlweb.found is False
-    # Only semantic_html has a score
-    assert ar.score == _make_semantic_html().score
-    assert len(errors) == 5
-
-
-def test_build_agent_readiness_bad_semantic_html():
-    """Non-SemanticHtmlReport value -> default."""
-    errors: list[str] = []
-    ar = _build_agent_readiness(
-        _make_agents_md(), _make_md_accept(), _make_mcp(),
-        "not a report", _make_x402(), _make_nlweb(), errors,
-    )
-    assert ar.semantic_html.score == 0
-    assert ar.score == 5 + 5 + 4 + 0 + 2 + 1
 
 
 # ── _audit_site_inner agent readiness tests ──────────────────────────────
 
 
 @pytest.mark.asyncio
-@patch("context_cli.core.auditor.check_nlweb", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_x402", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_mcp_endpoint", new_callable=AsyncMock)
-@patch(
-    "context_cli.core.auditor.check_markdown_accept",
-    new_callable=AsyncMock,
-)
-@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.extract_pages", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.discover_pages", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
-async def test_site_inner_returns_agent_readiness(
-    mock_robots, mock_llms, mock_crawl, mock_discover, mock_batch,
-    mock_agents_md, mock_md_accept, mock_mcp, mock_x402, mock_nlweb,
-):
+async def test_site_inner_returns_agent_readiness(agent_mocks):
     """_audit_site_inner should populate agent_readiness."""
     from context_cli.core.auditor import _audit_site_inner
 
-    mock_robots.return_value = _make_robots()
-    mock_llms.return_value = _make_llms()
-    mock_crawl.return_value = _make_crawl()
-    mock_discover.return_value = DiscoveryResult(
-        method="sitemap", urls_sampled=[_SEED],
-    )
-    mock_agents_md.return_value = _make_agents_md()
-    mock_md_accept.return_value = _make_md_accept()
-    mock_mcp.return_value = _make_mcp()
-    mock_x402.return_value = _make_x402()
-    mock_nlweb.return_value = _make_nlweb()
-
     errors: list[str] = []
     report = await _audit_site_inner(
         _SEED, "example.com", 10, 0.0, errors, lambda _: None,
@@ -445,37 +386,12 @@ async def test_site_inner_returns_agent_readiness(
 
 
 @pytest.mark.asyncio
-@patch("context_cli.core.auditor.check_nlweb", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_x402", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_mcp_endpoint", new_callable=AsyncMock)
-@patch(
-    "context_cli.core.auditor.check_markdown_accept",
-    new_callable=AsyncMock,
-)
-@patch("context_cli.core.auditor.check_agents_md", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.extract_pages", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.discover_pages", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.extract_page", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_llms_txt", new_callable=AsyncMock)
-@patch("context_cli.core.auditor.check_robots", new_callable=AsyncMock)
-async def test_site_inner_agent_error_handling(
-    mock_robots, mock_llms, mock_crawl, mock_discover, mock_batch,
-    mock_agents_md, mock_md_accept, mock_mcp, mock_x402, mock_nlweb,
-):
+async def test_site_inner_agent_error_handling(agent_mocks):
     """Agent check failures in site audit are handled gracefully."""
     from context_cli.core.auditor import _audit_site_inner
 
-    mock_robots.return_value = _make_robots()
-    mock_llms.return_value = _make_llms()
-    mock_crawl.return_value = _make_crawl()
-    mock_discover.return_value = DiscoveryResult(
-        method="sitemap", urls_sampled=[_SEED],
-    )
-    mock_agents_md.side_effect = RuntimeError("boom")
-    mock_md_accept.side_effect = RuntimeError("boom")
-    mock_mcp.return_value = _make_mcp()
-    mock_x402.return_value = _make_x402()
-    mock_nlweb.return_value = _make_nlweb()
+    agent_mocks.check_agents_md.side_effect = RuntimeError("boom")
+    agent_mocks.check_markdown_accept.side_effect = RuntimeError("boom")
 
     errors: list[str] = []
     report = await _audit_site_inner(
@@ -370,6 +370,25 @@ def test_leaderboard_timeout_flag(tmp_path):
     assert captured_kwargs[0]["timeout"] == 30
 
 
+def test_leaderboard_shares_one_client(tmp_path):
+    """All leaderboard audits should reuse one HTTP client."""
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("https://a.com\nhttps://b.com\n")
+    clients: list = []
+
+    async def _fake(url, **kwargs):
+        clients.append(kwargs["client"])
+        return _mock_report(url, waste=30.0)
+
+    with patch("context_cli.cli.leaderboard.audit_url", side_effect=_fake):
+        result = runner.invoke(app, ["leaderboard", str(url_file)])
+
+    assert result.exit_code == 0
+    assert len(clients) == 2
+    assert clients[0] is clients[1]
+    assert clients[0].is_closed
+
+
 def test_leaderboard_concurrency_flag(tmp_path):
     """Leaderboard --concurrency should limit parallel audits."""
     import asyncio
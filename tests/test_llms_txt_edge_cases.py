@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import httpx
 import pytest
 
+from context_cli.core.checks._cache import origin_cache_scope
 from context_cli.core.checks.llms_txt import check_llms_txt
 
 
@@ -284,3 +286,111 @@ async def test_neither_llms_found():
     assert report.llms_full_found is False
     assert report.url is None
     assert report.llms_full_url is None
+
+
+@pytest.mark.asyncio
+async def test_probes_run_concurrently():
+    """The well-known probe is sent without waiting for /llms.txt to finish."""
+    well_known_requested = asyncio.Event()
+
+    async def mock_get(url, **kwargs):
+        resp = AsyncMock()
+        resp.status_code = 404
+        if url.endswith("/.well-known/llms.txt"):
+            well_known_requested.set()
+        elif url.endswith("/llms.txt"):
+            await asyncio.wait_for(well_known_requested.wait(), timeout=1)
+        return resp
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(side_effect=mock_get)
+
+    report = await check_llms_txt("https://example.com", mock_client)
+
+    assert report.found is False
+    assert mock_client.get.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_root_path_preferred_over_well_known():
+    """When both locations exist, /llms.txt is reported even if slower."""
+
+    async def mock_get(url, **kwargs):
+        resp = AsyncMock()
+        if url.endswith("/llms.txt"):
+            if "well-known" not in url:
+                await asyncio.sleep(0.01)
+            resp.status_code = 200
+            resp.text = "# Site"
+        else:
+            resp.status_code = 404
+        return resp
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(side_effect=mock_get)
+
+    report = await check_llms_txt("https://example.com", mock_client)
+
+    assert report.url == "https://example.com/llms.txt"
+
+
+@pytest.mark.asyncio
+async def test_results_cached_per_origin():
+    """A second URL on the same origin reuses the probe results."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.text = "# Site"
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    with origin_cache_scope():
+        first = await check_llms_txt("https://example.com/a", mock_client)
+        second = await check_llms_txt("https://example.com/b?x=1", mock_client)
+
+    assert mock_client.get.await_count == 4
+    assert second == first
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_share_probes():
+    """Concurrent checks for one origin share a single set of probes."""
+
+    async def mock_get(url, **kwargs):
+        await asyncio.sleep(0.01)
+        resp = AsyncMock()
+        resp.status_code = 404
+        return resp
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(side_effect=mock_get)
+
+    with origin_cache_scope():
+        reports = await asyncio.gather(
+            *(check_llms_txt(f"https://example.com/p{i}", mock_client) for i in range(3))
+        )
+
+    assert all(r.found is False for r in reports)
+    assert mock_client.get.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_next_run_sees_newly_published_llms_txt():
+    """A "not found" result is not carried over into the next audit run."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 404
+    mock_response.text = ""
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    with origin_cache_scope():
+        before = await check_llms_txt("https://example.com", mock_client)
+    mock_response.status_code = 200
+    mock_response.text = "# Site"
+    with origin_cache_scope():
+        after = await check_llms_txt("https://example.com", mock_client)
+
+    assert before.found is False
+    assert after.found is True
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -202,7 +202,7 @@ async def test_recommend_tool_audits_first(mock_audit, mock_gen_recs):
 
     await _recommend_fn("https://example.com")
 
-    mock_audit.assert_called_once_with("https://example.com")
+    mock_audit.assert_called_once_with("https://example.com", client=ANY)
     mock_gen_recs.assert_called_once_with(report)
 
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
@@ -68,7 +68,7 @@ async def test_audit_tool_single_page():
 
         result = await _audit_fn("https://example.com", single_page=True)
 
-        mock_audit.assert_called_once_with("https://example.com")
+        mock_audit.assert_called_once_with("https://example.com", client=ANY)
         assert result["url"] == "https://example.com"
         assert result["overall_score"] == 55.0
         assert "robots" in result
@@ -83,7 +83,7 @@ async def test_audit_tool_site_audit():
 
         result = await _audit_fn("https://example.com")
 
-        mock_audit.assert_called_once_with("https://example.com", max_pages=10)
+        mock_audit.assert_called_once_with("https://example.com", max_pages=10, client=ANY)
         assert result["domain"] == "example.com"
         assert result["overall_score"] == 68.0
         assert "discovery" in result
@@ -97,7 +97,7 @@ async def test_audit_tool_custom_max_pages():
 
         await _audit_fn("https://example.com", max_pages=5)
 
-        mock_audit.assert_called_once_with("https://example.com", max_pages=5)
+        mock_audit.assert_called_once_with("https://example.com", max_pages=5, client=ANY)
 
 
 @pytest.mark.asyncio
@@ -198,7 +198,7 @@ async def test_agent_readiness_audit_with_data():
 
         result = await _agent_readiness_fn("https://example.com")
 
-        mock_audit.assert_called_once_with("https://example.com")
+        mock_audit.assert_called_once_with("https://example.com", client=ANY)
         assert isinstance(result, dict)
         assert result["score"] == 12
         assert result["detail"] == "4/6 checks passed"
@@ -427,3 +427,43 @@ async def test_generate_agents_md_tool_preserves_url(
     result = await _generate_agents_md_fn(test_url)
 
     assert result["url"] == test_url
+
+
+@pytest.mark.asyncio
+async def test_audit_tools_share_one_client():
+    """Repeated tool calls on one loop reuse a single pooled HTTP client."""
+    with patch("context_cli.server.audit_url", new_callable=AsyncMock) as mock_audit:
+        mock_audit.return_value = _mock_single_report()
+
+        await _audit_fn("https://a.example.com", single_page=True)
+        await _audit_fn("https://b.example.com", single_page=True)
+
+    first, second = (c.kwargs["client"] for c in mock_audit.call_args_list)
+    assert first is second
+    await first.aclose()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_shared_client():
+    """Server shutdown closes the shared client; the next call gets a fresh one."""
+    from context_cli.server import _audit_client, _lifespan, mcp
+
+    client = _audit_client()
+    async with _lifespan(mcp):
+        pass
+
+    assert client.is_closed
+    fresh = _audit_client()
+    assert fresh is not client
+    async with _lifespan(mcp):
+        pass
+    assert fresh.is_closed
+
+
+@pytest.mark.asyncio
+async def test_lifespan_without_client():
+    """Shutdown is a no-op when no audit ever ran."""
+    from context_cli.server import _lifespan, mcp
+
+    async with _lifespan(mcp) as context:
+        assert context == {}
@@ -0,0 +1,232 @@
+"""Tests for the per-origin cache shared by the origin-scoped checks."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from context_cli.core.auditor import _client_scope
+from context_cli.core.checks._cache import (
+    OriginCache,
+    clear_origin_caches,
+    origin_cache_scope,
+)
+from context_cli.core.checks.agents_md import PROBE_PATHS, check_agents_md
+from context_cli.core.checks.llms_txt import check_llms_txt
+from context_cli.core.checks.mcp_endpoint import check_mcp_endpoint
+from context_cli.core.checks.nlweb import check_nlweb
+from context_cli.core.checks.robots import check_robots
+
+
+def _client(status: int = 200, text: str = "", content_type: str = "text/plain"):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.text = text
+    resp.headers = {"content-type": content_type}
+    resp.json.return_value = {"tools": []}
+    client = AsyncMock(spec=httpx.AsyncClient)
+    client.get = AsyncMock(return_value=resp)
+    return client
+
+
+# ── OriginCache ──────────────────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_cache_reuses_result_within_ttl():
+    cache: OriginCache[int] = OriginCache()
+    probe = AsyncMock(return_value=1)
+
+    with origin_cache_scope():
+        assert await cache.get("https://a.com", probe) == 1
+        assert await cache.get("https://a.com", probe) == 1
+        assert await cache.get("https://b.com", probe) == 1
+
+    assert probe.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_outside_scope_always_probes():
+    cache: OriginCache[int] = OriginCache()
+    probe = AsyncMock(return_value=1)
+
+    await cache.get("o", probe)
+    await cache.get("o", probe)
+
+    assert probe.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_results_do_not_outlive_their_scope():
+    cache: OriginCache[int] = OriginCache()
+    probe = AsyncMock(side_effect=[1, 2])
+
+    with origin_cache_scope():
+        assert await cache.get("o", probe) == 1
+    with origin_cache_scope():
+        assert await cache.get("o", probe) == 2
+
+
+@pytest.mark.asyncio
+async def test_nested_scope_shares_outer_results():
+    cache: OriginCache[int] = OriginCache()
+    probe = AsyncMock(return_value=1)
+
+    with origin_cache_scope():
+        await cache.get("o", probe)
+        with origin_cache_scope():
+            await cache.get("o", probe)
+        await cache.get("o", probe)
+
+    assert probe.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_coalesces_concurrent_probes():
+    cache: OriginCache[int] = OriginCache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def probe() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 7
+
+    with origin_cache_scope():
+        pending = asyncio.gather(cache.get("o", probe), cache.get("o", probe))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await pending == [7, 7]
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_store_failures():
+    cache: OriginCache[int] = OriginCache()
+    probe = AsyncMock(side_effect=[RuntimeError("down"), 3])
+
+    with origin_cache_scope():
+        with pytest.raises(RuntimeError):
+            await cache.get("o", probe)
+        assert await cache.get("o", probe) == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_after_ttl():
+    cache: OriginCache[int] = OriginCache()
+    probe = AsyncMock(side_effect=[1, 2])
+
+    with origin_cache_scope():
+        await cache.get("o", probe, ttl=0.0)
+
+        assert await cache.get("o", probe, ttl=0.0) == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_drops_inflight_probes():
+    cache: OriginCache[int] = OriginCache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def probe() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    with origin_cache_scope():
+        first = asyncio.ensure_future(cache.get("o", probe))
+        await asyncio.sleep(0)
+        cache.clear()
+        second = asyncio.ensure_future(cache.get("o", probe))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == [2, 2]
+        # The cleared probe's late result is not stored over the new one
+        assert await cache.get("o", probe) == 2
+    assert calls == 2
+
+
+def test_clear_outside_scope_is_a_no_op():
+    OriginCache().clear()
+    clear_origin_caches()
+
+
+# ── Cached agent-readiness probes ────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_agents_md_probed_once_per_origin():
+    client = _client()
+
+    with origin_cache_scope():
+        first = await check_agents_md("https://example.com/a", client)
+        second = await check_agents_md("https://example.com/b", client)
+
+    assert client.get.await_count == 1
+    assert first == second and first is not second
+    assert second.found is True
+
+
+@pytest.mark.asyncio
+async def test_mcp_endpoint_probed_once_per_origin():
+    client = _client()
+
+    with origin_cache_scope():
+        await check_mcp_endpoint("https://example.com/a", client)
+        report = await check_mcp_endpoint("https://example.com/b", client)
+
+    assert client.get.await_count == 1
+    assert report.url == "https://example.com/.well-known/mcp.json"
+
+
+@pytest.mark.asyncio
+async def test_nlweb_well_known_cached_but_html_checked_per_page():
+    client = _client(status=404)
+    html = (
+        '<script type="application/ld+json">'
+        '{"@type": "NLWebEndpoint"}</script>'
+    )
+
+    with origin_cache_scope():
+        plain = await check_nlweb("https://example.com/a", client)
+        with_schema = await check_nlweb("https://example.com/b", client, html=html)
+
+    assert client.get.await_count == 1
+    assert plain.found is False
+    assert with_schema.schema_extensions is True
+
+
+@pytest.mark.asyncio
+async def test_clear_origin_caches_resets_every_check():
+    client = _client()
+
+    with origin_cache_scope():
+        await check_agents_md("https://example.com", client)
+        clear_origin_caches()
+        await check_agents_md("https://example.com", client)
+
+    assert client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_each_audit_probes_the_origin_afresh():
+    """Results are shared within one audit; the next audit sees newly published files."""
+    client = _client(status=404)
+
+    async with _client_scope(client, timeout=15):
+        missing = await check_agents_md("https://example.com/a", client)
+        await check_agents_md("https://example.com/b", client)
+    client.get.return_value.status_code = 200
+    async with _client_scope(client, timeout=15):
+        published = await check_agents_md("https://example.com/a", client)
+
+    assert missing.found is False
+    assert published.found is True
+    assert client.get.await_count == len(PROBE_PATHS) + 1
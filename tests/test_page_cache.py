@@ -0,0 +1,296 @@
+"""Tests for the on-disk page analysis cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from context_cli.core.auditor import audit_page_content
+from context_cli.core.models import (
+    AuditReport,
+    ContentReport,
+    LlmsTxtReport,
+    RobotsReport,
+    SchemaOrgResult,
+    SchemaReport,
+)
+from context_cli.core.page_cache import (
+    DEFAULT_CACHE_DIR,
+    PAGE_CACHE_MAX_ENTRIES,
+    PageCache,
+    page_cache_key,
+)
+from context_cli.main import app
+
+runner = CliRunner()
+
+_HTML = '<script type="application/ld+json">{"@type": "Organization", "name": "X"}</script>'
+_MARKDOWN = "# Title\n\nSome body text."
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PageCache:
+    return PageCache(tmp_path / "pages")
+
+
+# ── Keys and storage ─────────────────────────────────────────────────────────
+
+
+def test_default_cache_dir():
+    cache = PageCache()
+    assert cache.cache_dir == DEFAULT_CACHE_DIR
+    assert cache.max_entries == PAGE_CACHE_MAX_ENTRIES
+
+
+def test_key_depends_on_html_and_markdown():
+    key = page_cache_key(_HTML, _MARKDOWN)
+    assert key == page_cache_key(_HTML, _MARKDOWN)
+    assert key != page_cache_key(_HTML + " ", _MARKDOWN)
+    assert key != page_cache_key(_HTML, _MARKDOWN + " ")
+    # Separator prevents ("ab", "c") colliding with ("a", "bc")
+    assert page_cache_key("ab", "c") != page_cache_key("a", "bc")
+
+
+def test_round_trip(cache: PageCache):
+    schema = SchemaReport(
+        blocks_found=1,
+        schemas=[SchemaOrgResult(schema_type="Organization", properties=["name"])],
+        detail="1 JSON-LD block(s) found",
+    )
+    content = ContentReport(word_count=42, has_headings=True, detail="42 words")
+
+    cache.set("k", schema, content)
+
+    assert cache.get("k") == (schema, content)
+
+
+def test_miss_returns_none(cache: PageCache):
+    assert cache.get("missing") is None
+
+
+def test_corrupt_entry_is_a_miss(cache: PageCache):
+    cache.cache_dir.mkdir(parents=True)
+    (cache.cache_dir / "bad.json").write_text("{not json")
+
+    assert cache.get("bad") is None
+
+
+def test_write_failure_is_ignored(tmp_path: Path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = PageCache(blocker / "pages")  # parent is a file: mkdir fails
+
+    cache.set("k", SchemaReport(), ContentReport())
+
+    assert cache.get("k") is None
+
+
+def test_failed_replace_removes_temp_file(cache: PageCache):
+    with patch("context_cli.core.page_cache.os.replace", side_effect=OSError("busy")):
+        cache.set("k", SchemaReport(), ContentReport())
+
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_each_write_uses_its_own_temp_file(cache: PageCache):
+    sources: list[str] = []
+    real_replace = os.replace
+
+    def record(src, dst):
+        sources.append(str(src))
+        real_replace(src, dst)
+
+    with patch("context_cli.core.page_cache.os.replace", side_effect=record):
+        cache.set("k", SchemaReport(), ContentReport())
+        cache.set("k", SchemaReport(), ContentReport())
+
+    assert len(set(sources)) == 2
+    assert [p.name for p in cache.cache_dir.iterdir()] == ["k.json"]
+
+
+def test_set_removes_only_stale_temp_files(cache: PageCache):
+    cache.cache_dir.mkdir(parents=True)
+    stale = cache.cache_dir / "stale.tmp"
+    fresh = cache.cache_dir / "fresh.tmp"
+    stale.write_text("")
+    fresh.write_text("")
+    os.utime(stale, (1_000, 1_000))
+
+    cache.set("k", SchemaReport(), ContentReport())
+
+    assert sorted(p.name for p in cache.cache_dir.iterdir()) == ["fresh.tmp", "k.json"]
+
+
+# ── Size bound ───────────────────────────────────────────────────────────────
+
+
+def _age(cache: PageCache, key: str, mtime: float) -> None:
+    os.utime(cache.cache_dir / f"{key}.json", (mtime, mtime))
+
+
+def test_set_prunes_least_recently_used_entries(tmp_path: Path):
+    cache = PageCache(tmp_path, max_entries=2)
+    cache.set("a", SchemaReport(), ContentReport())
+    cache.set("b", SchemaReport(), ContentReport())
+    _age(cache, "a", 1_000)
+    _age(cache, "b", 2_000)
+
+    cache.set("c", SchemaReport(), ContentReport())
+
+    assert sorted(p.stem for p in tmp_path.iterdir()) == ["b", "c"]
+
+
+def test_prune_waits_for_slack_past_the_cap(tmp_path: Path):
+    cache = PageCache(tmp_path, max_entries=10)
+    for i in range(11):
+        cache.set(f"k{i:02d}", SchemaReport(), ContentReport())
+    assert len(list(tmp_path.iterdir())) == 11
+
+    cache.set("k11", SchemaReport(), ContentReport())
+
+    assert len(list(tmp_path.iterdir())) == 10
+
+
+def test_directory_scanned_only_on_first_write(cache: PageCache):
+    cache.set("a", SchemaReport(), ContentReport())
+
+    with patch.object(cache, "_entries", side_effect=AssertionError("scanned")):
+        cache.set("b", SchemaReport(), ContentReport())
+
+
+def test_hit_refreshes_entry_so_it_survives_pruning(tmp_path: Path):
+    cache = PageCache(tmp_path, max_entries=2)
+    cache.set("a", SchemaReport(), ContentReport())
+    cache.set("b", SchemaReport(), ContentReport())
+    _age(cache, "a", 1_000)
+    _age(cache, "b", 2_000)
+
+    assert cache.get("a") is not None
+    cache.set("c", SchemaReport(), ContentReport())
+
+    assert sorted(p.stem for p in tmp_path.iterdir()) == ["a", "c"]
+
+
+def test_prune_tolerates_entries_vanishing(tmp_path: Path):
+    cache = PageCache(tmp_path, max_entries=1)
+    listed = cache._entries
+    vanished = tmp_path / "gone.json"
+
+    with patch.object(cache, "_entries", lambda: [vanished, *listed()]):
+        cache.set("a", SchemaReport(), ContentReport())
+
+    assert [p.stem for p in tmp_path.iterdir()] == ["a"]
+
+
+def test_prune_tolerates_unlink_failure(tmp_path: Path):
+    cache = PageCache(tmp_path, max_entries=1)
+    cache.set("a", SchemaReport(), ContentReport())
+
+    with patch.object(Path, "unlink", side_effect=OSError("busy")):
+        cache.set("b", SchemaReport(), ContentReport())
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_clear_removes_every_entry(cache: PageCache):
+    cache.set("a", SchemaReport(), ContentReport())
+    cache.set("b", SchemaReport(), ContentReport())
+
+    assert cache.clear() == 2
+    assert cache.get("a") is None
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_clear_removes_leftover_temp_files(cache: PageCache):
+    cache.set("a", SchemaReport(), ContentReport())
+    (cache.cache_dir / "leftover.tmp").write_text("")
+
+    assert cache.clear() == 1
+    assert list(cache.cache_dir.iterdir()) == []
+
+
+def test_clear_on_missing_dir_removes_nothing(cache: PageCache):
+    assert cache.clear() == 0
+
+
+def test_clear_skips_entries_it_cannot_delete(cache: PageCache):
+    cache.set("a", SchemaReport(), ContentReport())
+
+    with patch.object(Path, "unlink", side_effect=OSError("busy")):
+        assert cache.clear() == 0
+
+
+def test_entries_listing_failure_is_empty(cache: PageCache):
+    with patch.object(Path, "glob", side_effect=OSError("denied")):
+        assert cache.clear() == 0
+
+
+# ── audit_page_content integration ───────────────────────────────────────────
+
+
+def test_audit_page_content_reuses_cached_result(cache: PageCache):
+    first = audit_page_content(_HTML, _MARKDOWN, cache)
+
+    with (
+        patch("context_cli.core.auditor.check_schema_org") as mock_schema,
+        patch("context_cli.core.auditor.check_content") as mock_content,
+    ):
+        second = audit_page_content(_HTML, _MARKDOWN, cache)
+
+    mock_schema.assert_not_called()
+    mock_content.assert_not_called()
+    assert second == first
+    assert second[0] is not first[0]
+
+
+def test_audit_page_content_skips_cache_for_empty_page(cache: PageCache):
+    audit_page_content("", "", cache)
+
+    assert not cache.cache_dir.exists()
+
+
+# ── CLI flag ─────────────────────────────────────────────────────────────────
+
+
+def _run_lint(*args: str) -> dict:
+    captured: dict = {}
+
+    async def _fake(url, **kwargs):
+        captured.update(kwargs)
+        return AuditReport(
+            url=url,
+            overall_score=50,
+            robots=RobotsReport(found=False),
+            llms_txt=LlmsTxtReport(found=False),
+            schema_org=SchemaReport(),
+            content=ContentReport(),
+        )
+
+    with patch("context_cli.cli.audit.audit_url", side_effect=_fake):
+        result = runner.invoke(app, ["lint", "https://example.com", "--single", "--json", *args])
+    assert result.exit_code == 0, result.output
+    return captured
+
+
+def test_cli_uses_page_cache_by_default():
+    assert isinstance(_run_lint()["page_cache"], PageCache)
+
+
+def test_cli_no_cache_flag_disables_page_cache():
+    assert _run_lint("--no-cache")["page_cache"] is None
+
+
+def test_cache_clear_command(tmp_path: Path):
+    cache = PageCache(tmp_path)
+    cache.set("a", SchemaReport(), ContentReport())
+
+    with patch("context_cli.cli.cache.PageCache", return_value=cache):
+        result = runner.invoke(app, ["cache", "clear"])
+
+    assert result.exit_code == 0, result.output
+    assert "Removed 1 cached page(s)" in result.output
+    assert list(tmp_path.iterdir()) == []
@@ -61,6 +61,13 @@ def test_readability_below_threshold():
     assert _readability_grade(text) is None
 
 
+def test_readability_known_word_count_short_circuits():
+    """A caller-supplied word count below 30 skips tokenizing the text."""
+    text = "This is a simple sentence. " * 6
+    assert _readability_grade(text, word_count=29) is None
+    assert _readability_grade(text, word_count=30) is not None
+
+
 def test_readability_exactly_30_words():
     """Exactly 30 words should compute a grade (not None)."""
     text = "This is a simple sentence. " * 6  # 30 words, 6 sentences
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import httpx
 import pytest
 
+from context_cli.core.checks._cache import ORIGIN_CACHE_TTL, origin_cache_scope
 from context_cli.core.checks.robots import check_robots
 
 
@@ -63,6 +66,7 @@ async def test_specific_bot_blocked():
     claudebot = next(b for b in report.bots if b.bot == "ClaudeBot")
     assert gptbot.allowed is False
     assert claudebot.allowed is True
+    assert report.detail == f"{len(report.bots) - 1}/{len(report.bots)} AI bots allowed"
 
 
 @pytest.mark.asyncio
@@ -98,3 +102,123 @@ async def test_robots_txt_server_error():
     assert report.found is False
     assert raw_text is None
     assert "500" in report.detail
+
+
+@pytest.mark.asyncio
+async def test_robots_cached_per_origin():
+    """A second URL on the same origin reuses the fetched robots.txt."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.text = "User-agent: GPTBot\nDisallow: /\n"
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    with origin_cache_scope():
+        first, _ = await check_robots("https://example.com/a", mock_client)
+        second, raw_text = await check_robots(
+            "https://example.com/b", mock_client, bots=["GPTBot", "ClaudeBot"]
+        )
+
+    assert mock_client.get.await_count == 1
+    assert raw_text == "User-agent: GPTBot\nDisallow: /\n"
+    assert [b.allowed for b in second.bots] == [False, True]
+    assert first.bots[0].allowed is False
+
+
+@pytest.mark.asyncio
+async def test_robots_concurrent_fetches_coalesced():
+    """Concurrent checks for one origin share a single in-flight request."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.text = ""
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    with origin_cache_scope():
+        results = await asyncio.gather(
+            check_robots("https://example.com/a", mock_client),
+            check_robots("https://example.com/b", mock_client),
+        )
+
+    assert mock_client.get.await_count == 1
+    assert all(report.found for report, _ in results)
+
+
+@pytest.mark.asyncio
+async def test_next_run_sees_fixed_robots_txt():
+    """Unblocking a bot in robots.txt shows up in the very next audit run."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.text = "User-agent: GPTBot\nDisallow: /\n"
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    with origin_cache_scope():
+        before, _ = await check_robots("https://example.com", mock_client, bots=["GPTBot"])
+    mock_response.text = "User-agent: GPTBot\nAllow: /\n"
+    with origin_cache_scope():
+        after, _ = await check_robots("https://example.com", mock_client, bots=["GPTBot"])
+
+    assert before.bots[0].allowed is False
+    assert after.bots[0].allowed is True
+
+
+@pytest.mark.asyncio
+async def test_robots_cache_expires(monkeypatch):
+    """Entries older than ORIGIN_CACHE_TTL are fetched again."""
+    from context_cli.core.checks import _cache as cache_mod
+
+    now = [0.0]
+    monkeypatch.setattr(cache_mod, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.text = ""
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    with origin_cache_scope():
+        await check_robots("https://example.com", mock_client)
+        now[0] = ORIGIN_CACHE_TTL
+        await check_robots("https://example.com", mock_client)
+
+    assert mock_client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_robots_fetch_errors_not_cached():
+    """A failed fetch should not poison the cache for later checks."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.text = ""
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(
+        side_effect=[httpx.ConnectError("Connection refused"), mock_response]
+    )
+
+    with origin_cache_scope():
+        failed, _ = await check_robots("https://example.com", mock_client)
+        ok, _ = await check_robots("https://example.com", mock_client)
+
+    assert failed.found is False
+    assert ok.found is True
+
+
+@pytest.mark.asyncio
+async def test_allow_wins_over_equal_length_disallow():
+    """RFC 9309: the least restrictive rule wins when Allow and Disallow tie."""
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.text = "User-agent: *\nDisallow: /\nAllow: /\n"
+
+    mock_client = AsyncMock(spec=httpx.AsyncClient)
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    report, _ = await check_robots("https://example.com", mock_client)
+
+    assert all(b.allowed for b in report.bots)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+from unittest.mock import patch
+
+from selectolax.lexbor import LexborHTMLParser
 
 from context_cli.core.markdown_engine.config import MarkdownEngineConfig
 from context_cli.core.markdown_engine.sanitizer import (
-    _remove_by_patterns,
+    _compile_patterns,
+    _matches_patterns,
     sanitize_html,
 )
 
@@ -556,69 +559,82 @@ class TestComplexRealWorldHTML:
         assert "Visible content" in result
 
 
-class TestRemoveByPatterns:
-    """Direct tests for _remove_by_patterns helper."""
+class TestMatchesPatterns:
+    """Direct tests for the _matches_patterns id/class predicate."""
 
-    def test_removes_matching_element_by_id(self) -> None:
-        soup = BeautifulSoup(
-            '<div id="tracking-pixel">T</div><p>Keep</p>', "html.parser"
-        )
-        _remove_by_patterns(soup, ["tracking"])
-        assert "tracking" not in str(soup)
-        assert "Keep" in str(soup)
+    @staticmethod
+    def _matches(attrs: dict[str, str | None], *patterns: str) -> bool:
+        return _matches_patterns(attrs, _compile_patterns(patterns))
 
-    def test_removes_matching_element_by_class(self) -> None:
-        soup = BeautifulSoup(
-            '<div class="popup-overlay">O</div><p>Keep</p>', "html.parser"
-        )
-        _remove_by_patterns(soup, ["popup"])
-        assert "popup" not in str(soup)
-        assert "Keep" in str(soup)
+    def test_matches_id(self) -> None:
+        assert self._matches({"id": "tracking-pixel"}, "tracking")
 
-    def test_no_match_preserves_all(self) -> None:
-        soup = BeautifulSoup(
-            '<div class="content">Text</div><p>More</p>', "html.parser"
-        )
-        _remove_by_patterns(soup, ["nonexistent-pattern"])
-        assert "Text" in str(soup)
-        assert "More" in str(soup)
+    def test_matches_class(self) -> None:
+        assert self._matches({"class": "popup-overlay"}, "popup")
 
-    def test_empty_patterns_list(self) -> None:
-        soup = BeautifulSoup(
-            '<div class="anything">Text</div>', "html.parser"
-        )
-        _remove_by_patterns(soup, [])
-        assert "Text" in str(soup)
+    def test_no_match(self) -> None:
+        assert not self._matches({"class": "content"}, "nonexistent-pattern")
+
+    def test_empty_patterns(self) -> None:
+        assert not _matches_patterns({"class": "anything"}, None)
 
     def test_element_with_no_id_or_class(self) -> None:
-        """Elements without id or class should not crash."""
-        soup = BeautifulSoup("<div>Text</div><p>More</p>", "html.parser")
-        _remove_by_patterns(soup, ["something"])
-        assert "Text" in str(soup)
-        assert "More" in str(soup)
+        assert not self._matches({"href": "/"}, "something")
+        assert not self._matches({"id": None}, "something")
 
     def test_case_insensitive_matching(self) -> None:
-        soup = BeautifulSoup(
-            '<div class="CookieBanner">C</div><p>Keep</p>', "html.parser"
+        assert self._matches({"class": "CookieBanner"}, "cookiebanner")
+
+    def test_class_whitespace_normalized(self) -> None:
+        assert self._matches({"class": "promo\n  box"}, "promo box")
+
+    def test_regex_metacharacters_matched_literally(self) -> None:
+        assert self._matches({"id": "a.b"}, "a.b")
+        assert not self._matches({"id": "axb"}, "a.b")
+
+    def test_patterns_compiled_once(self) -> None:
+        _compile_patterns.cache_clear()
+        sanitize_html('<div class="ad-x">A</div><div class="ad-y">B</div><p>Keep</p>')
+        sanitize_html('<div class="cookie">C</div><p>Keep</p>')
+        assert _compile_patterns.cache_info().misses == 1
+
+    def test_whitespace_and_non_ascii_patterns(self) -> None:
+        """Patterns CSS cannot express still match via the Python predicate."""
+        html = (
+            '<div class="promo\n  box">Promo</div><div id="CAFÉ-strip">Cafe</div>'
+            "<p>Keep</p>"
         )
-        _remove_by_patterns(soup, ["cookiebanner"])
-        assert "CookieBanner" not in str(soup)
-        assert "Keep" in str(soup)
-
-    def test_decomposed_child_skipped(self) -> None:
-        """When a parent is decomposed, its children (already in find_all list)
-        should be skipped because their attrs become None."""
-        soup = BeautifulSoup(
+        config = MarkdownEngineConfig(ad_patterns=["promo box", "café"])
+        result = sanitize_html(html, config=config)
+        assert "Promo" not in result
+        assert "Cafe" not in result
+        assert "Keep" in result
+
+    def test_pattern_with_quotes(self) -> None:
+        html = '<div class=\'say"hi\'>Quoted</div><p>Keep</p>'
+        config = MarkdownEngineConfig(ad_patterns=['say"hi'])
+        result = sanitize_html(html, config=config)
+        assert "Quoted" not in result
+        assert "Keep" in result
+
+    def test_element_matching_several_rules_removed_once(self) -> None:
+        html = (
+            '<nav class="ad-nav" style="display:none" aria-hidden="true">'
+            '<script>x()</script><span class="cookie">C</span></nav><p>Keep</p>'
+        )
+        result = sanitize_html(html)
+        assert "<nav" not in result
+        assert "Keep" in result
+
+    def test_nested_matches_removed_with_parent(self) -> None:
+        """A matching element inside a removed one is dropped with it."""
+        html = (
             '<div class="ad-wrapper"><span class="ad-inner">Ad text</span></div>'
-            "<p>Keep</p>",
-            "html.parser",
+            "<p>Keep</p>"
         )
-        # Both "ad-wrapper" and "ad-inner" match the pattern "ad-".
-        # When the parent div is decomposed first, the child span's attrs
-        # becomes None. The function must handle this gracefully.
-        _remove_by_patterns(soup, ["ad-"])
-        assert "Ad text" not in str(soup)
-        assert "Keep" in str(soup)
+        result = sanitize_html(html)
+        assert "Ad text" not in result
+        assert "Keep" in result
 
 
 class TestConfigModel:
@@ -657,6 +673,21 @@ class TestConfigModel:
         assert config.cookie_banner_patterns == ["my-custom"]
         assert config.ad_patterns == ["my-ad"]
 
+    def test_patterns_normalized_at_construction(self) -> None:
+        config = MarkdownEngineConfig(
+            cookie_banner_patterns=["Cookie-Bar", "cookie-bar", "GDPR"],
+            ad_patterns=["Promo"],
+        )
+        assert config.cookie_banner_patterns == ["cookie-bar", "gdpr"]
+        assert config.ad_patterns == ["promo"]
+
+    def test_patterns_mutated_after_construction_still_match(self) -> None:
+        config = MarkdownEngineConfig()
+        config.ad_patterns.append("Promo-Box")
+        result = sanitize_html('<div class="promo-box">Buy</div><p>Keep</p>', config)
+        assert "Buy" not in result
+        assert "Keep" in result
+
     def test_model_serialization(self) -> None:
         config = MarkdownEngineConfig()
         data = config.model_dump()
@@ -664,3 +695,25 @@ class TestConfigModel:
         assert "cookie_banner_patterns" in data
         restored = MarkdownEngineConfig(**data)
         assert restored == config
+
+
+class TestSanitizeMemoization:
+    """Repeated inputs are served from the content cache."""
+
+    def test_same_html_parsed_once(self) -> None:
+        html = "<div><script>x</script><p>Body</p></div>"
+        with patch(
+            "context_cli.core.markdown_engine.sanitizer.LexborHTMLParser",
+            wraps=LexborHTMLParser,
+        ) as parser:
+            first = sanitize_html(html)
+            second = sanitize_html(html, MarkdownEngineConfig())
+        assert first == second
+        assert parser.call_count == 1
+
+    def test_config_is_part_of_the_key(self) -> None:
+        html = "<div><script>x</script><p>Body</p></div>"
+        stripped = sanitize_html(html)
+        kept = sanitize_html(html, MarkdownEngineConfig(strip_scripts=False))
+        assert "<script>" not in stripped
+        assert "<script>" in kept
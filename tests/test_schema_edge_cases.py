@@ -103,3 +103,165 @@ def test_no_at_type():
 
     assert report.blocks_found == 1
     assert report.schemas[0].schema_type == "Unknown"
+
+
+def test_single_quoted_type_attribute():
+    """Single-quoted type attributes and extra attributes should still match."""
+    html = """
+    <html><head>
+    <script id="ld" type='application/ld+json' data-x="1">
+    {"@type": "Organization", "name": "Acme"}
+    </script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 1
+    assert report.schemas[0].schema_type == "Organization"
+
+
+def test_unquoted_type_attribute_falls_back_to_parser():
+    """Unquoted attributes miss the fast regex path but are found via the parser."""
+    html = """
+    <html><head>
+    <script type=application/ld+json>
+    {"@type": "Product", "name": "Widget"}
+    </script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 1
+    assert report.schemas[0].schema_type == "Product"
+
+
+def test_mixed_quoted_and_unquoted_type_attributes():
+    """A quoted regex match does not hide an unquoted tag on the same page."""
+    html = """
+    <html><head>
+    <script type="application/ld+json">{"@type": "Organization", "name": "Acme"}</script>
+    <script type=application/ld+json>{"@type": "Product", "name": "Widget"}</script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 2
+    assert [s.schema_type for s in report.schemas] == ["Organization", "Product"]
+
+
+def test_mixed_case_type_value_does_not_hide_unquoted_tag():
+    """A type value in other case is not counted as a match, so the fallback still runs."""
+    html = (
+        '<script type="Application/LD+JSON">{"@type": "Organization"}</script>'
+        '<script type=application/ld+json>{"@type": "Product"}</script>'
+    )
+    report = check_schema_org(html)
+
+    assert [s.schema_type for s in report.schemas] == ["Product"]
+
+
+def test_commented_out_block_ignored():
+    """JSON-LD inside an HTML comment is not part of the page."""
+    html = """
+    <html><head>
+    <!-- <script type="application/ld+json">{"@type": "Organization"}</script> -->
+    <script type="application/ld+json">{"@type": "Product"}</script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 1
+    assert report.schemas[0].schema_type == "Product"
+
+
+def test_other_script_types_ignored():
+    """Scripts with other types (or a data-type attribute) are not JSON-LD."""
+    html = """
+    <html><head>
+    <script data-type="application/ld+json">{"@type": "Article"}</script>
+    <script type="application/json">{"@type": "Article"}</script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 0
+
+
+def test_mime_type_outside_script_in_fallback():
+    """The MIME type appearing only in text (even after an XML prolog) finds nothing."""
+    html = '<?xml version="1.0" encoding="utf-8"?><p>application/ld+json</p>'
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 0
+
+
+def test_non_finite_numbers_accepted():
+    """NaN/Infinity values parse the same with or without the orjson extra."""
+    html = '<script type="application/ld+json">{"@type": "Recipe", "x": NaN}</script>'
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 1
+    assert report.schemas[0].schema_type == "Recipe"
+
+
+def test_non_json_blobs_skipped():
+    """Whitespace-only and non-object/array blobs are skipped before parsing."""
+    html = """
+    <html><head>
+    <script type="application/ld+json">   \n  </script>
+    <script type="application/ld+json">null</script>
+    <script type="application/ld+json">"just a string"</script>
+    <script type="application/ld+json">
+      {"@type": "Organization", "name": "Acme"}
+    </script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 1
+    assert report.schemas[0].schema_type == "Organization"
+
+
+def test_empty_items_skipped():
+    """Items with neither @type nor properties do not produce a block."""
+    html = """
+    <html><head>
+    <script type="application/ld+json">
+    [{}, {"@context": "https://schema.org"}, {"@type": "WebSite"}]
+    </script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 1
+    assert report.schemas[0].schema_type == "WebSite"
+
+
+def test_non_string_type_skipped():
+    """Items whose @type is not a string (or list of strings) are skipped."""
+    html = """
+    <html><head>
+    <script type="application/ld+json">
+    [{"@type": {"nested": true}, "name": "X"}, {"@type": "Product", "name": "Y"}]
+    </script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.blocks_found == 1
+    assert report.schemas[0].schema_type == "Product"
+    assert report.model_dump()["schemas"][0]["properties"] == ["name"]
+
+
+def test_properties_exclude_keywords_only():
+    """Only @-prefixed JSON-LD keywords are excluded from properties."""
+    html = """
+    <html><head>
+    <script type="application/ld+json">
+    {"@context": "https://schema.org", "@type": "Product", "@id": "#p", "name": "W", "": 1}
+    </script>
+    </head><body></body></html>
+    """
+    report = check_schema_org(html)
+
+    assert report.schemas[0].properties == ["name", ""]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from context_cli.core.models import (
     BotAccessResult,
     ContentReport,
@@ -10,7 +12,7 @@ from context_cli.core.models import (
     SchemaOrgResult,
     SchemaReport,
 )
-from context_cli.core.scoring import compute_scores
+from context_cli.core.scoring import compute_scores, score_content
 
 AI_BOT_NAMES = [
     "GPTBot", "ChatGPT-User", "Google-Extended",
@@ -82,6 +84,30 @@ def test_half_bots_allowed():
     assert r.score == round(25 * 7 / 13, 1)
 
 
+def test_robots_score_follows_edited_bot_list():
+    """The score is taken from the bots as they are now, e.g. after filtering."""
+    bots = [BotAccessResult(bot=name, allowed=i != 0) for i, name in enumerate(AI_BOT_NAMES[:4])]
+    robots = RobotsReport(found=True, bots=bots)
+    robots.bots = robots.bots[1:]
+
+    r, _, _, _, _ = compute_scores(
+        robots, LlmsTxtReport(found=False), SchemaReport(), ContentReport()
+    )
+
+    assert r.score == 25
+    assert "allowed_mask" not in r.model_dump()
+
+
+@pytest.mark.parametrize(
+    ("word_count", "expected"),
+    [(0, 0), (149, 0), (150, 8), (399, 8), (400, 15), (799, 15),
+     (800, 20), (1499, 20), (1500, 25), (100_000, 25)],
+)
+def test_content_word_tier_boundaries(word_count, expected):
+    """Each tier starts exactly at its minimum word count."""
+    assert score_content(ContentReport(word_count=word_count)).score == expected
+
+
 def test_schema_score_capped_at_25():
     """Even with many unique types, schema score should cap at 25."""
     schemas = [
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+from bs4 import BeautifulSoup
+
 from context_cli.core.checks.semantic_html import check_semantic_html
 
 
@@ -95,3 +99,15 @@ def test_header_and_nav_without_main():
     assert report.has_nav is True
     assert report.has_main is False
     assert report.score == 1.0
+
+
+def test_shared_soup_skips_parse():
+    """A pre-parsed soup is used as-is and gives the same report."""
+    html = "<html><body><header>S</header><nav>M</nav><main>C</main></body></html>"
+    soup = BeautifulSoup(html, "html.parser")
+
+    with patch("context_cli.core.checks.semantic_html.BeautifulSoup") as mock_bs:
+        report = check_semantic_html(html, soup=soup)
+
+    mock_bs.assert_not_called()
+    assert report == check_semantic_html(html)
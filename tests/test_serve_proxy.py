@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import gzip
+import threading
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
@@ -12,9 +15,11 @@ from aiohttp.test_utils import TestClient, TestServer
 from context_cli.core.serve.proxy import (
     _SOURCE_HEADER,
     _SOURCE_VALUE,
+    _UPSTREAM_LIMITS,
     _build_upstream_url,
     _filter_headers,
     _is_html,
+    _MarkdownCache,
     _wants_markdown,
     create_proxy_app,
     run_proxy,
@@ -27,10 +32,34 @@ from context_cli.core.serve.proxy import (
 SIMPLE_HTML = "<html><body><h1>Hello</h1><p>World</p></body></html>"
 
 
+class _Upstream:
+    """Stand-in upstream server: records requests, answers with ``response``."""
+
+    def __init__(self) -> None:
+        self.response = httpx.Response(200, headers={"Content-Type": "text/html"})
+        self.error: Exception | None = None
+        self.urls: list[str] = []
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.urls.append(str(request.url))
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+@pytest.fixture
+def upstream():
+    """The fake upstream answering the proxy's requests."""
+    return _Upstream()
+
+
 @pytest.fixture
-def proxy_app():
-    """Create a proxy app pointing at a dummy upstream."""
-    return create_proxy_app("http://upstream.test")
+def proxy_app(upstream):
+    """Create a proxy app whose upstream client talks to the fake upstream."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    return create_proxy_app("http://upstream.test", client=client)
 
 
 @pytest.fixture
@@ -41,23 +70,7 @@ async def proxy_client(proxy_app):
     await client.start_server()
     yield client
     await client.close()
-
-
-def _make_httpx_response(
-    *,
-    status_code: int = 200,
-    headers: dict[str, str] | None = None,
-    text: str = "",
-    content: bytes | None = None,
-) -> MagicMock:
-    """Build a mock httpx.Response with the given attributes."""
-    resp = MagicMock()
-    resp.status_code = status_code
-    _headers = headers or {}
-    resp.headers = httpx.Headers(_headers)
-    resp.text = text
-    resp.content = content if content is not None else text.encode()
-    return resp
+    await proxy_app["client"].aclose()
 
 
 # ---------------------------------------------------------------------------
@@ -189,6 +202,14 @@ class TestFilterHeaders:
         filtered = _filter_headers(headers)
         assert filtered == {}
 
+    def test_mixed_case_and_repeated_headers(self):
+        headers = httpx.Headers([
+            ("CONNECTION", "close"),
+            ("Vary", "Accept"),
+            ("vary", "Cookie"),
+        ])
+        assert _filter_headers(headers) == {"vary": "Accept, Cookie"}
+
 
 # ---------------------------------------------------------------------------
 # Integration tests: proxy handler via test client
@@ -196,22 +217,13 @@ class TestFilterHeaders:
 
 
 @pytest.mark.asyncio
-async def test_markdown_response_for_html_upstream(proxy_client):
+async def test_markdown_response_for_html_upstream(proxy_client, upstream):
     """Accept: text/markdown + HTML upstream -> markdown conversion."""
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "text/html; charset=utf-8"},
-        text=SIMPLE_HTML,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html; charset=utf-8"}, text=SIMPLE_HTML,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get(
-            "/page", headers={"Accept": "text/markdown"},
-        )
+    resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
 
     assert resp.status == 200
     assert "text/markdown" in resp.headers.get("Content-Type", "")
@@ -222,20 +234,13 @@ async def test_markdown_response_for_html_upstream(proxy_client):
 
 
 @pytest.mark.asyncio
-async def test_passthrough_when_no_accept_markdown(proxy_client):
+async def test_passthrough_when_no_accept_markdown(proxy_client, upstream):
     """Without Accept: text/markdown, HTML is passed through unchanged."""
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "text/html"},
-        text=SIMPLE_HTML,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html"}, text=SIMPLE_HTML,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get("/page", headers={"Accept": "text/html"})
+    resp = await proxy_client.get("/page", headers={"Accept": "text/html"})
 
     assert resp.status == 200
     body = await resp.read()
@@ -244,23 +249,13 @@ async def test_passthrough_when_no_accept_markdown(proxy_client):
 
 
 @pytest.mark.asyncio
-async def test_passthrough_json_even_with_accept_markdown(proxy_client):
+async def test_passthrough_json_even_with_accept_markdown(proxy_client, upstream):
     """JSON upstream is passed through even when Accept: text/markdown is set."""
-    json_body = '{"key": "value"}'
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "application/json"},
-        text=json_body,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "application/json"}, text='{"key": "value"}',
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get(
-            "/api/data", headers={"Accept": "text/markdown"},
-        )
+    resp = await proxy_client.get("/api/data", headers={"Accept": "text/markdown"})
 
     assert resp.status == 200
     body = await resp.text()
@@ -269,22 +264,14 @@ async def test_passthrough_json_even_with_accept_markdown(proxy_client):
 
 
 @pytest.mark.asyncio
-async def test_passthrough_image_binary(proxy_client):
+async def test_passthrough_image_binary(proxy_client, upstream):
     """Binary image upstream is passed through unchanged."""
     image_bytes = b"\x89PNG\r\n\x1a\nfakepng"
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "image/png"},
-        text="",
-        content=image_bytes,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "image/png"}, content=image_bytes,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get("/image.png")
+    resp = await proxy_client.get("/image.png")
 
     assert resp.status == 200
     body = await resp.read()
@@ -292,18 +279,11 @@ async def test_passthrough_image_binary(proxy_client):
 
 
 @pytest.mark.asyncio
-async def test_upstream_timeout_returns_502(proxy_client):
+async def test_upstream_timeout_returns_502(proxy_client, upstream):
     """Upstream timeout -> 502 Bad Gateway."""
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(
-            side_effect=httpx.TimeoutException("timed out"),
-        )
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
+    upstream.error = httpx.TimeoutException("timed out")
 
-        resp = await proxy_client.get("/slow-page")
+    resp = await proxy_client.get("/slow-page")
 
     assert resp.status == 502
     body = await resp.text()
@@ -311,98 +291,63 @@ async def test_upstream_timeout_returns_502(proxy_client):
 
 
 @pytest.mark.asyncio
-async def test_upstream_connection_error_returns_502(proxy_client):
+async def test_upstream_connection_error_returns_502(proxy_client, upstream):
     """Upstream connection refused -> 502 Bad Gateway."""
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(
-            side_effect=httpx.ConnectError("Connection refused"),
-        )
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
+    upstream.error = httpx.ConnectError("Connection refused")
 
-        resp = await proxy_client.get("/down")
+    resp = await proxy_client.get("/down")
 
     assert resp.status == 502
 
 
 @pytest.mark.asyncio
-async def test_x_content_source_header_present(proxy_client):
+async def test_x_content_source_header_present(proxy_client, upstream):
     """Markdown responses include the X-Content-Source header."""
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "text/html"},
-        text=SIMPLE_HTML,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html"}, text=SIMPLE_HTML,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get("/", headers={"Accept": "text/markdown"})
+    resp = await proxy_client.get("/", headers={"Accept": "text/markdown"})
 
     assert resp.headers[_SOURCE_HEADER] == _SOURCE_VALUE
 
 
 @pytest.mark.asyncio
-async def test_x_content_source_absent_for_passthrough(proxy_client):
+async def test_x_content_source_absent_for_passthrough(proxy_client, upstream):
     """Pass-through responses do NOT include X-Content-Source."""
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "text/html"},
-        text=SIMPLE_HTML,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html"}, text=SIMPLE_HTML,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get("/", headers={"Accept": "text/html"})
+    resp = await proxy_client.get("/", headers={"Accept": "text/html"})
 
     assert _SOURCE_HEADER not in resp.headers
 
 
 @pytest.mark.asyncio
-async def test_upstream_status_preserved(proxy_client):
+async def test_upstream_status_preserved(proxy_client, upstream):
     """Upstream 404 status code is forwarded to client."""
-    mock_resp = _make_httpx_response(
-        status_code=404,
+    upstream.response = httpx.Response(
+        404,
         headers={"Content-Type": "text/html"},
         text="<html><body>Not Found</body></html>",
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get("/missing")
+    resp = await proxy_client.get("/missing")
 
     assert resp.status == 404
 
 
 @pytest.mark.asyncio
-async def test_upstream_500_with_markdown_accept(proxy_client):
+async def test_upstream_500_with_markdown_accept(proxy_client, upstream):
     """Upstream 500 with Accept: text/markdown still converts to markdown."""
-    mock_resp = _make_httpx_response(
-        status_code=500,
+    upstream.response = httpx.Response(
+        500,
         headers={"Content-Type": "text/html"},
         text="<html><body><h1>Server Error</h1></body></html>",
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get(
-            "/error", headers={"Accept": "text/markdown"},
-        )
+    resp = await proxy_client.get("/error", headers={"Accept": "text/markdown"})
 
     assert resp.status == 500
     body = await resp.text()
@@ -411,22 +356,11 @@ async def test_upstream_500_with_markdown_accept(proxy_client):
 
 
 @pytest.mark.asyncio
-async def test_empty_html_upstream(proxy_client):
+async def test_empty_html_upstream(proxy_client, upstream):
     """Empty HTML body with Accept: text/markdown returns empty markdown."""
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "text/html"},
-        text="",
-    )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
+    upstream.response = httpx.Response(200, headers={"Content-Type": "text/html"}, text="")
 
-        resp = await proxy_client.get(
-            "/empty", headers={"Accept": "text/markdown"},
-        )
+    resp = await proxy_client.get("/empty", headers={"Accept": "text/markdown"})
 
     assert resp.status == 200
     body = await resp.text()
@@ -434,62 +368,32 @@ async def test_empty_html_upstream(proxy_client):
 
 
 @pytest.mark.asyncio
-async def test_multiple_paths_proxied(proxy_client):
+async def test_multiple_paths_proxied(proxy_client, upstream):
     """Different paths are forwarded to different upstream URLs."""
-    calls = []
-
-    async def capture_get(url, **kwargs):
-        calls.append(url)
-        return _make_httpx_response(
-            headers={"Content-Type": "text/html"},
-            text=f"<html><body>{url}</body></html>",
-        )
-
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(side_effect=capture_get)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
+    await proxy_client.get("/page-a")
+    await proxy_client.get("/page-b")
+    await proxy_client.get("/deep/nested/path")
 
-        await proxy_client.get("/page-a")
-        await proxy_client.get("/page-b")
-        await proxy_client.get("/deep/nested/path")
-
-    assert len(calls) == 3
-    assert calls[0] == "http://upstream.test/page-a"
-    assert calls[1] == "http://upstream.test/page-b"
-    assert calls[2] == "http://upstream.test/deep/nested/path"
+    assert upstream.urls == [
+        "http://upstream.test/page-a",
+        "http://upstream.test/page-b",
+        "http://upstream.test/deep/nested/path",
+    ]
 
 
 @pytest.mark.asyncio
-async def test_query_string_forwarded(proxy_client):
+async def test_query_string_forwarded(proxy_client, upstream):
     """Query strings are forwarded to the upstream."""
-    captured_url = []
-
-    async def capture_get(url, **kwargs):
-        captured_url.append(url)
-        return _make_httpx_response(
-            headers={"Content-Type": "text/html"},
-            text=SIMPLE_HTML,
-        )
-
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(side_effect=capture_get)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
+    await proxy_client.get("/search?q=hello&page=2")
 
-        await proxy_client.get("/search?q=hello&page=2")
-
-    assert captured_url[0] == "http://upstream.test/search?q=hello&page=2"
+    assert upstream.urls[0] == "http://upstream.test/search?q=hello&page=2"
 
 
 @pytest.mark.asyncio
-async def test_custom_upstream_headers_preserved(proxy_client):
+async def test_custom_upstream_headers_preserved(proxy_client, upstream):
     """Custom upstream response headers are forwarded to the client."""
-    mock_resp = _make_httpx_response(
+    upstream.response = httpx.Response(
+        200,
         headers={
             "Content-Type": "text/html",
             "X-Custom-Header": "custom-value",
@@ -497,42 +401,491 @@ async def test_custom_upstream_headers_preserved(proxy_client):
         },
         text=SIMPLE_HTML,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get("/page")
+    resp = await proxy_client.get("/page")
 
     assert resp.headers.get("X-Custom-Header") == "custom-value"
     assert resp.headers.get("X-Request-Id") == "abc-123"
 
 
 @pytest.mark.asyncio
-async def test_content_type_overridden_for_markdown(proxy_client):
+async def test_content_type_overridden_for_markdown(proxy_client, upstream):
     """Content-Type is replaced with text/markdown for converted responses."""
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "text/html; charset=utf-8"},
-        text=SIMPLE_HTML,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html; charset=utf-8"}, text=SIMPLE_HTML,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get(
-            "/page", headers={"Accept": "text/markdown"},
-        )
+    resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
 
     ct = resp.headers.get("Content-Type", "")
     assert "text/markdown" in ct
     assert "charset=utf-8" in ct
 
 
+@pytest.mark.asyncio
+async def test_passthrough_body_streamed_in_chunks(proxy_client, upstream):
+    """Pass-through bodies are relayed chunk by chunk and the upstream is closed."""
+    closed = False
+
+    async def chunks():
+        nonlocal closed
+        try:
+            yield b"part-1;"
+            yield b"part-2"
+        finally:
+            closed = True
+
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "application/javascript"}, content=chunks(),
+    )
+
+    resp = await proxy_client.get("/bundle.js", headers={"Accept": "text/markdown"})
+
+    assert resp.status == 200
+    assert resp.headers.get("Transfer-Encoding") == "chunked"
+    assert await resp.read() == b"part-1;part-2"
+    assert closed
+
+
+@pytest.mark.asyncio
+async def test_passthrough_body_decoded_to_match_dropped_encoding(proxy_client, upstream):
+    """Content-Encoding is not forwarded, so the relayed body is decoded."""
+    upstream.response = httpx.Response(
+        200,
+        headers={"Content-Type": "text/plain", "Content-Encoding": "gzip"},
+        content=gzip.compress(b"plain text"),
+    )
+
+    resp = await proxy_client.get("/file.txt")
+
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.read() == b"plain text"
+
+
+@pytest.mark.asyncio
+async def test_markdown_body_decoded_across_chunks(proxy_client, upstream):
+    """HTML is decoded incrementally, honouring the charset across chunk splits."""
+    encoded = "<html><body><h1>Caf\u00e9 cr\u00e8me</h1></body></html>".encode("utf-8")
+    split = encoded.index(b"\xc3") + 1
+
+    async def chunks():
+        yield encoded[:split]
+        yield encoded[split:]
+
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html; charset=utf-8"}, content=chunks(),
+    )
+    with patch(
+        "context_cli.core.serve.proxy.convert_html_to_markdown", return_value="md",
+    ) as convert:
+        await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    convert.assert_called_once_with(encoded.decode("utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_markdown_body_uses_declared_charset(proxy_client, upstream):
+    """A non-UTF-8 charset from Content-Type is used to decode the HTML."""
+    upstream.response = httpx.Response(
+        200,
+        headers={"Content-Type": "text/html; charset=iso-8859-1"},
+        content="<html><body><h1>Se\u00f1or</h1></body></html>".encode("iso-8859-1"),
+    )
+
+    resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert "Se\u00f1or" in await resp.text()
+
+
+@pytest.mark.asyncio
+async def test_markdown_body_timeout_returns_502(proxy_client, upstream):
+    """A timeout while reading HTML for conversion -> 502 Bad Gateway."""
+
+    async def stalled():
+        yield b"<html><body>"
+        raise httpx.ReadTimeout("timed out")
+
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html"}, content=stalled(),
+    )
+
+    resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert resp.status == 502
+
+
+@pytest.mark.asyncio
+async def test_markdown_conversion_runs_off_the_event_loop(proxy_client, upstream):
+    """HTML-to-markdown conversion runs in a worker thread, not on the loop."""
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html"}, text=SIMPLE_HTML,
+    )
+    threads: list[threading.Thread] = []
+
+    def convert(html: str) -> str:
+        threads.append(threading.current_thread())
+        return "# converted"
+
+    with patch("context_cli.core.serve.proxy.convert_html_to_markdown", convert):
+        resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert await resp.text() == "# converted"
+    assert threads and threads[0] is not threading.current_thread()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_page_served_from_markdown_cache(proxy_client, upstream):
+    """A 304 on revalidation returns the cached markdown without reconverting."""
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html", "ETag": '"v1"'}, text=SIMPLE_HTML,
+    )
+    first = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+    first_body = await first.text()
+
+    upstream.response = httpx.Response(304, headers={"ETag": '"v1"'})
+    with patch("context_cli.core.serve.proxy.convert_html_to_markdown") as convert:
+        second = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert "if-none-match" not in upstream.requests[0].headers
+    assert upstream.requests[1].headers["if-none-match"] == '"v1"'
+    convert.assert_not_called()
+    assert second.status == 200
+    assert await second.text() == first_body
+    assert "text/markdown" in second.headers["Content-Type"]
+    assert second.headers[_SOURCE_HEADER] == _SOURCE_VALUE
+
+
+@pytest.mark.asyncio
+async def test_last_modified_sent_as_if_modified_since(proxy_client, upstream):
+    """Last-Modified is revalidated with If-Modified-Since."""
+    stamp = "Wed, 21 Oct 2015 07:28:00 GMT"
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html", "Last-Modified": stamp}, text=SIMPLE_HTML,
+    )
+
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert upstream.requests[1].headers["if-modified-since"] == stamp
+
+
+@pytest.mark.asyncio
+async def test_changed_page_reconverted_and_recached(proxy_client, upstream):
+    """A full 200 on revalidation replaces the cached conversion."""
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html", "ETag": '"v1"'}, text=SIMPLE_HTML,
+    )
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    upstream.response = httpx.Response(
+        200,
+        headers={"Content-Type": "text/html", "ETag": '"v2"'},
+        text="<html><body><h1>Updated</h1></body></html>",
+    )
+    resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert "Updated" in await resp.text()
+    assert upstream.requests[2].headers["if-none-match"] == '"v2"'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("status", "headers"),
+    [(200, {"Content-Type": "text/html"}),
+     (404, {"Content-Type": "text/html", "ETag": '"v1"'})],
+)
+async def test_uncacheable_conversion_not_revalidated(proxy_client, upstream, status, headers):
+    """Responses without validators, or not 200, are never revalidated."""
+    upstream.response = httpx.Response(status, headers=headers, text=SIMPLE_HTML)
+
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert "if-none-match" not in upstream.requests[1].headers
+
+
+@pytest.mark.asyncio
+async def test_passthrough_request_not_made_conditional(proxy_client, upstream):
+    """Only markdown requests use the cache; others always get a full body."""
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html", "ETag": '"v1"'}, text=SIMPLE_HTML,
+    )
+
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+    resp = await proxy_client.get("/page", headers={"Accept": "text/html"})
+
+    assert "if-none-match" not in upstream.requests[1].headers
+    assert await resp.read() == SIMPLE_HTML.encode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_control", ["no-store", "private, max-age=60", "Private"])
+async def test_unshareable_conversion_not_cached(proxy_client, upstream, cache_control):
+    """Responses marked no-store or private are never cached or revalidated."""
+    upstream.response = httpx.Response(
+        200,
+        headers={"Content-Type": "text/html", "ETag": '"v1"', "Cache-Control": cache_control},
+        text=SIMPLE_HTML,
+    )
+
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+    await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert "if-none-match" not in upstream.requests[1].headers
+
+
+@pytest.mark.asyncio
+async def test_cached_conversion_does_not_replay_set_cookie(proxy_client, upstream):
+    """A 304 hit serves the cached markdown without the first client's cookie."""
+    upstream.response = httpx.Response(
+        200,
+        headers={"Content-Type": "text/html", "ETag": '"v1"', "Set-Cookie": "sid=first"},
+        text=SIMPLE_HTML,
+    )
+    first = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    upstream.response = httpx.Response(304, headers={"ETag": '"v1"'})
+    second = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert first.headers["Set-Cookie"] == "sid=first"
+    assert await second.text() == await first.text()
+    assert "Set-Cookie" not in second.headers
+
+
+def test_markdown_cache_expires_entries():
+    """Entries older than the TTL are dropped on lookup."""
+    cache = _MarkdownCache(ttl=0.0)
+    cache.set("u", b"md", {}, httpx.Headers({"ETag": '"v1"'}))
+
+    assert cache.get("u") is None
+
+
+def test_markdown_cache_refresh_restarts_ttl_and_takes_new_validators():
+    """A refreshed entry outlives its original TTL and revalidates with new validators."""
+    cache = _MarkdownCache(ttl=300.0)
+    with patch("context_cli.core.serve.proxy.time") as clock:
+        clock.monotonic.return_value = 0.0
+        cache.set("u", b"md", {}, httpx.Headers({"ETag": '"v1"'}))
+        clock.monotonic.return_value = 200.0
+        cache.refresh("u", cache.get("u"), httpx.Headers({"ETag": '"v2"'}))
+        clock.monotonic.return_value = 400.0
+        entry = cache.get("u")
+
+    assert entry is not None
+    assert entry.body == b"md"
+    assert entry.validators == {"If-None-Match": '"v2"'}
+
+
+@pytest.mark.asyncio
+async def test_revalidated_page_survives_past_ttl(proxy_client, upstream):
+    """A 304 restarts the TTL, so the page is still revalidated rather than refetched."""
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html", "ETag": '"v1"'}, text=SIMPLE_HTML,
+    )
+    with patch("context_cli.core.serve.proxy.time") as clock:
+        clock.monotonic.return_value = 0.0
+        await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+        upstream.response = httpx.Response(304, headers={"ETag": '"v1"'})
+        clock.monotonic.return_value = 200.0
+        await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+        clock.monotonic.return_value = 400.0
+        resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert upstream.requests[2].headers["if-none-match"] == '"v1"'
+    assert "Hello" in await resp.text()
+
+
+def test_markdown_cache_evicts_least_recently_used():
+    """Past maxsize, the least recently used URL is evicted."""
+    cache = _MarkdownCache(maxsize=2)
+    validators = httpx.Headers({"ETag": '"v1"'})
+    cache.set("a", b"A", {}, validators)
+    cache.set("b", b"B", {}, validators)
+    assert cache.get("a") is not None
+    cache.set("c", b"C", {}, validators)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_markdown_cache_drops_entry_that_lost_its_validators():
+    """Re-storing a URL without validators removes its stale entry."""
+    cache = _MarkdownCache()
+    cache.set("u", b"old", {}, httpx.Headers({"ETag": '"v1"'}))
+    cache.set("u", b"new", {}, httpx.Headers())
+
+    assert cache.get("u") is None
+
+
+@pytest.mark.asyncio
+async def test_markdown_request_reuses_inflight_conversion(proxy_app, proxy_client, upstream):
+    """A markdown request for a URL already being converted shares that result."""
+    shared = asyncio.get_running_loop().create_future()
+    shared.set_result((200, b"# shared", {"content-type": "text/markdown; charset=utf-8"}))
+    proxy_app["inflight"]["http://upstream.test/page"] = shared
+
+    resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert await resp.text() == "# shared"
+    assert upstream.requests == []
+
+
+@pytest.mark.asyncio
+async def test_waiter_fetches_itself_when_shared_fetch_has_no_markdown(
+    proxy_app, proxy_client, upstream,
+):
+    """When the in-flight fetch produced no markdown, the waiter fetches on its own."""
+    shared = asyncio.get_running_loop().create_future()
+    shared.set_result(None)
+    proxy_app["inflight"]["http://upstream.test/page"] = shared
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html"}, text=SIMPLE_HTML,
+    )
+
+    resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
+
+    assert "Hello" in await resp.text()
+    assert len(upstream.requests) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("content_type", "converted"), [("text/html", True), ("application/json", False)],
+)
+async def test_leader_publishes_conversion_to_waiters(
+    proxy_app, proxy_client, upstream, content_type, converted,
+):
+    """The first markdown request registers itself and publishes its outcome."""
+    release = asyncio.Event()
+
+    async def body():
+        await release.wait()
+        yield SIMPLE_HTML.encode()
+
+    upstream.response = httpx.Response(200, headers={"Content-Type": content_type}, content=body())
+    inflight = proxy_app["inflight"]
+    request = asyncio.ensure_future(
+        proxy_client.get("/page", headers={"Accept": "text/markdown"}),
+    )
+    while "http://upstream.test/page" not in inflight:
+        await asyncio.sleep(0)
+    shared = inflight["http://upstream.test/page"]
+    release.set()
+    resp = await request
+
+    assert inflight == {}
+    if converted:
+        status, md_body, _ = shared.result()
+        assert status == 200
+        assert md_body.decode() == await resp.text()
+    else:
+        assert shared.result() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_control", [None, "private"])
+async def test_leader_does_not_share_cookies_or_private_pages(
+    proxy_app, proxy_client, upstream, cache_control,
+):
+    """Waiters never get the leader's Set-Cookie, nor a private response at all."""
+    release = asyncio.Event()
+
+    async def body():
+        await release.wait()
+        yield SIMPLE_HTML.encode()
+
+    headers = {"Content-Type": "text/html", "Set-Cookie": "sid=leader"}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    upstream.response = httpx.Response(200, headers=headers, content=body())
+    inflight = proxy_app["inflight"]
+    request = asyncio.ensure_future(
+        proxy_client.get("/page", headers={"Accept": "text/markdown"}),
+    )
+    while "http://upstream.test/page" not in inflight:
+        await asyncio.sleep(0)
+    shared = inflight["http://upstream.test/page"]
+    release.set()
+    resp = await request
+
+    assert resp.headers["Set-Cookie"] == "sid=leader"
+    if cache_control:
+        assert shared.result() is None
+    else:
+        _, _, shared_headers = shared.result()
+        assert "set-cookie" not in shared_headers
+        assert shared_headers["content-type"] == "text/markdown; charset=utf-8"
+
+
+@pytest.mark.asyncio
+async def test_passthrough_requests_not_coalesced(proxy_app, proxy_client, upstream):
+    """Requests not asking for markdown never join an in-flight conversion."""
+    proxy_app["inflight"]["http://upstream.test/page"] = asyncio.get_running_loop().create_future()
+
+    await proxy_client.get("/page")
+
+    assert len(upstream.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_upstream_client(proxy_app, proxy_client):
+    """Every request goes through the app's client; it stays open between them."""
+    client = proxy_app["client"]
+    with patch.object(client, "send", wraps=client.send) as send:
+        await proxy_client.get("/a")
+        await proxy_client.get("/b")
+
+    assert send.call_count == 2
+    assert not client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_supplied_client_left_open_after_shutdown(proxy_app):
+    """A caller-supplied client is not closed when the app shuts down."""
+    client = TestClient(TestServer(proxy_app))
+    await client.start_server()
+    await client.close()
+
+    assert not proxy_app["client"].is_closed
+    await proxy_app["client"].aclose()
+
+
+@pytest.mark.asyncio
+async def test_default_client_opened_on_startup_and_closed_on_cleanup():
+    """Without a supplied client, the app owns a pooled client for its lifetime."""
+    app = create_proxy_app("http://upstream.test")
+    assert "client" not in app
+
+    client = TestClient(TestServer(app))
+    await client.start_server()
+    upstream_client = app["client"]
+    assert isinstance(upstream_client, httpx.AsyncClient)
+    assert not upstream_client.is_closed
+    await client.close()
+
+    assert upstream_client.is_closed
+
+
+@pytest.mark.parametrize("available", [True, False])
+@pytest.mark.asyncio
+async def test_default_client_negotiates_http2_when_h2_installed(available):
+    """HTTP/2 is enabled on the upstream client only when h2 is importable."""
+    app = create_proxy_app("http://upstream.test")
+    with (
+        patch("context_cli.core.serve.proxy._HTTP2_AVAILABLE", available),
+        patch("context_cli.core.serve.proxy.httpx.AsyncClient") as client_cls,
+    ):
+        client = TestClient(TestServer(app))
+        await client.start_server()
+        await client.close()
+
+    assert client_cls.call_args.kwargs["http2"] is available
+    assert client_cls.call_args.kwargs["limits"] is _UPSTREAM_LIMITS
+
+
 # ---------------------------------------------------------------------------
 # create_proxy_app tests
 # ---------------------------------------------------------------------------
@@ -569,7 +922,11 @@ class TestRunProxy:
 
     def test_run_proxy_calls_run_app(self):
         """run_proxy calls aiohttp.web.run_app with correct parameters."""
-        with patch("context_cli.core.serve.proxy.web.run_app") as mock_run:
+        loop = MagicMock()
+        with (
+            patch("context_cli.core.serve.proxy.web.run_app") as mock_run,
+            patch("context_cli.core.serve.proxy._new_event_loop", return_value=loop),
+        ):
             with patch(
                 "context_cli.core.serve.proxy.create_proxy_app",
             ) as mock_create:
@@ -578,11 +935,16 @@ class TestRunProxy:
                 run_proxy("http://example.com", port=9090, host="127.0.0.1")
 
             mock_create.assert_called_once_with("http://example.com")
-            mock_run.assert_called_once_with(mock_app, host="127.0.0.1", port=9090)
+            mock_run.assert_called_once_with(
+                mock_app, host="127.0.0.1", port=9090, loop=loop, print=print,
+            )
 
     def test_run_proxy_default_args(self):
         """run_proxy uses default host and port when not specified."""
-        with patch("context_cli.core.serve.proxy.web.run_app"):
+        with (
+            patch("context_cli.core.serve.proxy.web.run_app"),
+            patch("context_cli.core.serve.proxy._new_event_loop"),
+        ):
             with patch(
                 "context_cli.core.serve.proxy.create_proxy_app",
             ) as mock_create:
@@ -616,6 +978,14 @@ class TestServeCliCommand:
         ]
         assert "serve" in command_names
 
+    def test_cli_import_does_not_load_aiohttp(self):
+        """aiohttp is imported only when the serve command actually runs."""
+        import subprocess
+        import sys
+
+        code = "import sys, context_cli.main; sys.exit('aiohttp' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
     def test_serve_command_has_upstream_option(self):
         """The serve command requires --upstream."""
         import typer
@@ -642,8 +1012,11 @@ class TestServeCliCommand:
         register(test_app)
         runner = CliRunner()
 
-        with patch("context_cli.cli.serve.create_proxy_app") as mock_create:
-            with patch("context_cli.cli.serve.web.run_app") as mock_run:
+        with (
+            patch("context_cli.core.serve.proxy.create_proxy_app") as mock_create,
+            patch("context_cli.core.serve.proxy._new_event_loop"),
+        ):
+            with patch("aiohttp.web.run_app") as mock_run:
                 mock_create.return_value = MagicMock()
                 runner.invoke(
                     test_app,
@@ -664,8 +1037,11 @@ class TestServeCliCommand:
         register(test_app)
         runner = CliRunner()
 
-        with patch("context_cli.cli.serve.create_proxy_app") as mock_create:
-            with patch("context_cli.cli.serve.web.run_app") as mock_run:
+        with (
+            patch("context_cli.core.serve.proxy.create_proxy_app") as mock_create,
+            patch("context_cli.core.serve.proxy._new_event_loop"),
+        ):
+            with patch("aiohttp.web.run_app") as mock_run:
                 mock_create.return_value = MagicMock()
                 runner.invoke(
                     test_app,
@@ -680,29 +1056,24 @@ class TestServeCliCommand:
             call_kwargs = mock_run.call_args
             assert call_kwargs.kwargs["host"] == "127.0.0.1"
             assert call_kwargs.kwargs["port"] == 9999
+            assert call_kwargs.kwargs["print"] is None
 
 
 @pytest.mark.asyncio
-async def test_root_path_proxied(proxy_client):
+async def test_root_path_proxied(proxy_client, upstream):
     """Root path '/' is proxied correctly."""
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "text/html"},
-        text=SIMPLE_HTML,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html"}, text=SIMPLE_HTML,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get("/")
+    resp = await proxy_client.get("/")
 
     assert resp.status == 200
+    assert upstream.urls == ["http://upstream.test/"]
 
 
 @pytest.mark.asyncio
-async def test_markdown_conversion_strips_scripts(proxy_client):
+async def test_markdown_conversion_strips_scripts(proxy_client, upstream):
     """Markdown conversion strips script tags from output."""
     html_with_script = (
         "<html><body>"
@@ -710,20 +1081,11 @@ async def test_markdown_conversion_strips_scripts(proxy_client):
         "<h1>Clean Content</h1>"
         "</body></html>"
     )
-    mock_resp = _make_httpx_response(
-        headers={"Content-Type": "text/html"},
-        text=html_with_script,
+    upstream.response = httpx.Response(
+        200, headers={"Content-Type": "text/html"}, text=html_with_script,
     )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
 
-        resp = await proxy_client.get(
-            "/page", headers={"Accept": "text/markdown"},
-        )
+    resp = await proxy_client.get("/page", headers={"Accept": "text/markdown"})
 
     body = await resp.text()
     assert "alert" not in body
@@ -731,22 +1093,11 @@ async def test_markdown_conversion_strips_scripts(proxy_client):
 
 
 @pytest.mark.asyncio
-async def test_upstream_empty_content_type(proxy_client):
+async def test_upstream_empty_content_type(proxy_client, upstream):
     """Empty Content-Type from upstream -> passthrough (not HTML)."""
-    mock_resp = _make_httpx_response(
-        headers={},
-        text="raw data",
-    )
-    with patch("context_cli.core.serve.proxy.httpx.AsyncClient") as mock_cls:
-        mock_client_instance = AsyncMock()
-        mock_client_instance.get = AsyncMock(return_value=mock_resp)
-        mock_client_instance.__aenter__ = AsyncMock(return_value=mock_client_instance)
-        mock_client_instance.__aexit__ = AsyncMock(return_value=False)
-        mock_cls.return_value = mock_client_instance
-
-        resp = await proxy_client.get(
-            "/raw", headers={"Accept": "text/markdown"},
-        )
+    upstream.response = httpx.Response(200, content=b"raw data")
+
+    resp = await proxy_client.get("/raw", headers={"Accept": "text/markdown"})
 
     # Should passthrough because content-type is not HTML
     assert _SOURCE_HEADER not in resp.headers
@@ -94,6 +94,31 @@ def test_aggregate_page_scores_empty_pages():
     assert overall == 25 + 10
 
 
+def test_aggregate_page_scores_ors_content_flags():
+    """Each content flag is set if any page has it, and later pages still count."""
+    flags = [(False, True, False), (False, False, True), (True, True, True), (False,) * 3]
+    pages = []
+    for i, (headings, lists, code) in enumerate(flags):
+        page = _make_page(f"https://example.com/{i}", content_score=10, word_count=100)
+        page.content.has_headings = headings
+        page.content.has_lists = lists
+        page.content.has_code_blocks = code
+        pages.append(page)
+    robots = RobotsReport(found=True, score=25)
+    llms = LlmsTxtReport(found=False, score=0)
+
+    _, agg_content, _ = aggregate_page_scores(pages, robots, llms)
+    _, partial, _ = aggregate_page_scores(pages[:1], robots, llms)
+
+    assert (agg_content.has_headings, agg_content.has_lists, agg_content.has_code_blocks) == (
+        True, True, True,
+    )
+    assert (partial.has_headings, partial.has_lists, partial.has_code_blocks) == (
+        False, True, False,
+    )
+    assert agg_content.word_count == 100
+
+
 def test_aggregate_page_scores_skips_failed_pages():
     """Pages with errors and no content should be excluded from averaging."""
     pages = [
@@ -0,0 +1,53 @@
+"""Tests for the url_origin and url_depth helpers."""
+
+from __future__ import annotations
+
+from urllib.parse import urlparse
+
+import pytest
+
+from context_cli.core.checks._url import url_depth, url_origin
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com",
+        "https://example.com/",
+        "https://example.com/a/b?q=1#frag",
+        "https://example.com?q=1",
+        "https://example.com#top",
+        "http://user:pw@example.com:8080/path",
+        "HTTPS://Example.com/Path",
+        "example.com/page",
+        "",
+    ],
+)
+def test_matches_urlparse(url: str):
+    """url_origin should agree with the urlparse-based origin."""
+    parsed = urlparse(url)
+    assert url_origin(url) == f"{parsed.scheme}://{parsed.netloc}"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com",
+        "https://example.com/",
+        "https://example.com/about/",
+        "https://example.com/blog/2024/post",
+        "https://example.com//double//slash",
+        "https://example.com/a/b?q=/x/y#frag/z",
+        "https://example.com?q=/a/b",
+        "https://example.com#/a/b",
+        "https://example.com:8080/api/v1/data",
+        "https://example.com/a/;params",
+        "//example.com/a",
+        "example.com/page",
+        "",
+    ],
+)
+def test_depth_matches_urlparse(url: str):
+    """url_depth should agree with segment counting on urlparse's path."""
+    path = urlparse(url).path.strip("/")
+    assert url_depth(url) == (len(path.split("/")) if path else 0)
@@ -36,7 +36,7 @@ def _make_report(url: str = "https://example.com", score: float = 75.0) -> Audit
 
 class TestWatchCommand:
     @patch("context_cli.cli.watch.time.sleep", side_effect=KeyboardInterrupt)
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report())
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report())
     def test_watch_runs_one_iteration_then_ctrl_c(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -47,7 +47,7 @@ class TestWatchCommand:
         mock_run.assert_called_once()
 
     @patch("context_cli.cli.watch.time.sleep", side_effect=KeyboardInterrupt)
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report())
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report())
     def test_watch_with_json_flag(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -58,7 +58,7 @@ class TestWatchCommand:
         assert "example.com" in result.output
 
     @patch("context_cli.cli.watch.time.sleep", side_effect=KeyboardInterrupt)
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report())
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report())
     def test_watch_with_single_flag(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -70,7 +70,7 @@ class TestWatchCommand:
         assert "Run #1" in result.output
 
     @patch("context_cli.cli.watch.time.sleep", side_effect=KeyboardInterrupt)
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report())
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report())
     @patch("context_cli.cli.watch._save_to_history")
     def test_watch_with_save_flag(
         self, mock_save: MagicMock, mock_run: MagicMock, mock_sleep: MagicMock,
@@ -82,10 +82,28 @@ class TestWatchCommand:
         assert result.exit_code == 0
         mock_save.assert_called_once()
 
+    @patch("context_cli.cli.watch.time.sleep", side_effect=[None, KeyboardInterrupt])
+    def test_watch_reuses_one_event_loop(self, mock_sleep: MagicMock) -> None:
+        """Successive watch runs execute on the same event loop."""
+        import asyncio
+
+        loops: list[asyncio.AbstractEventLoop] = []
+
+        async def _fake(url, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return _make_report(url)
+
+        with patch("context_cli.cli.watch.audit_url", side_effect=_fake):
+            result = runner.invoke(app, ["watch", "https://example.com", "--single"])
+
+        assert result.exit_code == 0
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+
 
 class TestWatchFailUnder:
     @patch("context_cli.cli.watch.time.sleep")
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report(score=40.0))
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report(score=40.0))
     def test_watch_fail_under_exits_on_low_score(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -96,7 +114,7 @@ class TestWatchFailUnder:
         assert result.exit_code == 1
 
     @patch("context_cli.cli.watch.time.sleep", side_effect=KeyboardInterrupt)
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report(score=80.0))
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report(score=80.0))
     def test_watch_fail_under_continues_on_passing_score(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -110,7 +128,7 @@ class TestWatchFailUnder:
 
 class TestWatchGracefulShutdown:
     @patch("context_cli.cli.watch.time.sleep", side_effect=KeyboardInterrupt)
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report())
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report())
     def test_watch_ctrl_c_prints_summary(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -119,7 +137,7 @@ class TestWatchGracefulShutdown:
         assert result.exit_code == 0
         assert "Stopped" in result.output or "1 run" in result.output
 
-    @patch("context_cli.cli.watch.asyncio.run", side_effect=KeyboardInterrupt)
+    @patch("context_cli.cli.watch._run_async", side_effect=KeyboardInterrupt)
     def test_watch_ctrl_c_during_audit(self, mock_run: MagicMock) -> None:
         """Ctrl+C during audit itself still exits gracefully."""
         result = runner.invoke(app, ["watch", "https://example.com"])
@@ -129,7 +147,7 @@ class TestWatchGracefulShutdown:
 
 class TestWatchRunCounter:
     @patch("context_cli.cli.watch.time.sleep")
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report())
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report())
     def test_watch_displays_run_counter(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -153,7 +171,7 @@ class TestWatchRunCounter:
 
 class TestWatchBotsOption:
     @patch("context_cli.cli.watch.time.sleep", side_effect=KeyboardInterrupt)
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report())
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report())
     def test_watch_with_custom_bots(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -166,7 +184,7 @@ class TestWatchBotsOption:
 
 class TestWatchUrlNormalization:
     @patch("context_cli.cli.watch.time.sleep", side_effect=KeyboardInterrupt)
-    @patch("context_cli.cli.watch.asyncio.run", return_value=_make_report())
+    @patch("context_cli.cli.watch._run_async", return_value=_make_report())
     def test_watch_prepends_https(
         self, mock_run: MagicMock, mock_sleep: MagicMock,
     ) -> None:
@@ -263,9 +263,9 @@ def test_cli_webhook_flag_single():
 
     with (
         patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit),
-        patch("context_cli.core.webhook.send_webhook", side_effect=_fake_send) as mock_send,
+        patch("context_cli.cli._audit_helpers.send_webhook", side_effect=_fake_send) as mock_send,
         patch(
-            "context_cli.core.webhook.build_webhook_payload",
+            "context_cli.cli._audit_helpers.build_webhook_payload",
             return_value=WebhookPayload(
                 url="https://example.com",
                 overall_score=72.5,
@@ -298,9 +298,9 @@ def test_cli_webhook_flag_site():
 
     with (
         patch("context_cli.cli.audit.audit_site", side_effect=_fake_audit),
-        patch("context_cli.core.webhook.send_webhook", side_effect=_fake_send) as mock_send,
+        patch("context_cli.cli._audit_helpers.send_webhook", side_effect=_fake_send) as mock_send,
         patch(
-            "context_cli.core.webhook.build_webhook_payload",
+            "context_cli.cli._audit_helpers.build_webhook_payload",
             return_value=WebhookPayload(
                 url="https://example.com",
                 overall_score=68.0,
@@ -332,9 +332,9 @@ def test_cli_webhook_failure_does_not_crash():
 
     with (
         patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit),
-        patch("context_cli.core.webhook.send_webhook", side_effect=_fake_send),
+        patch("context_cli.cli._audit_helpers.send_webhook", side_effect=_fake_send),
         patch(
-            "context_cli.core.webhook.build_webhook_payload",
+            "context_cli.cli._audit_helpers.build_webhook_payload",
             return_value=WebhookPayload(
                 url="https://example.com",
                 overall_score=72.5,
@@ -364,7 +364,7 @@ def test_cli_webhook_exception_does_not_crash():
     with (
         patch("context_cli.cli.audit.audit_url", side_effect=_fake_audit),
         patch(
-            "context_cli.core.webhook.build_webhook_payload",
+            "context_cli.cli._audit_helpers.build_webhook_payload",
             side_effect=RuntimeError("unexpected error"),
         ),
     ):